@@ -0,0 +1,96 @@
+"""
+Statements of the materialized flight boards: table Board holds one row per flight shown by the Departure and Arrival
+views, already joined with Airline, Airport and State and keyed by (category, terminal, time, flight), so that reading
+a board is a range scan of its primary key. Triggers on Flight keep it current row by row, and table BoardVersion
+counts the changes of every (category, terminal) board, so that a screen can poll it cheaply. A flight is on one
+board only: unlike the views, which list a flight with both times on both, such a flight is a departure.
+
+Used by Database.install_boards() and the other board methods.
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "BOARD_TABLES", "BOARD_TRIGGERS", "BOARD_SELECT", "BOARD_COLUMNS", "CATEGORIES", "BoardPage"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+from typing import Iterator, NoReturn, Optional
+
+CATEGORIES: tuple[str, str] = "Departure", "Arrival"
+BOARD_COLUMNS: tuple[str] = "code", "airline", "airport", "time", "state", "check_in", "gate"
+
+_CATEGORY: str = "case when {0}.departure is not null then 'Departure' else 'Arrival' end"
+_TERMINAL: str = "coalesce({0}.gate_t, '')"
+_NOW: str = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+BOARD_TABLES: dict[str, str] = {
+    "Board": "create table if not exists Board (category text not null, terminal text not null, "
+             "time datetime not null, flight integer not null, code text, airline text, airport text, state text, "
+             "check_in integer, gate integer, primary key (category, terminal, time, flight)) without rowid",
+    "_board_flight": "create unique index if not exists _board_flight on Board (flight)",
+    "BoardVersion": "create table if not exists BoardVersion (category text not null, terminal text not null, "
+                    "version integer not null, modified datetime not null, primary key (category, terminal))"}
+
+BOARD_SELECT: str = (  # NOTE -------------------- same joins as the Departure and Arrival views, for both categories
+    f"select {_CATEGORY.format('Flight')}, {_TERMINAL.format('Flight')}, coalesce(Flight.departure, Flight.arrival), "
+    f"Flight.id, Flight.code, Airline.name, Airport.IATA, State.name, Flight.check_in, Flight.gate_n from Flight "
+    f"join Airport on Airport.id = case when Flight.departure is not null then Flight.to_airport "
+    f"else Flight.from_airport end join State on State.id = Flight.state "
+    f"join Airline on Airline.designator = substr(Flight.code, 1, 2) "
+    f"where coalesce(Flight.departure, Flight.arrival) is not null")
+
+
+def _bump(reference: str) -> str:
+    return (f"insert into BoardVersion values ({_CATEGORY.format(reference)}, {_TERMINAL.format(reference)}, 1, "
+            f"{_NOW}) on conflict (category, terminal) do update set version = version + 1, modified = {_NOW};")
+
+
+_BUMP_ALL: str = f"update BoardVersion set version = version + 1, modified = {_NOW};"
+_REBUILD: str = f"delete from Board; insert into Board {BOARD_SELECT};"
+
+BOARD_TRIGGERS: dict[str, str] = {
+    "_board_flight_insert": f"create trigger if not exists _board_flight_insert after insert on Flight begin "
+                            f"insert into Board {BOARD_SELECT} and Flight.id = new.id; {_bump('new')} end",
+    "_board_flight_delete": f"create trigger if not exists _board_flight_delete after delete on Flight begin "
+                            f"delete from Board where flight = old.id; {_bump('old')} end",
+    "_board_flight_update": f"create trigger if not exists _board_flight_update after update of code, from_airport, "
+                            f"to_airport, departure, arrival, state, check_in, gate_n, gate_t on Flight begin "
+                            f"delete from Board where flight = old.id; "
+                            f"insert into Board {BOARD_SELECT} and Flight.id = new.id; "
+                            f"{_bump('old')} {_bump('new')} end",
+    "_board_airline_update": f"create trigger if not exists _board_airline_update after update of name, designator "
+                             f"on Airline begin {_REBUILD} {_BUMP_ALL} end",  # NOTE --------- rare, so rebuilt whole
+    "_board_airport_update": f"create trigger if not exists _board_airport_update after update of IATA on Airport "
+                             f"begin {_REBUILD} {_BUMP_ALL} end",
+    "_board_state_update": f"create trigger if not exists _board_state_update after update of name on State "
+                           f"begin {_REBUILD} {_BUMP_ALL} end"}
+
+
+class BoardPage:
+
+    __slots__: tuple[str] = "rows", "flights", "next", "previous"
+
+    def __init__(self, rows: list[tuple], flights: Optional[list[int]] = None,
+                 next_cursor: Optional[tuple[str, int]] = None,
+                 previous_cursor: Optional[tuple[str, int]] = None) -> NoReturn:
+        """
+        One page of a board, returned by Database.departures() and arrivals(): rows of BOARD_COLUMNS, the flight
+        ids of the rows and the cursors of the next and previous pages, (time, flight id) keys to pass back as
+        ``after`` or ``before``, None when there is no such page.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.rows: list[tuple] = rows
+        self.flights: list[int] = flights or []
+        self.next: Optional[tuple[str, int]] = next_cursor
+        self.previous: Optional[tuple[str, int]] = previous_cursor
+        return
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self.rows)
+
+    def __str__(self) -> str:
+        return "\n".join(" ".join(str(_value) for _value in _row) for _row in self.rows)
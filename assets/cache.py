@@ -0,0 +1,122 @@
+"""
+Class IdentityMap keeps the objects Database has already built from rarely changing tables (Airport, Airline and
+dimension tables), so that a repeated lookup by id, IATA code or designator returns the same object without a query.
+Entries of a table are dropped whenever a statement writes to it.
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "IdentityMap", "written_table"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+from re import compile as _compile, IGNORECASE
+from threading import Lock
+from typing import Any, Callable, ClassVar, Hashable, NoReturn, Optional
+
+_WRITE = _compile(r"^\s*(?:insert|replace|update|delete)\s+(?:or\s+\w+\s+)?(?:into\s+|from\s+)?[\"\[`]?(\w+)",
+                  IGNORECASE)
+
+
+def written_table(sql: str) -> Optional[str]:
+    """
+    Returns the name of the table an insert, replace, update or delete statement writes to, None if it is unknown.
+    """
+    _match = _WRITE.match(sql)
+    return _match.group(1) if _match else None
+
+
+class IdentityMap:
+
+    _DEPENDENCIES: ClassVar[dict[str, tuple[str, ...]]] = {  # NOTE ----------------- triggers write to these tables
+        "airplane": ("airline",), "flight": ("schedule",), "airport": ("route",)}
+    _NEUTRAL: ClassVar[tuple[str, ...]] = "create", "pragma", "analyze", "vacuum", "explain"
+
+    __slots__: tuple[str] = "_entries", "_lock", "_statistics", "invalidations"
+
+    def __init__(self) -> NoReturn:
+        """
+        Entries are kept per table, under any number of (column, value) keys pointing to the same object.
+
+        *Created on 18 Oct 2026.*
+        """
+        self._entries: dict[str, dict[tuple[str, Hashable], Any]] = {}
+        self._lock: Lock = Lock()
+        self._statistics: dict[str, list[int]] = {}  # NOTE ----------------------------------- table: [hits, misses]
+        self.invalidations: int = 0
+        return
+
+    def __str__(self) -> str:
+        _out: list[str] = [f"IDENTITY MAP {self.hits} HITS, {self.misses} MISSES, {self.invalidations} INVALIDATIONS"]
+        for table, (hits, misses) in sorted(self._statistics.items()):
+            _out.append(" " * 4 + table + " " * (16 - len(table)) + f"{hits} HITS, {misses} MISSES")
+        return "\n".join(_out)
+
+    def __len__(self) -> int:
+        return sum(len(_table) for _table in self._entries.values())
+
+    @property
+    def hits(self) -> int:
+        return sum(_counts[0] for _counts in self._statistics.values())
+
+    @property
+    def misses(self) -> int:
+        return sum(_counts[1] for _counts in self._statistics.values())
+
+    @property
+    def ratio(self) -> float:
+        """
+        Returns the fraction of lookups answered from the map.
+        """
+        _total: int = self.hits + self.misses
+        return self.hits / _total if _total else 0.0
+
+    def get(self, table: str, column: str, value: Hashable, loader: Callable[[], Any],
+            keys: Optional[Callable[[Any], dict[str, Hashable]]] = None) -> Any:
+        """
+        Returns the object stored under (column, value) of table. On a miss, ``loader`` builds it and it is stored
+        under that key and the extra keys returned by ``keys``, so that a lookup by another column also hits.
+        None results are not stored.
+        """
+        table = table.lower()
+        with self._lock:
+            _counts: list[int] = self._statistics.setdefault(table, [0, 0])
+            _entries: dict = self._entries.setdefault(table, {})
+            if (column, value) in _entries:
+                _counts[0] += 1
+                return _entries[(column, value)]
+            _counts[1] += 1
+        _object = loader()  # NOTE ----------------------------------------------- queries run outside of the lock
+        if _object is None:
+            return None
+        with self._lock:
+            _entries = self._entries.setdefault(table, {})
+            _entries[(column, value)] = _object
+            for _column, _value in (keys(_object) if keys is not None else {}).items():
+                _entries[(_column, _value)] = _object
+        return _object
+
+    def invalidate(self, table: Optional[str] = None) -> NoReturn:
+        """
+        Drops the entries of a table and of the tables its triggers write to, or all entries if table is None.
+        """
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+            else:
+                for _table in (table.lower(), *self._DEPENDENCIES.get(table.lower(), ())):
+                    self._entries.pop(_table, None)
+            self.invalidations += 1
+        return
+
+    def written(self, sql: str) -> NoReturn:
+        """
+        Invalidates the table written by a statement, everything if the table cannot be told from the statement.
+        Statements that do not change rows (create, pragma etc.) are ignored.
+        """
+        _table: Optional[str] = written_table(sql)
+        if _table is not None:
+            self.invalidate(_table)
+        elif sql.split(None, 1)[0].lower() not in self._NEUTRAL:
+            self.invalidate()
+        return
@@ -1,6 +1,8 @@
 __all__: tuple[str] = ("PROJECT", "DATABASE", "CRUISE_SPEED", "LAND_SPEED",
                        "EARTH_EQUATORIAL_RADIUS", "EARTH_MEAN_RADIUS", "EARTH_POLAR_RADIUS",
-                       "MAX_DEGREE_LAT", "MAX_DEGREE_LONG", "MAX_MINUTE")
+                       "MAX_DEGREE_LAT", "MAX_DEGREE_LONG", "MAX_MINUTE",
+                       "MINIMUM_CONNECTING_TIME", "MAXIMUM_CONNECTING_TIME", "SCHENGEN",
+                       "GATE_BEFORE_DEPARTURE", "GATE_AFTER_ARRIVAL", "TURNAROUND_BUFFER")
 
 from os.path import dirname, abspath
 from typing import Final
@@ -18,3 +20,15 @@ EARTH_POLAR_RADIUS: Final[float] = 6356.8
 MAX_DEGREE_LAT: Final[int] = 90
 MAX_DEGREE_LONG: Final[int] = 180
 MAX_MINUTE: Final[int] = 60
+
+MINIMUM_CONNECTING_TIME: Final[int] = 45  # NOTE ------------------------------------------------------------- minutes
+MAXIMUM_CONNECTING_TIME: Final[int] = 360
+
+SCHENGEN: Final[frozenset[str]] = frozenset((  # NOTE ------------------------------ as Airport.country names them
+    "AUSTRIA", "BELGIUM", "BULGARIA", "CROATIA", "CZECHIA", "DENMARK", "ESTONIA", "FINLAND", "FRANCE", "GERMANY",
+    "GREECE", "HUNGARY", "ICELAND", "ITALY", "LATVIA", "LIECHTENSTEIN", "LITHUANIA", "LUXEMBOURG", "MALTA",
+    "NETHERLANDS", "NORWAY", "POLAND", "PORTUGAL", "ROMANIA", "SLOVAKIA", "SLOVENIA", "SPAIN", "SWEDEN", "SWITZERLAND"))
+
+GATE_BEFORE_DEPARTURE: Final[int] = 45  # NOTE ------------------------------------ minutes a gate is held by a flight
+GATE_AFTER_ARRIVAL: Final[int] = 30
+TURNAROUND_BUFFER: Final[int] = 15  # NOTE --------------------------------- minutes between two flights at one gate
@@ -1,25 +1,48 @@
 """
 Class Database establishes connection to SQLite database and executes queries to it.
 
+The ``database`` singleton is created on first access, importing this module opens no connection.
+
 *Created on Nov 2023.*
 """
 
-__all__: tuple[str] = "database"
+__all__: tuple[str] = "Database", "database", "AsyncDatabase"
 __author__ = "A. Tsakiridis"
 __version__ = "1.0"
 
+from atexit import register as _at_exit
+from collections.abc import Iterable, Sequence
+from contextlib import contextmanager, nullcontext
 from datetime import datetime as _dt, date as _date, timedelta as _timed
+from itertools import chain, islice
 import sqlite3 as _sql
 from random import choice as _ch, randint as _rand, shuffle as _shuf
+from threading import get_ident, local, Lock, RLock
+from time import monotonic, perf_counter
 from types import GeneratorType
-from typing import ClassVar, Callable, Protocol, NoReturn, Self, Union, Optional, Any
+from weakref import ref
+from typing import (ClassVar, Callable, Protocol, NoReturn, Self, Union, Optional, Any, Iterator, AsyncIterator,
+                    TYPE_CHECKING, cast)
 from sys import version_info
 
 if not version_info >= (3, 11):
     print(f"INCOMPATIBLE VERSION {version_info}, PLEASE USE PYTHON 3.11 OR HIGHER.")
 
-from assets.constants import DATABASE
+from assets.constants import DATABASE, LAND_SPEED, SCHENGEN
 from assets import models
+from assets.pool import ConnectionPool, PoolMetrics
+from assets.cache import IdentityMap
+
+if TYPE_CHECKING:  # NOTE ----------------------- opt-in features are imported by the methods that use them, when called
+    from assets.boards import BoardPage
+    from assets.distances import DistanceMatrix
+    from assets.feed import ChangeFeed
+    from assets.gates import GateAllocator
+    from assets.hydration import Hydrator
+    from assets.indexes import IndexAdvisor
+    from assets.instrumentation import Instrumentation
+    from assets.network import Network
+    from assets.spatial import SpatialIndex
 
 
 class _Parameters(Protocol):  # cloned SupportsLenAndGetItem proto from sqlite3
@@ -30,9 +53,57 @@ class _Parameters(Protocol):  # cloned SupportsLenAndGetItem proto from sqlite3
         ...
 
 
+_Row = Union[models._DatabaseRecord, Sequence]  # NOTE --------------------- accepted by executemany() and insert_many()
+
+
+class GenerationReport:
+
+    __slots__: tuple[str] = "schedules", "flights", "skipped", "seconds", "removed"
+
+    def __init__(self, schedules: int = 0, flights: int = 0, skipped: int = 0, seconds: float = 0.0,
+                 removed: int = 0) -> NoReturn:
+        """
+        Returned by Database.generate_flights() and advance_horizon(): schedules expanded, flights created, flights
+        skipped because they already existed, elapsed seconds and future flights removed from modified schedules.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.schedules: int = schedules
+        self.flights: int = flights
+        self.skipped: int = skipped
+        self.seconds: float = seconds
+        self.removed: int = removed
+        return
+
+    def __str__(self) -> str:
+        _out: str = f"{self.flights} FLIGHTS CREATED FOR {self.schedules} SCHEDULES IN {self.seconds:.3f} s "
+        _out += f"({self.rate:.0f} FLIGHTS/S), {self.skipped} ALREADY EXISTED"
+        return _out + (f", {self.removed} REMOVED FROM MODIFIED SCHEDULES" if self.removed else str())
+
+    @property
+    def rate(self) -> float:
+        """
+        Returns throughput in flights per second.
+        """
+        return self.flights / self.seconds if self.seconds else 0.0
+
+
+class _LazyTables:
+    """
+    Protected descriptor standing for Database.Tables until first access, then builds the enumeration of table names
+    from sqlite_master and replaces itself with it.
+    """
+
+    def __get__(self, instance: Optional["Database"], owner: type) -> models.CycleEnum:
+        _database: Database = instance if instance is not None else _required()
+        _tables = models.CycleEnum("Tables", [(_tbl.upper(), _tbl) for _tbl in _database.tables])
+        setattr(owner, "Tables", _tables)  # NOTE ------------ cannot use Tables.__setattr__ because Enum's immutability
+        return _tables
+
+
 class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseError]]):
 
-    Tables: models.CycleEnum = None  # -- filled in __init__, cannot use Tables.__setattr__ because Enum's immutability
+    Tables: models.CycleEnum = _LazyTables()  # NOTE ----------------------------------- built on first use, DEPRECATED
 
     _MONTH: ClassVar[tuple[int, int]] = 2024, 2
     _READ_ONLY: ClassVar[bool] = False
@@ -40,15 +111,25 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
     _PRINT_QUERIES: ClassVar[bool] = False
     _EXISTS: ClassVar[bool] = False
     _QUERY_COUNTER: ClassVar[int] = 0
+    _BATCH_ROWS: ClassVar[int] = 0  # NOTE ------------------------------- group commit defaults, zero disables batching
+    _BATCH_SECONDS: ClassVar[float] = 0.0
+    _AGGREGATES: ClassVar[dict[str, tuple[str, str, str, str]]] = {  # NOTE ---- counter: table, key, source, source key
+        "occurrences": ("Schedule", "code", "Flight", "code"),
+        "airplanes": ("Airline", "id", "Airplane", "airline")}
     _SCHEDULE_START: ClassVar[_date] = _date(*_MONTH, 1)
     _SCHEDULE_END: ClassVar[_date] = _date(_MONTH[0], _MONTH[1] + 2, 30)
+    _HORIZON_DAYS: ClassVar[int] = 60  # NOTE ------------------------------------ rolling window of advance_horizon()
+    _FLIGHT_COLUMNS: ClassVar[tuple[str]] = ("code", "from_airport", "to_airport", "departure", "arrival",
+                                             "state", "check_in", "gate_n", "gate_t", "airplane")
 
-    __slots__: tuple[str] = "_name", "_connection", "_cursor"
+    __slots__: tuple[str] = ("_name", "_path", "_connection", "_cursor", "_pool", "_lock",
+                             "_depth", "_owner", "_pending", "_last_commit", "_batch", "_cache",
+                             "_instrumentation", "__weakref__")
 
     @property
     def athens(self) -> models.Airport:
         """Returns Athens airport object."""
-        return models.Airport.db(self("select * from Airport where IATA = 'ATH'").fetchone())
+        return self.airport("ATH")
 
     def __new__(cls, *args, **kwargs) -> Optional["Database"]:  # ------------------ cannot use 'Self' in static method
         if cls._EXISTS:  # NOTE ------------------------------- prevents the creation of more than one Database objects
@@ -57,37 +138,68 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
         return super().__new__(cls)
 
     def __init__(self, path: str, name: str = "AIRPORT", readonly: bool = False,
-                 debug: bool = False, print_queries: bool = False) -> NoReturn:
+                 debug: bool = False, print_queries: bool = False, pool_size: int = 0) -> NoReturn:
         """
         Pass readonly=True to disable writing on database. NOTE: IT IS EXPERIMENTAL. Use with caution!
         Pass debug=True to have debugging information displayed.
         Pass print_queries=True to have queries printed.
+        Pass pool_size > 0 to enable the connection pool, see enable_pool().
         """
         self._name: str = name
         Database._READ_ONLY = readonly
         if Database._READ_ONLY:
             path = "file:" + path + "?mode=ro"
-        self._connection: _sql.Connection = _sql.connect(path, check_same_thread=False)  # NOTE --- changed for Flutter
+        self._path: str = path
+        self._connection: _sql.Connection = _sql.connect(path, check_same_thread=False,  # NOTE --- changed for Flutter
+                                                         uri=path.startswith("file:"))
         self._cursor: _sql.Cursor = self._connection.cursor()
-        Database.Tables = models.CycleEnum("Tables", [(_tbl.upper(), _tbl) for _tbl in self.tables])  # ---- DEPRECATED
-        # self._connection.row_factory = _sql.Row
+        self._pool: Optional[ConnectionPool] = None
+        self._lock: RLock = RLock()  # NOTE --------------- held by transactions and statements on the shared connection
+        self._depth: int = 0  # NOTE ---------------------------------------------- savepoint nesting of transaction()
+        self._owner: Optional[int] = None
+        self._pending: int = 0
+        self._last_commit: float = monotonic()
+        self._batch: tuple[int, float] = self._BATCH_ROWS, self._BATCH_SECONDS
+        self._cache: IdentityMap = IdentityMap()
+        self._instrumentation: Optional[Instrumentation] = None
+        # NOTE -------------------------------------- no connection row factory, hydrator() installs one per query
+        self._math_functions()
         Database._DEBUG, Database._PRINT_QUERIES = debug, print_queries
         if self._DEBUG:
             print(f"{self._name} DATABASE CONNECTED, THREAD SAFETY LEVEL: {_sql.threadsafety}")
+        if pool_size:
+            self.enable_pool(pool_size)
+        _at_exit(_close_at_exit, ref(self))  # NOTE ---- __del__ of a module global may never run at interpreter exit
         return
 
     def __str__(self) -> str:
         return self._name + " database"
 
     def __enter__(self) -> Self:
-        raise NotImplementedError  # TODO
+        """
+        ``with database:`` is the same as ``with database.transaction():``.
+        """
+        self._begin()
+        return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        raise NotImplementedError  # TODO
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self._end(exc_type is None)
+        return False
 
     def __del__(self) -> NoReturn:
+        if getattr(self, "_connection", None) is None:  # NOTE ------------- never opened, or closed at interpreter exit
+            return
+        if self._instrumentation is not None:
+            self._instrumentation.settle()  # NOTE --------------------------- queries whose rows were not all fetched
+            if self._instrumentation.report_on_close:
+                print(self._instrumentation.report())
+        if self._pool is not None:
+            if self._DEBUG:
+                print(self._pool.metrics)
+            self._pool.close()
         self._connection.commit()
         if self._DEBUG:
+            print(self._cache)
             match self.__class__._QUERY_COUNTER:
                 case 0:
                     print("NO QUERIES EXECUTED", end="")
@@ -97,6 +209,7 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
                     print(f"{self.__class__._QUERY_COUNTER} QUERIES EXECUTED", end="")
             print("\t\tCHANGES_COMMITTED\t\tDATABASE_CLOSED")
         self._connection.close()
+        self._connection = None
 
     def __call__(self, __sql: str, __parameters: _Parameters = ()) -> Union[_sql.Cursor, _sql.DatabaseError]:
         """
@@ -108,26 +221,316 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
         """
         if "drop" in __sql:
             raise AttributeError("Table deletion is not permitted")
+        _read: bool = ConnectionPool.is_read(__sql)
         try:
-            self._cursor.execute(__sql, __parameters)
+            if self._pool is None:
+                with self._lock:  # NOTE ---------------------------- waits for transactions of other threads to end
+                    self._cursor.execute(__sql, __parameters)
+                    _cursor: _sql.Cursor = self._cursor
+                    if not _read:
+                        self._written(__sql)
+            elif _read and not self._in_transaction:
+                _cursor: _sql.Cursor = self._pool.reader()
+                _cursor.execute(__sql, __parameters)
+            else:  # NOTE ------------------------------------- writes, and reads that must see the open transaction
+                with self._pool.writer() as _cursor:
+                    _cursor.execute(__sql, __parameters)
+                    if not _read:
+                        self._written(__sql)
             if self._PRINT_QUERIES:
                 print("QUERY EXECUTED", __sql, "WITH PARAMETERS", __parameters)
             self.__class__._QUERY_COUNTER += 1
-            return self._cursor  # NOTE --------------------------------------- enables chained call of fetchall() etc.
+            return _cursor  # NOTE -------------------------------------------- enables chained call of fetchall() etc.
         except _sql.DatabaseError as error:
             print("Failed to execute query. SQLite said:", error)
+            if self._in_transaction:  # NOTE ---------------------------------- lets transaction() roll the block back
+                raise
             return error
 
+    @property
+    def _in_transaction(self) -> bool:
+        return self._depth > 0 and self._owner == get_ident()
+
+    def _begin(self) -> NoReturn:
+        self._lock.acquire()  # NOTE -------------------------------- other threads' statements wait for the transaction
+        try:
+            self._connection.execute(f"savepoint _transaction_{self._depth + 1}")
+        except _sql.DatabaseError:
+            self._lock.release()
+            raise
+        self._depth += 1
+        self._owner = get_ident()
+        return
+
+    def _end(self, success: bool) -> NoReturn:
+        _savepoint: str = f"_transaction_{self._depth}"
+        try:
+            if not success:
+                self._connection.execute(f"rollback to {_savepoint}")
+                self._cache.invalidate()  # NOTE ------------------------- objects loaded in the block may be undone
+            self._connection.execute(f"release {_savepoint}")
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self._owner = None
+                self._connection.commit()
+                self._pending, self._last_commit = 0, monotonic()
+            self._lock.release()
+        return
+
+    @contextmanager
+    def transaction(self) -> Iterator[Self]:
+        """
+        Context manager that runs its block as one transaction, committed on exit or rolled back if the block raises.
+        Nested blocks become savepoints, so an inner failure only undoes the inner block. Inside a transaction,
+        failed queries raise sqlite3.DatabaseError instead of returning it.
+
+        ``with database.transaction(): database("insert into ...")``
+
+        *Created on 18 Oct 2026.*
+        """
+        self._begin()
+        try:
+            yield self
+        except BaseException:
+            self._end(False)
+            raise
+        self._end(True)
+        return
+
+    def _written(self, __sql: str) -> NoReturn:
+        """
+        Protected method called after each write, drops cached objects of the written table and commits when
+        the batch is full, its time window has passed or when pooled readers need to see the change.
+        Writes inside a transaction are left to transaction().
+        """
+        self._cache.written(__sql)
+        if self._depth:
+            return
+        self._pending += 1
+        _rows, _seconds = self._batch
+        if _rows or _seconds:
+            if (_rows and self._pending >= _rows) or (_seconds and monotonic() - self._last_commit >= _seconds):
+                self.flush()
+        elif self._pool is not None:
+            self.flush()
+        return
+
+    def flush(self) -> int:
+        """
+        Commits writes still pending from batched() or plain calls, unless a transaction is open.
+        :return: int, the number of writes committed
+
+        *Created on 18 Oct 2026.*
+        """
+        with self._lock:
+            if self._depth:
+                return 0
+            self._connection.commit()
+            _committed, self._pending, self._last_commit = self._pending, 0, monotonic()
+        return _committed
+
+    @contextmanager
+    def batched(self, rows: int = 500, seconds: float = 1.0) -> Iterator[Self]:
+        """
+        Context manager for group commit: plain writes in its block are committed together, every ``rows`` writes
+        or at the first write after ``seconds`` since the last commit, and once more on exit. Pass zero to disable
+        either limit. Used by bulk jobs with many small writes to amortize commit and fsync cost.
+
+        *Created on 18 Oct 2026.*
+        """
+        _previous, self._batch = self._batch, (rows, seconds)
+        try:
+            yield self
+        finally:
+            self._batch = _previous
+            self.flush()
+        return
+
+    # =================================================================================================================
+
+    def executemany(self, __sql: str, rows: Iterable[_Row], chunk: int = 1000) -> int:
+        """
+        Executes one prepared statement for every row, streaming the rows into ``sqlite3.Cursor.executemany()`` in
+        chunks of ``chunk`` rows, all inside one transaction. Rows can be tuples or database records, whose
+        ``tuple`` property is used.
+        :return: int, the number of rows inserted, updated or deleted
+        :raises sqlite3.DatabaseError:
+
+        *Created on 18 Oct 2026.*
+        """
+        if "drop" in __sql:
+            raise AttributeError("Table deletion is not permitted")
+        if chunk < 1:
+            raise AttributeError(f"Chunk size must be a positive number, {chunk} is not valid.")
+        _rows = (row.tuple if isinstance(row, models._DatabaseRecord) else row for row in rows)
+        _total: int = 0
+        with self.transaction():  # NOTE -------------------------------- holds the connection lock until the last chunk
+            _cursor: _sql.Cursor = self._connection.cursor(self._cursor_factory)
+            self._cache.written(__sql)
+            while _chunk := list(islice(_rows, chunk)):
+                _cursor.executemany(__sql, _chunk)
+                _total += _cursor.rowcount
+                self.__class__._QUERY_COUNTER += 1
+                if self._PRINT_QUERIES:
+                    print("QUERY EXECUTED", __sql, "WITH", len(_chunk), "ROWS")
+        return _total
+
+    def _insert_statement(self, table_name: str, columns: Optional[Sequence[str]], width: int) -> str:
+        """
+        Protected method that validates table and column names and returns an insert statement with placeholders.
+        Without columns, the first ``width`` columns of the table are used, at the order they are declared.
+        """
+        _declared: list[str] = [column[1] for column in self.table_info(table_name)]
+        if columns is None:
+            columns = _declared[:width]
+        for column in columns:
+            if column not in _declared:
+                raise AttributeError(f"Table {table_name} has no column named {column}, check your spelling.")
+        if len(columns) != width:
+            raise AttributeError(f"{len(columns)} columns were given for rows of {width} values.")
+        return f"insert into {table_name} ({', '.join(columns)}) values ({', '.join('?' * width)})"
+
+    def insert_many(self, table_name: str, records: Iterable[_Row],
+                    columns: Optional[Sequence[str]] = None, chunk: int = 1000) -> int:
+        """
+        Inserts many records or tuples into a table with one prepared statement per chunk, see executemany().
+        If columns are not given, values are matched to the leading table columns, as ``tuple`` of records does.
+
+        ``database.insert_many("Airplane", [("A320", 2), ("A321", 2)], columns=("type", "airline"))``
+        :return: int, the number of rows inserted
+        :raises AttributeError: for invalid table or column names
+
+        *Created on 18 Oct 2026.*
+        """
+        _records = iter(records)
+        _first = next(_records, None)
+        if _first is None:
+            return 0
+        _width: int = len(_first.tuple if isinstance(_first, models._DatabaseRecord) else _first)
+        with self._lock:  # NOTE -------------------------------- table checked and written with no transaction between
+            _statement: str = self._insert_statement(table_name, columns, _width)
+            return self.executemany(_statement, chain((_first,), _records), chunk)
+
+    def upsert_many(self, table_name: str, records: Iterable[_Row], conflict: Sequence[str],
+                    columns: Optional[Sequence[str]] = None, update: Optional[Sequence[str]] = None,
+                    chunk: int = 1000) -> int:
+        """
+        Like insert_many(), but rows that collide with an existing row on the ``conflict`` columns, which must be
+        the primary key or a unique index, update that row instead: ``update`` columns are set to the new values,
+        all the other columns when it is None, nothing is changed when it is empty (``on conflict do nothing``).
+        :return: int, the number of rows inserted or updated
+        :raises AttributeError: for invalid table or column names
+
+        *Created on 18 Oct 2026.*
+        """
+        _records = iter(records)
+        _first = next(_records, None)
+        if _first is None:
+            return 0
+        _width: int = len(_first.tuple if isinstance(_first, models._DatabaseRecord) else _first)
+        with self._lock:
+            _statement: str = self._insert_statement(table_name, columns, _width)
+            _columns: list[str] = _statement[_statement.index("(") + 1: _statement.index(")")].split(", ")
+            for column in conflict:
+                if column not in _columns:
+                    raise AttributeError(f"Conflict column {column} must be one of the inserted columns.")
+            if update is None:
+                update = [column for column in _columns if column not in conflict]
+            _action: str = "nothing" if not update else \
+                "update set " + ", ".join(f"{_c} = excluded.{_c}" for _c in update)
+            _statement += f" on conflict ({', '.join(conflict)}) do {_action}"
+            return self.executemany(_statement, chain((_first,), _records), chunk)
+
     def commit_close(self) -> NoReturn:
         """
         By calling ``Connection commit()`` and ``close()``, commits any pending transaction to the database and closes
         the connection. THis is automatically done by database.__del__ method at the end of each script execution.
         :return: None
         """
-        self._connection.commit()
-        self._connection.close()
+        if self._pool is not None:
+            self._pool.close()
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
+            self._connection = None
         return None
 
+    def enable_pool(self, size: int = 4, timeout: float = 30.0, wal: bool = True) -> ConnectionPool:
+        """
+        Switches to pooled mode: every thread reads through its own connection and cursor, leased from a pool of
+        at most ``size`` read-only connections, while writes are serialized on this object's connection and
+        committed immediately, so that readers can see them. A thread keeps its connection until it exits or
+        calls release(), threads beyond ``size`` wait up to ``timeout`` seconds for one.
+        The database file is switched to write-ahead logging, so that reads never block a write commit.
+        Pass wal=False to keep the rollback journal: then a query whose rows are not all read holds a shared lock
+        until its thread runs its next read, and writes of other threads fail with "database is locked" meanwhile.
+        NOTE: journal mode is stored in the database file, it persists after the connection is closed.
+        :return: ConnectionPool
+
+        *Created on 18 Oct 2026.*
+        """
+        if self._pool is not None:
+            raise AttributeError("Connection pool is already enabled.")
+        self._connection.commit()
+        if wal and not self._READ_ONLY:
+            self._connection.execute("pragma journal_mode = wal")
+        self._pool = ConnectionPool(self._path, self._connection, size, timeout, self._lock)
+        self._pool.cursor_factory = self._cursor_factory
+        if self._DEBUG:
+            print(f"{self._name} DATABASE POOLED, {size} READ CONNECTIONS")
+        return self._pool
+
+    @property
+    def _cursor_factory(self) -> Callable[[_sql.Connection], _sql.Cursor]:
+        return self._instrumentation.cursor if self._instrumentation is not None else _sql.Cursor
+
+    def instrument(self, slow_seconds: float = 0.1, log_path: Optional[str] = None,
+                   report_on_close: bool = True) -> "Instrumentation":
+        """
+        Starts recording wall time, rows and SQL fingerprint of every statement, keeping latency histograms per
+        fingerprint and logging statements slower than ``slow_seconds``, also to the file at ``log_path`` if given.
+        The report is printed when the database is closed, unless report_on_close=False. Calling it again returns
+        the same Instrumentation object. Pooled threads that already read keep their cursors uninstrumented.
+
+        ``database.instrument().add_hook(lambda event: print(event))``
+        :return: Instrumentation
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.instrumentation import Instrumentation
+        if self._instrumentation is None:
+            self._instrumentation = Instrumentation(slow_seconds, log_path, report_on_close)
+            self._cursor = self._connection.cursor(self._instrumentation.cursor)
+            if self._pool is not None:
+                self._pool.cursor_factory = self._instrumentation.cursor
+        return self._instrumentation
+
+    @property
+    def instrumentation(self) -> Optional["Instrumentation"]:
+        """
+        Returns the statement statistics started by instrument(), None if instrumentation is not enabled.
+        :return: Instrumentation
+        """
+        return self._instrumentation
+
+    def release(self) -> NoReturn:
+        """
+        Gives the read connection of the calling thread back to the pool, does nothing if pool is not enabled.
+        :return: None
+        """
+        if self._pool is not None:
+            self._pool.release()
+        return
+
+    @property
+    def pool_metrics(self) -> Optional[PoolMetrics]:
+        """
+        Returns the pool counters for size, waits and checkout latency, None if pool is not enabled.
+        :return: PoolMetrics
+        """
+        return self._pool.metrics if self._pool is not None else None
+
     @property
     def description(self) -> tuple[tuple]:
         """
@@ -135,6 +538,8 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
         it returns a 7-tuple for each column where the last six items of each tuple are None.
         :return: tuple
         """
+        if self._pool is not None and self._pool.last_cursor is not None:
+            return self._pool.last_cursor.description
         return self._cursor.description
 
     @property
@@ -176,7 +581,7 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
         """
         if table_name not in self.tables:
             raise AttributeError(f"No table named {table_name} exists, check your spelling.")
-        return self("pragma table_info(?)", (table_name,)).fetchall()
+        return self("select * from pragma_table_info(?)", (table_name,)).fetchall()  # NOTE -- pragma cannot bind ?
 
     def terminals(self) -> list[str]:
         """
@@ -185,19 +590,27 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
         """
         return [element[0] for element in self("select gate_t as terminal from Flight group by gate_t").fetchall()]
 
+    @property
+    def cache(self) -> IdentityMap:
+        """
+        Returns the identity map of objects loaded by airport(), airline() and the dimension lookups,
+        with its hit and miss statistics.
+        :return: IdentityMap
+        """
+        return self._cache
+
     def random_department(self) -> int:
-        return _ch(self("select id from Department").fetchall())[0]
+        return _ch(self._cache.get("Department", "id", None, lambda: self("select id from Department").fetchall()))[0]
 
     def random_sex(self) -> int:
-        return _ch(self("select id from Sex").fetchall())[0]
+        return _ch(self._cache.get("Sex", "id", None, lambda: self("select id from Sex").fetchall()))[0]
 
     def random_employee(self) -> Optional[tuple]:
         """*Created on 9 Nov 2023.*"""
         models.Employee.load_files()
-        ssn_list: list[int] = [element[0] for element in database("select SSN from Employee").fetchall()]
         ssn = models.Employee.random_ssn()
-        if ssn in ssn_list:
-            return self.random_employee()
+        while self.exists("select 1 from Employee where SSN = ?", (ssn,)):  # NOTE ------ one indexed probe per try
+            ssn = models.Employee.random_ssn()
         _data = [ssn, _ch(models.Employee.FIRST_NAMES),
                  _ch(models.Employee.FIRST_NAMES), _ch(models.Employee.LAST_NAMES)]
         _telephone: str = "+30 694 " + str().join([str(_rand(0, 9)) for _ in range(3)]) + " "
@@ -272,7 +685,9 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
         """
         if len(designator) != 2:
             raise AttributeError(f"Airline designators have exactly two characters, {designator} is not valid.")
-        return models.Airline.db(self(f"select * from Airline where designator = ?", (designator,)).fetchone())
+        return self._cache.get("Airline", "designator", designator, lambda: self._record(
+            models.Airline, "select * from Airline where designator = ?", (designator,)),
+                               lambda airline: {"id": airline.id})
 
     def airport(self, iata: str) -> Optional[models.Airport]:
         """
@@ -283,107 +698,997 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
         """
         if len(iata) != 3:
             raise AttributeError(f"IATA codes have exactly three characters, {iata} is not valid.")
-        return models.Airport.db(self(f"select * from Airport where IATA = ?", (iata,)).fetchone())
+        return self._cache.get("Airport", "iata", iata, lambda: self._record(
+            models.Airport, "select * from Airport where IATA = ?", (iata,)), lambda airport: {"id": airport.id})
+
+    def airport_by_id(self, airport_id: int) -> Optional[models.Airport]:
+        """
+        Searches for an Airport record with the passed id and returns an Airport object with its data.
+        :return: models.Airport
+
+        *Created on 18 Oct 2026.*
+        """
+        return self._cache.get("Airport", "id", airport_id, lambda: self._record(
+            models.Airport, "select * from Airport where id = ?", (airport_id,)),
+                               lambda airport: {"iata": airport.iata} if airport.iata is not None else {})
+
+    def airport_locations(self) -> models.CoordinateArray:
+        """
+        Returns the locations of all airports as one CoordinateArray labeled with IATA codes, ordered by id,
+        loaded with one streamed query and kept until table Airport is written.
+        :return: models.CoordinateArray
+
+        *Created on 18 Oct 2026.*
+        """
+        return self._cache.get("Airport", "locations", None, lambda: models.CoordinateArray.from_rows(
+            self.stream("select lat, long, IATA from Airport order by id")))
+
+    def _airport_ids(self) -> list[int]:
+        """
+        Protected method that returns the ids of all airports in the order of airport_locations(), so that positions
+        of its points are airport ids without a lookup by IATA code, which can be null. Kept as the locations are.
+        """
+        return self._cache.get("Airport", "ids", None, lambda: [_row[0] for _row in self.stream(
+            "select id from Airport order by id")])
+
+    def distances(self, rows: int = 256) -> "DistanceMatrix":
+        """
+        Returns arcs, kilometers and flight minutes between all airports, as N×N NumPy matrices computed in blocks
+        of ``rows`` airports, see assets.distances. Requires NumPy, which is imported on first call.
+
+        ``database.distances().measurements("ATH", "SKG")``
+        :return: assets.distances.DistanceMatrix
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.distances import DistanceMatrix
+        return DistanceMatrix(self.airport_locations(), rows)
+
+    def spatial_index(self) -> "SpatialIndex":
+        """
+        Returns the spatial index of airport_locations(), for nearest airport and Rectangle queries without a scan
+        of every airport, see assets.spatial. Built once and kept until table Airport is written.
+        :return: assets.spatial.SpatialIndex
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.spatial import SpatialIndex
+        return self._cache.get("Airport", "spatial", None, lambda: SpatialIndex(self.airport_locations()))
+
+    def nearest_airports(self, point: models.Coordinates, k: int = 1) -> list[tuple[models.Airport, float]]:
+        """
+        Returns the ``k`` airports nearest to a point and their haversine arcs in degrees, nearest first.
+        :return: list
+        :raises AttributeError: for invalid k
+
+        *Created on 18 Oct 2026.*
+        """
+        _index, _ids = self.spatial_index(), self._airport_ids()
+        return [(self.airport_by_id(_ids[_position]), _arc) for _position, _arc in _index.nearest(point, k)]
+
+    def airports_within(self, rectangle: models.Rectangle) -> list[models.Airport]:
+        """
+        Returns the airports inside a Rectangle, borders included, ordered by latitude.
+        :return: list
+
+        *Created on 18 Oct 2026.*
+        """
+        _index, _ids = self.spatial_index(), self._airport_ids()
+        return [self.airport_by_id(_ids[_position]) for _position in _index.within(rectangle)]
+
+    def network(self) -> "Network":
+        """
+        Returns the route network of all flights, for earliest arrival and connection queries, see assets.network.
+        The time a flight does not store is derived from the nominal flight minutes of its route, see route().
+        Built with one streamed query and kept until table Flight is written, with the hub tables built on it.
+
+        ``print(database.network().fastest("SKG", "HER", "2024-02-01", "2024-02-08", via="ATH"))``
+        :return: assets.network.Network
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.network import Network
+        return self._cache.get("Flight", "network", None, lambda: Network.from_flights(
+            self.stream("select id, code, from_airport, to_airport, departure, arrival from Flight", chunk=2000),
+            self._flight_minutes, dict(self("select id, IATA from Airport").fetchall())))
+
+    def _flight_minutes(self, origin: int, destination: int) -> int:
+        """
+        Protected method that returns the nominal flight minutes between two airports, as Coordinates.duration()
+        counts them.
+        """
+        _route: Optional[tuple[float, float, int]] = self.route(origin, destination)
+        if _route is not None:
+            return _route[2]
+        _origin, _destination = self.airport_by_id(origin), self.airport_by_id(destination)
+        return int(_origin.distance_degrees(_destination) * 3600 / LAND_SPEED)
+
+    def route(self, origin: int, destination: int) -> Optional[tuple[float, float, int]]:
+        """
+        Returns arc in degrees, kilometers and flight minutes from table Route between two airport ids, None when
+        routes are not installed or the pair is missing. The whole table is loaded once and kept until table Airport
+        or Route is written, see install_routes() and measurements().
+        :return: tuple
+
+        *Created on 18 Oct 2026.*
+        """
+        return self._cache.get("Route", "pairs", None, self._load_routes).get((origin, destination))
+
+    def measurements(self, origin: models.Airport, destination: models.Airport) -> str:
+        """
+        Returns the same text as Airport.measurements(), with arc and kilometers read from table Route of this
+        database when routes are installed, computed by the Airport objects otherwise.
+
+        ``database.measurements(database.athens, database.airport("SKG"))``
+        :return: str
+
+        *Created on 18 Oct 2026.*
+        """
+        _route: Optional[tuple[float, float, int]] = self.route(origin.id, destination.id)
+        if _route is None:
+            return origin.measurements(destination)
+        _out: str = " " * 8 + f"{round(_route[0], 6)}"
+        _out += " " * (24 - len(_out)) + f"{round(_route[1], 4)}"
+        return _out + " " * (40 - len(_out)) + f"{models.Coordinates.duration(_route[0])}"
+
+    def _load_routes(self) -> dict[tuple[int, int], tuple[float, float, int]]:
+        if "Route" not in self.tables:
+            return {}
+        return {(_row[0], _row[1]): _row[2:] for _row in self.stream("select * from Route", chunk=2000)}
+
+    def _math_functions(self) -> NoReturn:
+        """
+        Protected method that registers the math functions used by the route statements on the connection, when
+        SQLite is built without them (before 3.35 or without SQLITE_ENABLE_MATH_FUNCTIONS).
+        """
+        try:
+            self._connection.execute("select sin(0), power(2, 2)")
+        except _sql.OperationalError:
+            from assets.routes import MATH_FUNCTIONS
+            for _name, (_arguments, _function) in MATH_FUNCTIONS.items():
+                self._connection.create_function(_name, _arguments, _function, deterministic=True)
+        return
+
+    def _record(self, model: type, __sql: str, __parameters: _Parameters = ()) -> Optional[models._DatabaseRecord]:
+        """
+        Protected method that builds a record object from the first row of a query, None if there is no row.
+        """
+        _row: Optional[tuple] = self(__sql, __parameters).fetchone()
+        return model.db(_row) if _row is not None else None
+
+    def _stream_cursor(self) -> _sql.Cursor:
+        """
+        Protected method that returns a new cursor for a streamed query, on the pooled read connection of the calling
+        thread or on this object's connection, so that the query is not reset by other statements run while its
+        rows are consumed. Cursors on this object's connection are shared with other threads, call it and use the
+        cursor holding the lock returned by _stream_lock().
+        """
+        if self._pool is None or self._in_transaction:
+            return self._connection.cursor(self._cursor_factory)
+        return self._pool.connection().cursor(self._pool.cursor_factory)
+
+    def _stream_lock(self) -> Union[RLock, nullcontext]:
+        """
+        Protected method that returns the lock a streamed query holds while it steps its cursor: the connection lock
+        for cursors on this object's connection, none for the pooled read connection of the calling thread.
+        """
+        return self._lock if self._pool is None or self._in_transaction else nullcontext()
+
+    def hydrator(self, model: type, columns: Optional[Sequence[str]] = None, trusted: bool = True) -> "Hydrator":
+        """
+        Returns the compiled hydrator of a record class for rows of ``columns``, all the columns of its table if not
+        given. Its ``function`` is a row factory: ``cursor.row_factory = database.hydrator(models.Airport).function``.
+        Pass trusted=False to build objects with the model constructor and its checks.
+        :return: Hydrator
+        :raises AttributeError: for models that are not database records or have no table
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.hydration import Hydrator
+        return Hydrator.get(model, columns, trusted,
+                            lambda: [_column[1] for _column in self.table_info(model.__name__)])
+
+    def batches(self, __sql: str, __parameters: _Parameters = (), chunk: int = 500, model: Optional[type] = None,
+                trusted: bool = False) -> Iterator[list]:
+        """
+        Generator of the rows of a query in lists of at most ``chunk`` rows, read with ``fetchmany()``, so that memory
+        holds one chunk whatever the size of the result. Only queries can be streamed.
+        Pass a record class as ``model`` to get objects instead of tuples, built by its hydrator, see hydrator().
+        Without pool, the connection lock is held while a chunk is read, not while it is consumed. With pool, rows
+        are read through the pooled connection of the thread that started the stream, which must consume it.
+
+        ``for rows in database.batches("select * from Flight", chunk=1000): database.executemany(..., rows)``
+        :return: Iterator
+        :raises AttributeError: for statements that are not queries or invalid chunk size
+        :raises sqlite3.DatabaseError:
+
+        *Created on 18 Oct 2026.*
+        """
+        if chunk < 1:
+            raise AttributeError(f"Chunk size must be a positive number, {chunk} is not valid.")
+        if not ConnectionPool.is_read(__sql):
+            raise AttributeError("Only queries can be streamed, use executemany() for writes.")
+        _lock: Union[RLock, nullcontext] = self._stream_lock()
+        with _lock:
+            _cursor: _sql.Cursor = self._stream_cursor()
+        try:
+            with _lock:
+                _cursor.execute(__sql, __parameters)
+            if model is not None:  # NOTE -------------------------------- read by sqlite3 for every row fetched
+                _cursor.row_factory = self.hydrator(model, [_column[0] for _column in _cursor.description],
+                                                    trusted).function
+            if self._PRINT_QUERIES:
+                print("QUERY STREAMED", __sql, "WITH PARAMETERS", __parameters)
+            self.__class__._QUERY_COUNTER += 1
+            while True:
+                with _lock:  # NOTE -------------------------- released while the chunk is consumed, between two reads
+                    _rows: list = _cursor.fetchmany(chunk)
+                if not _rows:
+                    break
+                yield _rows
+        finally:
+            with _lock:
+                _cursor.close()  # NOTE --------------------------------- also when the consumer stops early
+        return
+
+    def stream(self, __sql: str, __parameters: _Parameters = (), chunk: int = 500) -> Iterator[tuple]:
+        """
+        Generator of the rows of a query, one at a time, read ``chunk`` rows at a time, see batches().
+
+        ``for flight in database.stream("select * from Flight where departure is not null"): print(flight)``
+        :return: Iterator
+
+        *Created on 18 Oct 2026.*
+        """
+        for _rows in self.batches(__sql, __parameters, chunk):
+            yield from _rows
+        return
+
+    def stream_records(self, model: type, __sql: Optional[str] = None, __parameters: _Parameters = (),
+                       chunk: int = 500, trusted: bool = False) -> Iterator[models._DatabaseRecord]:
+        """
+        Generator of record objects of ``model``, built by its compiled hydrator from the rows of a query, all the
+        rows of the table named after the model if no query is given. Rows are read as in stream().
+        Pass trusted=True to skip the constructor checks for rows the application has written, see hydrator().
+
+        ``for schedule in database.stream_records(models.Schedule, trusted=True): ...``
+        :return: Iterator
+        :raises AttributeError: for models that are not database records
+
+        *Created on 18 Oct 2026.*
+        """
+        if not (isinstance(model, type) and issubclass(model, models._DatabaseRecord)):
+            raise AttributeError(f"{model} is not a database record class.")
+        for _rows in self.batches(f"select * from {model.__name__}" if __sql is None else __sql, __parameters, chunk,
+                                  model, trusted):
+            yield from _rows
+        return
+
+    def exists(self, __sql: str, __parameters: _Parameters = ()) -> bool:
+        """
+        Returns True if the query has at least one row, SQLite stops at the first one.
+
+        ``database.exists("select 1 from Employee where SSN = ?", (ssn,))``
+        :return: bool
+
+        *Created on 18 Oct 2026.*
+        """
+        _batches: Iterator[list[tuple]] = self.batches(__sql, __parameters, 1)
+        try:
+            return next(_batches, None) is not None
+        finally:
+            _batches.close()
+
+    def _expand(self, jobs: Iterable[tuple[models.Schedule, _date, _date]],
+                existing: set[tuple[str, str]]) -> tuple[list[tuple], int]:
+        """
+        Protected method that expands each Schedule over its own date range, both dates included, into Flight rows
+        for the columns of _FLIGHT_COLUMNS. Weekday bits are computed once per date and airplanes once per airline,
+        so each flight costs one bitwise check. Flights whose (code, date) pair is in ``existing`` are skipped.
+        Gates are allocated to all the new flights at once, around the gates of the stored ones, see gate_allocator().
+        :return: tuple, the rows and the number of flights skipped
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return [], 0
+        _airlines: dict[str, int] = dict(self("select designator, id from Airline").fetchall())
+        _airplanes: dict[int, list[int]] = {}
+        for _airline, _airplane in self("select airline, id from Airplane").fetchall():
+            _airplanes.setdefault(_airline, []).append(_airplane)
+        _first: _date = min(job[1] for job in jobs)
+        _days: list[tuple[_date, str, int]] = []  # NOTE -------------------------- date, ISO date and weekday bit
+        for _offset in range((max(job[2] for job in jobs) - _first).days + 1):
+            _day: _date = _first + _timed(_offset)
+            _days.append((_day, _day.isoformat(), models.Day.day(_day).mask))
+
+        _rows: list[tuple] = []
+        _requests: list[tuple[int, str, bool, bool]] = []  # NOTE -------------- row, time, departure and Schengen
+        _schengen: set[int] = self._schengen_airports()
+        _skipped: int = 0
+        for schedule, start, end in jobs:
+            _time: str = (schedule.departure or schedule.arrival).strftime(models.DatetimeFormat.TIME.value)
+            _choices: list[Optional[int]] = _airplanes.get(_airlines.get(schedule.code[:2]), [None])
+            _mask: int = schedule._days or 0
+            _departure: bool = schedule.is_departure
+            _inside: bool = (schedule.to_airport if _departure else schedule.from_airport) in _schengen
+            for _day, _iso, _bit in _days[(start - _first).days: (end - _first).days + 1]:
+                if not _mask & _bit:
+                    continue
+                if (schedule.code, _iso) in existing:
+                    _skipped += 1
+                    continue
+                if _departure:
+                    _rows.append((schedule.code, schedule.from_airport, schedule.to_airport, _iso + " " + _time,
+                                  None, None, _rand(0, 40), None, None, _ch(_choices)))
+                else:
+                    _rows.append((schedule.code, schedule.from_airport, schedule.to_airport, None,
+                                  _iso + " " + _time, None, None, None, None, _ch(_choices)))
+                _requests.append((len(_rows) - 1, _iso + " " + _time, _departure, _inside))
+        _allocator: GateAllocator = self.gate_allocator(_first, _days[-1][0])
+        for _row, _gate in _allocator.allocate(_requests).items():
+            if _gate is not None:  # NOTE -------------------------------------- gate columns stay null without one
+                _rows[_row] = _rows[_row][:7] + (_gate.number, _gate.terminal) + _rows[_row][9:]
+        return _rows, _skipped
+
+    def _schengen_airports(self) -> set[int]:
+        """
+        Protected method that returns the ids of the airports in Schengen countries, domestic ones included.
+        """
+        return self._cache.get("Airport", "schengen", None, lambda: {
+            _id for _id, _country in self.stream("select id, country from Airport") if _country.upper() in SCHENGEN})
+
+    def gate_allocator(self, start: _date, end: _date) -> "GateAllocator":
+        """
+        Returns a GateAllocator holding the gates of the stored flights between two dates, a day more on both
+        sides, so that new flights are given gates around them. Stored flights whose gates are not free, as
+        random gates of older data, are left out, see allocate_gates().
+        :return: assets.gates.GateAllocator
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.gates import GateAllocator
+        _allocator: GateAllocator = GateAllocator()
+        for _departure, _arrival, _number, _terminal in self.stream(
+                "select departure, arrival, gate_n, gate_t from Flight where gate_n is not null "
+                "and date(coalesce(departure, arrival)) between ? and ? order by coalesce(departure, arrival)",
+                ((start - _timed(1)).isoformat(), (end + _timed(1)).isoformat())):
+            _allocator.reserve(models.Gate(_number, _terminal), _departure or _arrival, _departure is not None)
+        return _allocator
+
+    def allocate_gates(self, start: Optional[_date] = None, end: Optional[_date] = None) -> "GateAllocator":
+        """
+        Allocates the gates of all stored flights between two dates again, both included (defaults are the class
+        variables _SCHEDULE_START and _SCHEDULE_END), without two flights at one gate at the same time, by the hall
+        rules of Gate.halls() and with turnaround buffers, see assets.gates. Flights no gate was free for get null
+        gate columns. Returns the allocator, whose report() shows the utilization of the halls.
+
+        ``print(database.allocate_gates().report())``
+        :return: assets.gates.GateAllocator
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.gates import GateAllocator
+        start, end = start or self._SCHEDULE_START, end or self._SCHEDULE_END
+        if start > end:
+            raise AttributeError(f"Start date {start} is after end date {end}.")
+        _schengen: set[int] = self._schengen_airports()
+        _requests: list[tuple[int, str, bool, bool]] = [
+            (_id, _departure or _arrival, _departure is not None,
+             (_to if _departure is not None else _from) in _schengen)
+            for _id, _from, _to, _departure, _arrival in self.stream(
+                "select id, from_airport, to_airport, departure, arrival from Flight "
+                "where date(coalesce(departure, arrival)) between ? and ?", (start.isoformat(), end.isoformat()))]
+        _allocator: GateAllocator = GateAllocator()
+        _gates: dict[int, Optional[models.Gate]] = _allocator.allocate(_requests)
+        with self.transaction():
+            self.executemany("update Flight set gate_n = ?, gate_t = ? where id = ?",
+                             [(_gate.number, _gate.terminal, _id) if _gate is not None else (None, None, _id)
+                              for _id, _gate in _gates.items()])
+        if self._DEBUG:
+            print(_allocator.report())
+        return _allocator
+
+    def _existing_flights(self, start: _date, end: _date) -> set[tuple[str, str]]:
+        """
+        Protected method that returns (code, date) pairs of the flights already stored between two dates.
+        """
+        return set(self("select code, date(coalesce(departure, arrival)) from Flight "
+                        "where date(coalesce(departure, arrival)) between ? and ?",
+                        (start.isoformat(), end.isoformat())).fetchall())
+
+    def generate_flights(self, start: Optional[_date] = None, end: Optional[_date] = None,
+                         codes: Optional[Sequence[str]] = None) -> GenerationReport:
+        """
+        Creates Flight records for every active Schedule, or only for the passed flight codes, on each day
+        between start and end (both included, defaults are the class variables _SCHEDULE_START and _SCHEDULE_END)
+        that is one of the Schedule days. All schedules are expanded in one pass and inserted in bulk, in one
+        transaction. Flights that already exist for the same code and date are not created again, so reruns
+        are safe. State column is left null, see states_init().
+        :return: GenerationReport, with throughput in flights per second
+
+        *Created on 18 Oct 2026.*
+        """
+        _start_time: float = perf_counter()
+        start, end = start or self._SCHEDULE_START, end or self._SCHEDULE_END
+        if start > end:
+            raise AttributeError(f"Start date {start} is after end date {end}.")
+        codes = set(codes) if codes is not None else None
+        _schedules: list[models.Schedule] = [models.Schedule.db(row) for row in
+                                             self("select * from Schedule where active = 1").fetchall()
+                                             if codes is None or row[0] in codes]
+        _existing: set[tuple[str, str]] = self._existing_flights(start, end)
+        with self.transaction():
+            _rows, _skipped = self._expand([(schedule, start, end) for schedule in _schedules], _existing)
+            self.insert_many("Flight", _rows, self._FLIGHT_COLUMNS)
+        _report = GenerationReport(len(_schedules), len(_rows), _skipped, perf_counter() - _start_time)
+        if self._DEBUG:
+            print(_report)
+        return _report
+
+    def advance_horizon(self, until: Optional[_date] = None, today: Optional[_date] = None) -> GenerationReport:
+        """
+        Rolling-window generation: table ScheduleHorizon records, for each Schedule, the last date materialized
+        and the modified timestamp it was materialized with. Each call only creates flights for the days between
+        that date and ``until`` (default: today plus class variable _HORIZON_DAYS), so a nightly job costs as
+        much as the days added. A Schedule whose modified timestamp changed since has its flights from ``today``
+        on removed and generated again, its past flights are kept. New schedules start from ``today``.
+        :return: GenerationReport
+
+        *Created on 18 Oct 2026.*
+        """
+        _start_time: float = perf_counter()
+        today = today or _date.today()
+        until = until or today + _timed(self._HORIZON_DAYS)
+        self("create table if not exists ScheduleHorizon (code text not null primary key references Schedule, "
+             "materialized date not null, modified datetime)")
+        _jobs: list[tuple[models.Schedule, _date, _date]] = []
+        _marks: list[tuple[str, str, Optional[str]]] = []
+        _changed: list[str] = []
+        for row in self("select Schedule.*, ScheduleHorizon.materialized, ScheduleHorizon.modified from Schedule "
+                        "left join ScheduleHorizon using (code) where active = 1").fetchall():
+            _schedule, _materialized, _modified = models.Schedule.db(row[:9]), row[9], row[10]
+            _start, _mark = today, until
+            if _materialized is not None and _modified == row[6]:
+                _start = max(today, _date.fromisoformat(_materialized) + _timed(1))
+                _mark = max(until, _date.fromisoformat(_materialized))
+            elif _materialized is not None:
+                _changed.append(_schedule.code)
+            _marks.append((_schedule.code, _mark.isoformat(), row[6]))
+            if _start <= until:
+                _jobs.append((_schedule, _start, until))
+
+        _report = GenerationReport(len(_jobs))
+        with self.transaction():
+            for code in _changed:
+                _report.removed += self("delete from Flight where code = ? and date(coalesce(departure, arrival)) >= ?",
+                                        (code, today.isoformat())).rowcount
+            if _jobs:
+                _existing = self._existing_flights(min(job[1] for job in _jobs), until)
+                _rows, _report.skipped = self._expand(_jobs, _existing)
+                _report.flights = self.insert_many("Flight", _rows, self._FLIGHT_COLUMNS)
+            self.upsert_many("ScheduleHorizon", _marks, conflict=("code",))
+        _report.seconds = perf_counter() - _start_time
+        if self._DEBUG:
+            print(_report)
+        return _report
 
     def generate_scheduled_flights(self, flight_code: str) -> str:
         """
         Creates Flight records for a single Schedule and stores them to database, only for the days
         specified in Schedule. One Schedule record and many flight records share the same flight code.
         Flight records have different date but always the same time, also specified in Schedule.
+        Same as generate_flights(codes=[flight_code]), returns the created rows.
         :return: str
 
         *Created on 22 Dec 2023.*
         """
-        _report: list[str] = list()
-        _data: list = list()
-        _counter: int = 0
         _s = models.Schedule.db(self("select * from Schedule where code = ?", (flight_code,)).fetchone())
         if self._DEBUG:
             print("SCHEDULED FLIGHT:", _s)
-        _airline = self.airline(_s.code[:2]).tuple
-        _airplanes = self("select * from Airplane where airline = ?", (_airline[0],)).fetchall()
-        _time = _s.departure if _s.is_departure else _s.arrival
-        _time = _time.hour, _time.minute
-
-        for date in self._dates:
-            current_day: models.Day = models.Day.day(date)
-            if current_day not in _s.days:
-                continue
-            if self._DEBUG:
-                _counter += 1
-                print(date, current_day, current_day in _s.days)
-            _data = [_s.code, _s.from_airport, _s.to_airport]
-            if _s.is_departure:
-                _data.append(_dt(date.year, date.month, date.day, *_time))
-            if _s.is_arrival:
-                _data.append(_dt(date.year, date.month, date.day, *_time))
-            check_in: int = _rand(0, 40) if _s.is_departure else None
-            _data.extend([None, check_in])  # NOTE ----------------------------- state column will be filled separately
-            _gate = models.Gate.random()
-            _data.extend([_gate.number, _gate.terminal, _ch(_airplanes)[0]])
+        _existing = self._existing_flights(self._SCHEDULE_START, self._SCHEDULE_END)
+        with self.transaction():
+            _rows, _ = self._expand([(_s, self._SCHEDULE_START, self._SCHEDULE_END)], _existing)
+            self.insert_many("Flight", _rows, self._FLIGHT_COLUMNS)
+        if self._DEBUG:
+            print(f"{len(_rows)} SCHEDULED FLIGHTS CREATED.")
+        return "\n".join(str(_row) for _row in _rows)
 
-            if self._DEBUG:
-                print(_data)
+    def refresh_aggregate(self, column: str) -> int:
+        """
+        Recounts one of the denormalized counters declared at class variable _AGGREGATES with a single set-based
+        update: the source table is grouped once, joined to the target table and only rows whose stored count
+        differs are written, so the number of queries does not grow with the tables.
+        :return: int, the number of rows changed
+        :raises AttributeError: for unknown counter
+
+        *Created on 18 Oct 2026.*
+        """
+        if column not in self._AGGREGATES:
+            raise AttributeError(f"No counter named {column}, choose one of {', '.join(self._AGGREGATES)}.")
+        _table, _key, _source, _source_key = self._AGGREGATES[column]
+        if _sql.sqlite_version_info >= (3, 33):  # NOTE ------------------------------- update-from needs SQLite 3.33
+            _query: str = (f"update {_table} set {column} = _counted.total from "
+                           f"(select {_table}.{_key} as _key, coalesce(_grouped.total, 0) as total from {_table} "
+                           f"left join (select {_source_key}, count() as total from {_source} group by {_source_key})"
+                           f" as _grouped on _grouped.{_source_key} = {_table}.{_key}) as _counted "
+                           f"where {_table}.{_key} = _counted._key and {_table}.{column} is not _counted.total")
+        else:
+            _count: str = f"(select count() from {_source} where {_source}.{_source_key} = {_table}.{_key})"
+            _query: str = f"update {_table} set {column} = {_count} where {column} is not {_count}"
+        with self.transaction():
+            _changed: int = self(_query).rowcount
+        return _changed
+
+    def _counter_triggers(self, column: str) -> dict[str, str]:
+        """
+        Protected method that returns the trigger statements, by trigger name, keeping one counter exact.
+        """
+        _table, _key, _source, _source_key = self._AGGREGATES[column]
+        _name: str = f"_counter_{_table}_{column}".lower()
+        _add: str = f"update {_table} set {column} = coalesce({column}, 0) + 1 where {_key} = new.{_source_key};"
+        _remove: str = f"update {_table} set {column} = coalesce({column}, 0) - 1 where {_key} = old.{_source_key};"
+        return {_name + "_insert": f"create trigger if not exists {_name}_insert after insert on {_source} "
+                                   f"begin {_add} end",
+                _name + "_delete": f"create trigger if not exists {_name}_delete after delete on {_source} "
+                                   f"begin {_remove} end",
+                _name + "_update": f"create trigger if not exists {_name}_update after update of {_source_key} "
+                                   f"on {_source} when old.{_source_key} is not new.{_source_key} "
+                                   f"begin {_remove} {_add} end"}
+
+    @property
+    def counter_triggers(self) -> list[str]:
+        """
+        Returns the names of the installed counter triggers, see install_counter_triggers().
+        :return: list
+        """
+        return [_row[0] for _row in self("select name from sqlite_master where type = 'trigger' "
+                                         "and name like '\\_counter\\_%' escape '\\' order by name").fetchall()]
 
-                departure = ("insert into Flight (code, from_airport, to_airport, departure, state, "
-                             "check_in, gate_n, gate_t, airplane) values (?, ?, ?, ?, ?, ?, ?, ?, ?)")
-                arrival = ("insert into Flight (code, from_airport, to_airport, arrival, state, "
-                           "check_in, gate_n, gate_t, airplane) values (?, ?, ?, ?, ?, ?, ?, ?, ?)")
-                _query = departure if _s.is_departure else arrival if _s.is_arrival else None
-                self._cursor.execute(_query, _data)
+    def install_counter_triggers(self) -> int:
+        """
+        Opt-in schema feature: creates triggers on the source tables of _AGGREGATES (Flight and Airplane inserts,
+        deletes and updates) that add or subtract one from the counters (Schedule.occurrences, Airline.airplanes),
+        so they never go stale and reading them costs nothing. Counters are rebuilt first, triggers only keep
+        them exact from then on. Already installed triggers are left as they are.
+        :return: int, the number of counter rows corrected by the rebuild
 
-            _report.append(str(_data))
+        *Created on 18 Oct 2026.*
+        """
+        with self.transaction():
+            _corrected: int = self.rebuild_counters()
+            for column in self._AGGREGATES:
+                for _statement in self._counter_triggers(column).values():
+                    self(_statement)
         if self._DEBUG:
-            print(f"{_counter} SCHEDULED FLIGHTS CREATED.")
-        return "\n".join(_elem for _elem in _report)
+            print(f"COUNTER TRIGGERS INSTALLED: {', '.join(self.counter_triggers)}")
+        return _corrected
 
-    def update_schedule_occurrences(self) -> NoReturn:
+    def remove_counter_triggers(self) -> int:
         """
-        For each Schedule record, counts Flight occurrences and stores count at Schedule.occurrences.
+        Removes the triggers created by install_counter_triggers(), counters are then maintained by hand again.
+        :return: int, the number of triggers removed
+        """
+        _installed: list[str] = self.counter_triggers
+        with self.transaction():
+            for _name in _installed:  # NOTE ------------------ bypasses __call__, which refuses any drop statement
+                self._connection.execute(f"drop trigger if exists {_name}")
+        return len(_installed)
+
+    @property
+    def managed_indexes(self) -> list[str]:
+        """
+        Returns the names of the installed indexes of the managed set, see install_indexes().
+        :return: list
+        """
+        return [_row[0] for _row in self("select name from sqlite_master where type = 'index' "
+                                         "and name like '\\_index\\_%' escape '\\' order by name").fetchall()]
+
+    def install_indexes(self, names: Optional[Iterable[str]] = None) -> list[str]:
+        """
+        Creates the indexes of the managed set (assets.indexes.INDEXES), all of them or the given ``names``, for
+        example those proposed by advise_indexes(), and refreshes the planner statistics with ``analyze``.
+        Already installed indexes are left as they are.
+        :return: list, the names of the indexes created
+        :raises AttributeError: for names not in the managed set
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.indexes import INDEXES
+        _names: list[str] = list(INDEXES) if names is None else list(names)
+        for _name in _names:
+            if _name not in INDEXES:
+                raise AttributeError(f"Index {_name} is not in the managed set, check your spelling.")
+        _installed: list[str] = self.managed_indexes
+        with self.transaction():
+            for _name in _names:
+                self(INDEXES[_name])
+            self("analyze")
+        if self._DEBUG:
+            print(f"INDEXES INSTALLED: {', '.join(self.managed_indexes)}")
+        return [_name for _name in _names if _name not in _installed]
+
+    def remove_indexes(self) -> int:
+        """
+        Removes the indexes created by install_indexes().
+        :return: int, the number of indexes removed
+        """
+        _installed: list[str] = self.managed_indexes
+        with self.transaction():
+            for _name in _installed:  # NOTE ------------------ bypasses __call__, which refuses any drop statement
+                self._connection.execute(f"drop index if exists {_name}")
+        return len(_installed)
+
+    def advise_indexes(self) -> "IndexAdvisor":
+        """
+        Starts capturing the workload for an IndexAdvisor, through the instrumentation hooks. Call its advise()
+        after a representative run to see which managed indexes the planner would use and how plans change.
+
+        ``advisor = database.advise_indexes(); ...; print(advice := advisor.advise()); database.install_indexes(
+        advice.proposed)``
+        :return: IndexAdvisor
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.indexes import IndexAdvisor
+        _advisor: IndexAdvisor = IndexAdvisor(self._path)
+        _instrumentation: Instrumentation = self._instrumentation or self.instrument(report_on_close=self._DEBUG)
+        _instrumentation.add_hook(_advisor.capture)
+        return _advisor
+
+    @property
+    def board_triggers(self) -> list[str]:
+        """
+        Returns the names of the installed board triggers, see install_boards().
+        :return: list
+        """
+        return [_row[0] for _row in self("select name from sqlite_master where type = 'trigger' "
+                                         "and name like '\\_board\\_%' escape '\\' order by name").fetchall()]
+
+    def install_boards(self) -> int:
+        """
+        Opt-in schema feature: creates the materialized boards (assets.boards), table Board with one row per flight
+        of the Departure and Arrival views keyed by (category, terminal, time, flight), and the triggers that keep
+        it current on every Flight insert, delete or update. Table BoardVersion counts the changes of each board,
+        see board_version(). Boards are filled once, when their triggers are installed, installed boards are kept
+        current by the triggers and not rebuilt, see refresh_boards().
+        :return: int, the number of board rows
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.boards import BOARD_TABLES, BOARD_TRIGGERS
+        _installed: bool = len(self.board_triggers) == len(BOARD_TRIGGERS)
+        with self.transaction():
+            for _statement in chain(BOARD_TABLES.values(), BOARD_TRIGGERS.values()):
+                self(_statement)
+            _rows: int = self("select count(*) from Board").fetchone()[0] if _installed else self.refresh_boards()
+        if self._DEBUG:
+            print(f"BOARDS INSTALLED WITH {_rows} FLIGHTS: {', '.join(self.board_triggers)}")
+        return _rows
+
+    def remove_boards(self) -> int:
+        """
+        Removes the board tables and triggers created by install_boards().
+        :return: int, the number of triggers removed
+        """
+        from assets.boards import BOARD_TABLES
+        _installed: list[str] = self.board_triggers
+        with self.transaction():
+            for _name in _installed:  # NOTE ------------------ bypasses __call__, which refuses any drop statement
+                self._connection.execute(f"drop trigger if exists {_name}")
+            for _name in BOARD_TABLES:
+                self._connection.execute(f"drop {'index' if _name.startswith('_') else 'table'} if exists {_name}")
+        return len(_installed)
+
+    @property
+    def feed_triggers(self) -> list[str]:
+        """
+        Returns the names of the installed change feed triggers, see install_change_feed().
+        :return: list
+        """
+        return [_row[0] for _row in self("select name from sqlite_master where type = 'trigger' "
+                                         "and name like '\\_feed\\_%' escape '\\' order by name").fetchall()]
+
+    def install_change_feed(self) -> NoReturn:
+        """
+        Opt-in schema feature: creates table FlightChange and the triggers on Flight that log every board a flight
+        enters, leaves or changes in (assets.feed). Installs the boards too, since the feed reads its rows there.
         :return: None
 
-        *Created on 25 Dec 2023.*
+        *Created on 18 Oct 2026.*
         """
-        _counter: int = 0
-        for schedule in self("select code, active, occurrences from Schedule").fetchall():
-            count = self("select count() from Flight where code = ?", (schedule[0],)).fetchone()[0]
-            if schedule[2] != count:
-                _counter += abs(count - schedule[2]) if schedule[2] is not None else count
-                self("update Schedule set occurrences = ? where code = ?", (count, schedule[0]))
+        from assets.boards import BOARD_TRIGGERS
+        from assets.feed import FEED_TABLES, FEED_TRIGGERS
+        if len(self.board_triggers) < len(BOARD_TRIGGERS):
+            self.install_boards()
+        with self.transaction():
+            for _statement in chain(FEED_TABLES.values(), FEED_TRIGGERS.values()):
+                self(_statement)
         if self._DEBUG:
-            print(f"{_counter} NEW FLIGHT OCCURRENCES DETECTED.")
+            print(f"CHANGE FEED INSTALLED: {', '.join(self.feed_triggers)}")
         return
 
-    def update_airline_airplanes(self) -> NoReturn:
-        _counter: int = 0
-        for airline in self("select id, airplanes from Airline").fetchall():
-            count = self("select count() from Airplane where airline = ?", (airline[0],)).fetchone()[0]
-            print(airline[0], count)
-            if airline[1] != count:
-                _counter += abs(count - airline[1]) if airline[1] is not None else count
-                self("update Airline set airplanes = ? where id = ?", (count, airline[0]))
+    def remove_change_feed(self) -> int:
+        """
+        Removes the table and the triggers created by install_change_feed(), boards are left installed.
+        :return: int, the number of triggers removed
+        """
+        from assets.feed import FEED_TABLES
+        _installed: list[str] = self.feed_triggers
+        with self.transaction():
+            for _name in _installed:  # NOTE ------------------ bypasses __call__, which refuses any drop statement
+                self._connection.execute(f"drop trigger if exists {_name}")
+            for _name in FEED_TABLES:
+                self._connection.execute(f"drop table if exists {_name}")
+        return len(_installed)
+
+    def change_feed(self, interval: float = 1.0) -> "ChangeFeed":
+        """
+        Installs the change feed if needed and returns a started ChangeFeed, which polls FlightChange every
+        ``interval`` seconds from a background thread through its own connection and passes the changed board
+        rows to its subscribers. One feed serves any number of screens. Changes are seen once they are committed,
+        right away in pooled mode, see enable_pool(), otherwise after flush() or at the end of a transaction.
+
+        ``database.change_feed().subscribe(lambda changes: print(*changes, sep="\\n"))``
+        :return: ChangeFeed
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.feed import FEED_TRIGGERS, ChangeFeed
+        if len(self.feed_triggers) < len(FEED_TRIGGERS):
+            self.install_change_feed()
+        return ChangeFeed(self._path, interval).start()
+
+    def refresh_boards(self) -> int:
+        """
+        Rebuilds table Board from Flight with one statement and counts a change of every board. Triggers keep the
+        boards current, this repairs them after bulk changes made with the triggers removed.
+        :return: int, the number of board rows
+        """
+        from assets.boards import BOARD_SELECT
+        with self.transaction():
+            self("delete from Board")
+            _rows: int = self(f"insert into Board {BOARD_SELECT}").rowcount
+            self("insert into BoardVersion select distinct category, terminal, 1, strftime('%Y-%m-%d %H:%M:%f', "
+                 "'now') from Board where true on conflict (category, terminal) do update set version = version + 1, "
+                 "modified = excluded.modified")
+        return _rows
+
+    def board(self, category: str, terminal: str, start: Optional[str] = None, limit: int = 100) -> list[tuple]:
+        """
+        Reads a board of the materialized boards, departures or arrivals of a terminal from ``start`` on (all of
+        them if it is None), ordered by time, as rows of BOARD_COLUMNS: code, airline, airport, time, state, check_in
+        and gate. A range scan of the Board primary key, see install_boards().
+        :return: list
+        :raises AttributeError: for invalid categories
+
+        *Created on 18 Oct 2026.*
+        """
+        return self._page(category, terminal, start, limit=limit).rows
+
+    @staticmethod
+    def _timestamp(moment: Union[_dt, _date, str]) -> str:
+        return moment.strftime("%Y-%m-%d %H:%M:%S") if isinstance(moment, _dt) else str(moment)
+
+    def _page(self, category: str, terminal: str, start: Union[_dt, _date, str, None] = None,
+              end: Union[_dt, _date, str, None] = None, airline: Optional[str] = None, state: Optional[str] = None,
+              limit: int = 50, after: Optional[tuple[str, int]] = None,
+              before: Optional[tuple[str, int]] = None) -> "BoardPage":
+        """
+        Protected method that reads one page of a board with keyset pagination on (time, flight): the page starts
+        right after the ``after`` key or ends right before the ``before`` key, so it is a range scan of the Board
+        primary key whatever the page number. One row more than ``limit`` is read to know if the page is the last.
+        """
+        from assets.boards import BOARD_COLUMNS, CATEGORIES, BoardPage
+        if category not in CATEGORIES:
+            raise AttributeError(f"Board category must be one of {', '.join(CATEGORIES)}, {category} is not valid.")
+        if limit < 1:
+            raise AttributeError(f"Page size must be a positive number, {limit} is not valid.")
+        if after is not None and before is not None:
+            raise AttributeError("Pass either the after or the before cursor, not both.")
+        _where: list[str] = ["category = ?", "terminal = ?"]
+        _parameters: list = [category, terminal or ""]
+        for _condition, _value in (("time >= ?", start), ("time < ?", end)):
+            if _value is not None:
+                _where.append(_condition)
+                _parameters.append(self._timestamp(_value))
+        for _condition, _value in (("substr(code, 1, 2) = ?", airline), ("state = ?", state)):
+            if _value is not None:
+                _where.append(_condition)
+                _parameters.append(_value)
+        for _condition, _key in (("(time, flight) > (?, ?)", after), ("(time, flight) < (?, ?)", before)):
+            if _key is not None:
+                _where.append(_condition)
+                _parameters.extend(_key)
+        _order: str = "desc" if before is not None else "asc"
+        _cursor = self(f"select flight, {', '.join(BOARD_COLUMNS)} from Board where {' and '.join(_where)} "
+                       f"order by time {_order}, flight {_order} limit ?", (*_parameters, limit + 1))
+        if isinstance(_cursor, _sql.DatabaseError):
+            raise AttributeError("Boards are not installed, see install_boards().") from _cursor
+        _rows: list[tuple] = _cursor.fetchall()
+        _more: bool = len(_rows) > limit
+        _rows = _rows[:limit]
+        if before is not None:
+            _rows.reverse()
+        if not _rows:
+            return BoardPage([])
+        _first, _last = (_rows[0][4], _rows[0][0]), (_rows[-1][4], _rows[-1][0])
+        _flights: list[int] = [_row[0] for _row in _rows]
+        if before is not None:
+            return BoardPage([_row[1:] for _row in _rows], _flights, _last, _first if _more else None)
+        return BoardPage([_row[1:] for _row in _rows], _flights, _last if _more else None,
+                         _first if after is not None else None)
+
+    def departures(self, terminal: str, start: Union[_dt, _date, str, None] = None,
+                   end: Union[_dt, _date, str, None] = None, airline: Optional[str] = None,
+                   state: Optional[str] = None, limit: int = 50, after: Optional[tuple[str, int]] = None,
+                   before: Optional[tuple[str, int]] = None) -> "BoardPage":
+        """
+        Returns a page of the departures board of a terminal, ordered by departure time, between ``start`` and
+        ``end`` (excluded) when given, of one airline (designator) and one state (name) when given. Pass the
+        ``next`` cursor of a page as ``after`` for the following page, its ``previous`` cursor as ``before`` for
+        the page in front of it. Each page costs the same, an index range scan of ``limit`` rows.
+        Needs the materialized boards, see install_boards().
+
+        ``database.departures("A", start=datetime.now(), end=datetime.now() + timedelta(hours=2))``
+        :return: BoardPage
+        :raises AttributeError: for invalid arguments or when boards are not installed
+
+        *Created on 18 Oct 2026.*
+        """
+        return self._page("Departure", terminal, start, end, airline, state, limit, after, before)
+
+    def arrivals(self, terminal: str, start: Union[_dt, _date, str, None] = None,
+                 end: Union[_dt, _date, str, None] = None, airline: Optional[str] = None,
+                 state: Optional[str] = None, limit: int = 50, after: Optional[tuple[str, int]] = None,
+                 before: Optional[tuple[str, int]] = None) -> "BoardPage":
+        """
+        Returns a page of the arrivals board of a terminal, ordered by arrival time, see departures().
+        :return: BoardPage
+        :raises AttributeError: for invalid arguments or when boards are not installed
+
+        *Created on 18 Oct 2026.*
+        """
+        return self._page("Arrival", terminal, start, end, airline, state, limit, after, before)
+
+    def board_version(self, category: Optional[str] = None, terminal: Optional[str] = None) -> tuple[int, str]:
+        """
+        Returns the change counter and the timestamp of the last change of one board, or of all boards together
+        when category and terminal are not given. A screen polls it and reads its board again only when the
+        counter has moved. Boards never changed return (0, None).
+        :return: tuple
+
+        *Created on 18 Oct 2026.*
+        """
+        if category is None and terminal is None:
+            _row = self("select coalesce(sum(version), 0), max(modified) from BoardVersion").fetchone()
+        else:
+            _row = self("select version, modified from BoardVersion where category = ? and terminal = ?",
+                        (category, terminal or "")).fetchone()
+        return tuple(_row) if _row is not None else (0, None)
+
+    @property
+    def route_triggers(self) -> list[str]:
+        """
+        Returns the names of the installed route triggers, see install_routes().
+        :return: list
+        """
+        return [_row[0] for _row in self("select name from sqlite_master where type = 'trigger' "
+                                         "and name like '\\_route\\_%' escape '\\' order by name").fetchall()]
+
+    def install_routes(self) -> int:
+        """
+        Opt-in schema feature: creates table Route (assets.routes) with the arc, kilometers and flight minutes of
+        every ordered pair of airports, views RouteView and ScheduleRoute, and the triggers that refresh the routes
+        of an airport when it is inserted, moved or deleted. Routes are computed once, already installed routes are
+        only completed. Airport distances are read from the table from then on, see route().
+        :return: int, the number of routes computed
+
+        *Created on 18 Oct 2026.*
+        """
+        from assets.routes import ROUTE_TABLES, ROUTE_TRIGGERS, ROUTE_VIEWS
+        with self.transaction():
+            for _statement in chain(ROUTE_TABLES.values(), ROUTE_VIEWS.values(), ROUTE_TRIGGERS.values()):
+                self(_statement)
+            _rows: int = self.refresh_routes()
         if self._DEBUG:
-            print(f"{_counter} NEW AIRPLANES DETECTED.")
-        return
+            print(f"ROUTES INSTALLED WITH {_rows} NEW PAIRS: {', '.join(self.route_triggers)}")
+        return _rows
+
+    def remove_routes(self) -> int:
+        """
+        Removes the route table, views and triggers created by install_routes(), distances are computed again.
+        :return: int, the number of triggers removed
+        """
+        from assets.routes import ROUTE_TABLES, ROUTE_VIEWS
+        _installed: list[str] = self.route_triggers
+        with self.transaction():
+            for _name in _installed:  # NOTE ------------------ bypasses __call__, which refuses any drop statement
+                self._connection.execute(f"drop trigger if exists {_name}")
+            for _name in ROUTE_VIEWS:
+                self._connection.execute(f"drop view if exists {_name}")
+            for _name in ROUTE_TABLES:
+                self._connection.execute(f"drop {'index' if _name.startswith('_') else 'table'} if exists {_name}")
+        self._cache.invalidate("Route")
+        return len(_installed)
+
+    def refresh_routes(self, full: bool = False) -> int:
+        """
+        Brings table Route up to date incrementally: removes the routes of airports that no longer exist and
+        computes only the missing pairs, with one statement each. Triggers keep the routes current, this repairs
+        them after changes made with the triggers removed. Pass full=True to recompute every pair, for airports
+        moved while the triggers were removed.
+        :return: int, the number of routes computed
+        """
+        from assets.routes import ROUTE_SELECT
+        with self.transaction():
+            if full:
+                self("delete from Route")
+            else:
+                self("delete from Route where origin not in (select id from Airport) "
+                     "or destination not in (select id from Airport)")
+            _rows: int = self(f"insert into Route {ROUTE_SELECT} where not exists (select 1 from Route "
+                              f"where origin = A.id and destination = B.id))").rowcount
+        return _rows
+
+    def verify_counters(self) -> dict[str, int]:
+        """
+        Compares every counter of _AGGREGATES with a fresh count of its source table, without changing anything.
+        :return: dict, the number of wrong rows by counter name
+        """
+        _report: dict[str, int] = {}
+        for column, (_table, _key, _source, _source_key) in self._AGGREGATES.items():
+            _report[column] = self(f"select count() from {_table} left join (select {_source_key}, count() as total "
+                                   f"from {_source} group by {_source_key}) as _grouped on _grouped.{_source_key} = "
+                                   f"{_table}.{_key} where {_table}.{column} is not coalesce(_grouped.total, 0)"
+                                   ).fetchone()[0]
+        return _report
+
+    def rebuild_counters(self) -> int:
+        """
+        Recounts every counter of _AGGREGATES, see refresh_aggregate().
+        :return: int, the number of rows changed
+        """
+        return sum(self.refresh_aggregate(column) for column in self._AGGREGATES)
+
+    def update_schedule_occurrences(self) -> int:
+        """
+        For each Schedule record, counts Flight occurrences and stores count at Schedule.occurrences.
+        :return: int, the number of Schedule records changed
+
+        *Created on 25 Dec 2023.*
+        """
+        _counter: int = self.refresh_aggregate("occurrences")
+        if self._DEBUG:
+            print(f"{_counter} SCHEDULES WITH NEW FLIGHT OCCURRENCES DETECTED.")
+        return _counter
+
+    def update_airline_airplanes(self) -> int:
+        """
+        For each Airline record, counts its Airplane records and stores count at Airline.airplanes.
+        :return: int, the number of Airline records changed
+        """
+        _counter: int = self.refresh_aggregate("airplanes")
+        if self._DEBUG:
+            print(f"{_counter} AIRLINES WITH NEW AIRPLANES DETECTED.")
+        return _counter
 
-    def states_init(self, state: str = "Scheduled") -> NoReturn:
+    def states_init(self, state: str = "Scheduled") -> int:
         """
-        Checks each flight record and sets state to Scheduled if it's null.
+        Sets state of every flight record with null state to Scheduled, with a single update.
         State argument defaults to **Scheduled**.
-        :return: None
+        :return: int, the number of Flight records changed
+        :raises AttributeError: for unknown state name
 
         *Created on 24 Dec 2023.*
         """
-        _counter: int = 0
-        state_value = self("select id from State where name = ?", (state,)).fetchone()[0]
-        flights: list = self("select * from Flight").fetchall()
-        for flight in flights:
-            if flight[6] is None:
-                _counter += 1
-                self("update Flight set state = ? where id = ?", (state_value, flight[0]))
+        _state = self("select id from State where name = ?", (state,)).fetchone()
+        if _state is None:
+            raise AttributeError(f"No state named {state} exists, check your spelling.")
+        with self.transaction():
+            _counter: int = self("update Flight set state = ? where state is null", (_state[0],)).rowcount
         if self._DEBUG:
             print(f"{_counter} FLIGHT STATES SET TO {state}.")
-        return
+        return _counter
 
     def update_schedule_timestamp(self, flight_code: str) -> NoReturn:
         """
@@ -410,25 +1715,29 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
     def table_tuples(self, table_name: str) -> list[tuple]:
         """
         Queries all columns of the specified table and returns a list of tuples.
+        For large tables iterate stream() or stream_records() instead.
         :return: list
+        :raises AttributeError: if passed table name not exists
 
         *Created on 25 Dec 2023.*
         """
-        return self("select * from ?", (table_name,)).fetchall()
+        if table_name not in self.tables:  # NOTE ------------------------------------- table names cannot be bound
+            raise AttributeError(f"No table named {table_name} exists, check your spelling.")
+        return list(self.stream(f"select * from {table_name}"))
 
     def random_airport_id(self) -> int:
         """
         Returns a random airport id, chosen from database.
         :return: int
         """
-        return _ch(self.table_tuples("Airport"))[0]
+        return self("select id from Airport order by random() limit 1").fetchone()[0]
 
     def random_airline_designator(self) -> str:
         """
         Returns a random airline designator, chosen from database.
         :return: int
         """
-        return _ch(self.table_tuples("Airline"))[2]
+        return self("select designator from Airline order by random() limit 1").fetchone()[0]
 
     @property
     def schedule_counter_by_airline(self) -> list[str]:
@@ -436,15 +1745,15 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
         Returns a list of the airlines that have flight schedules, counting the schedules of each one.
         :return: list
         """
-        return database("select airline, count() as schedule_count from ScheduleView "
-                        "group by airline order by schedule_count desc").fetchall()
+        return self("select airline, count() as schedule_count from ScheduleView "
+                    "group by airline order by schedule_count desc").fetchall()
 
     @property
     def schedules(self) -> str:
         _out: list[str] = list()
         _head: str = "FLIGHT ==== AIRLINE " + "=" * 21 + " FROM = TO " + "=" * 3 + " DEPARTURE ARRIVAL "
         _out.append(_head + "== WEEK DAYS " + "=" * 22 + " LAST MODIFICATION")
-        for schedule in self("select * from ScheduleView order by code").fetchall():
+        for schedule in self.stream("select * from ScheduleView order by code"):
             row: str = schedule[0] + " " * 6 + schedule[1] + " " * (30 - len(schedule[1]))
             row += schedule[2] + " " * 4 + str(schedule[3]) + " " * 4
             row += str(schedule[4]) + " " * 5 if schedule[4] is not None else "_" * 5 + " " * 5
@@ -455,11 +1764,302 @@ class Database(Callable[[str, _Parameters], Union[_sql.Cursor, _sql.DatabaseErro
         return "\n".join(element for element in _out)
 
 
-database: Optional[Database] = None
-try:
-    database = Database(DATABASE, debug=True, print_queries=False)  # NOTE ------- toggle debug info and query printing
-except _sql.OperationalError:
-    print(f"Couldn't find database in {DATABASE}, please check path in assets.constants.py")
+_database: Optional[Database] = None
+_database_lock: Lock = Lock()
+
+
+def _close_at_exit(reference: ref) -> NoReturn:
+    """
+    Protected function registered with atexit by Database, commits and closes a database still open at exit.
+    Module globals are not always finalized at interpreter exit, with NumPy loaded for instance, so pending writes
+    would be lost if closing was left to __del__.
+    """
+    _db: Optional[Database] = reference()
+    if _db is not None:
+        _db.__del__()
+    return
+
+
+class _Job:
+    """
+    Protected class for one statement of AsyncDatabase, that knows the connection it is running on, so that a
+    timeout or a cancellation interrupts that statement and no other one, and the future of its last run.
+    """
+
+    __slots__: tuple[str] = "_lock", "_connection", "cancelled", "future"
+
+    def __init__(self) -> NoReturn:
+        self._lock: Lock = Lock()
+        self._connection: Optional[_sql.Connection] = None
+        self.cancelled: bool = False
+        self.future: Optional[Any] = None  # NOTE ---------------------------------- asyncio future of the executor call
+        return
+
+    @contextmanager
+    def attached(self, connection: _sql.Connection) -> Iterator[_sql.Connection]:
+        with self._lock:
+            if self.cancelled:
+                raise _sql.OperationalError("interrupted")
+            self._connection = connection
+        try:
+            yield connection
+        finally:
+            with self._lock:
+                self._connection = None
+
+    def interrupt(self) -> NoReturn:
+        with self._lock:
+            self.cancelled = True
+            if self._connection is not None:
+                self._connection.interrupt()
+        return
+
+
+class AsyncDatabase:
+    """
+    Awaitable facade of Database for asyncio frontends. Queries run on a dedicated thread pool, each worker thread
+    with its own read-only connection, writes run one at a time on a writer thread through Database, which is
+    switched to pooled mode so that it can be shared by threads. Every call has a timeout, and a timed out or
+    cancelled call interrupts its statement with ``sqlite3.Connection.interrupt()``, so that it stops using the
+    database as well.
+
+    ``async with AsyncDatabase() as adb: rows = await adb.fetch("select * from Departure", timeout=2.0)``
+
+    *Created on 18 Oct 2026.*
+    """
+
+    __slots__: tuple[str] = "_database", "_path", "_readers", "_writer", "_local", "_connections", "_lock", "timeout"
+
+    def __init__(self, db: Optional[Database] = None, workers: int = 4, timeout: Optional[float] = 30.0) -> NoReturn:
+        """
+        Wraps ``db``, the database singleton if not given, with ``workers`` reader threads. Calls that do not pass
+        a timeout wait up to ``timeout`` seconds, None waits forever.
+        """
+        from concurrent.futures import ThreadPoolExecutor  # NOTE --------------- not imported until first needed
+        if workers < 1:
+            raise AttributeError(f"Number of workers must be a positive number, {workers} is not valid.")
+        self._database: Database = db if db is not None else _required()
+        if self._database._pool is None:
+            self._database.enable_pool()
+        self._path: str = self._database._path
+        self._readers = ThreadPoolExecutor(workers, thread_name_prefix="AsyncDatabaseReader")
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="AsyncDatabaseWriter")
+        self._local: local = local()
+        self._connections: list[_sql.Connection] = []
+        self._lock: Lock = Lock()
+        self.timeout: Optional[float] = timeout
+        return
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self.close()
+        return False
+
+    def _connect(self) -> _sql.Connection:
+        _connection = _sql.connect(self._path, check_same_thread=False, uri=self._path.startswith("file:"))
+        _connection.execute("pragma query_only = 1")
+        return _connection
+
+    def _reader(self) -> _sql.Connection:
+        """
+        Protected method that returns the read connection of the calling worker thread.
+        """
+        _connection: Optional[_sql.Connection] = getattr(self._local, "connection", None)
+        if _connection is None:
+            _connection = self._local.connection = self._connect()
+            with self._lock:
+                self._connections.append(_connection)
+        return _connection
+
+    async def _submit(self, executor, work: Callable[[_Job], Any], timeout: Optional[float],
+                      job: Optional[_Job] = None) -> Any:
+        """
+        Protected method that runs ``work`` on an executor and waits for it, interrupting its statement if the
+        timeout passes or the awaiting task is cancelled.
+        """
+        import asyncio
+        job = job or _Job()
+        _future = job.future = asyncio.get_running_loop().run_in_executor(executor, work, job)
+        try:
+            return await asyncio.wait_for(_future, timeout if timeout is not None else self.timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            job.interrupt()
+            raise
+
+    def _read(self, __sql: str, __parameters: _Parameters, size: Optional[int]) -> Callable[[_Job], list[tuple]]:
+        def _work(job: _Job) -> list[tuple]:
+            with job.attached(self._reader()) as _connection:
+                _cursor: _sql.Cursor = _connection.execute(__sql, __parameters)
+                return _cursor.fetchall() if size is None else _cursor.fetchmany(size)
+        return _work
+
+    def _write(self, __sql: str, __parameters: _Parameters) -> Callable[[_Job], int]:
+        def _work(job: _Job) -> int:
+            with self._database._pool.write_lock, job.attached(self._database._connection):
+                _result = self._database(__sql, __parameters)
+            if isinstance(_result, _sql.DatabaseError):
+                raise _result
+            return _result.rowcount
+        return _work
+
+    async def execute(self, __sql: str, __parameters: _Parameters = (), timeout: Optional[float] = None) -> int:
+        """
+        Executes a statement, writes on the writer thread through Database, which commits them, queries on a
+        reader thread.
+        :return: int, the number of rows changed, -1 for queries
+        :raises sqlite3.DatabaseError: also when the statement is interrupted
+        :raises TimeoutError:
+        """
+        if ConnectionPool.is_read(__sql):
+            await self._submit(self._readers, self._read(__sql, __parameters, 0), timeout)
+            return -1
+        return await self._submit(self._writer, self._write(__sql, __parameters), timeout)
+
+    async def fetch(self, __sql: str, __parameters: _Parameters = (), timeout: Optional[float] = None) -> list[tuple]:
+        """
+        Runs a query on a reader thread and returns all of its rows.
+        :return: list
+        :raises sqlite3.DatabaseError:
+        :raises TimeoutError:
+        """
+        return await self._submit(self._readers, self._read(__sql, __parameters, None), timeout)
+
+    async def fetchone(self, __sql: str, __parameters: _Parameters = (),
+                       timeout: Optional[float] = None) -> Optional[tuple]:
+        """
+        Runs a query on a reader thread and returns its first row, None if there is none.
+        :return: tuple
+        """
+        _rows: list[tuple] = await self._submit(self._readers, self._read(__sql, __parameters, 1), timeout)
+        return _rows[0] if _rows else None
+
+    async def stream(self, __sql: str, __parameters: _Parameters = (), chunk: int = 500,
+                     timeout: Optional[float] = None) -> AsyncIterator[tuple]:
+        """
+        Asynchronous generator of the rows of a query, read ``chunk`` rows at a time on a connection of its own,
+        so that the event loop serves other tasks between chunks and memory holds one chunk. The timeout applies
+        to each chunk. Closing the generator early closes the query.
+
+        ``async for row in adb.stream("select * from Flight"): ...``
+        :return: AsyncIterator
+        """
+        import asyncio
+        if chunk < 1:
+            raise AttributeError(f"Chunk size must be a positive number, {chunk} is not valid.")
+        _job: _Job = _Job()
+        _connection: _sql.Connection = await asyncio.get_running_loop().run_in_executor(
+            self._readers, self._connect)  # NOTE -------------------------------- opening the file blocks, off the loop
+        _cursor: Optional[_sql.Cursor] = None
+
+        def _first(job: _Job) -> list[tuple]:
+            nonlocal _cursor
+            with job.attached(_connection):
+                _cursor = _connection.execute(__sql, __parameters)
+                return _cursor.fetchmany(chunk)
+
+        def _next(job: _Job) -> list[tuple]:
+            with job.attached(_connection):
+                return _cursor.fetchmany(chunk)
+
+        try:
+            _rows: list[tuple] = await self._submit(self._readers, _first, timeout, _job)
+            while _rows:
+                for _row in _rows:
+                    yield _row
+                if len(_rows) < chunk:
+                    break
+                _rows = await self._submit(self._readers, _next, timeout, _job)
+        finally:
+            await self._close_stream(_connection, _job)
+
+    async def _close_stream(self, connection: _sql.Connection, job: _Job) -> NoReturn:
+        """
+        Protected method that closes the connection of a stream on a reader thread once its last statement has
+        returned, a timed out or cancelled one may still be running on its worker after it was interrupted.
+        """
+        import asyncio
+        if job.future is not None and not job.future.done():
+            await asyncio.wait((job.future,))
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._readers, connection.close)
+        except RuntimeError:  # NOTE ----------------------------------------------- executor shut down by close(), idle
+            connection.close()
+        return
+
+    def close(self) -> NoReturn:
+        """
+        Waits for the running statements and closes the worker threads and their connections.
+        """
+        self._readers.shutdown(wait=True, cancel_futures=True)
+        self._writer.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            for _connection in self._connections:
+                _connection.close()
+            self._connections.clear()
+        return
+
+
+def _instance() -> Optional[Database]:
+    """
+    Creates the Database singleton on first call and returns it, None if the database file cannot be opened.
+    """
+    global _database
+    if _database is not None:
+        return _database
+    with _database_lock:
+        if _database is None:
+            try:
+                _database = Database(DATABASE, debug=True, print_queries=False)  # NOTE - toggle debug info and queries
+            except _sql.OperationalError:
+                Database._EXISTS = False
+    return _database
+
+
+def _required() -> Database:
+    """
+    Returns the Database singleton, creating it on first call.
+    :raises sqlite3.OperationalError: if the database file cannot be opened
+    """
+    _db: Optional[Database] = _instance()
+    if _db is None:
+        raise _sql.OperationalError(f"Couldn't open database at {DATABASE}, please check path in assets.constants.py")
+    return _db
+
+
+class _LazyDatabase:
+    """
+    Protected stand-in for the Database singleton, that creates it on first use and forwards everything to it,
+    so that importing the module or the package does not open the database.
+
+    *Created on 18 Oct 2026.*
+    """
+
+    __slots__: tuple[str] = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_required(), name)
+
+    def __call__(self, __sql: str, __parameters: _Parameters = ()) -> Union[_sql.Cursor, _sql.DatabaseError]:
+        return _required()(__sql, __parameters)
+
+    def __enter__(self) -> Database:
+        return _required().__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        return _required().__exit__(exc_type, exc_val, exc_tb)
+
+    def __str__(self) -> str:
+        _db: Optional[Database] = _instance()
+        return str(_db) if _db is not None else f"{DATABASE} database, not opened"
+
+    def __bool__(self) -> bool:
+        return _instance() is not None
+
+
+database: Database = cast(Database, _LazyDatabase())  # NOTE ---- proxy typed as what it forwards to, connects when used
+
 
 if __name__ == "__main__":
-    print(database, database.tables)
+    print(_required(), _required().tables)
@@ -0,0 +1,144 @@
+"""
+Great-circle distances between many points at once: the haversine arc, kilometers and flight minutes of
+Coordinates.haversine_arc(), haversine_distance() and duration(), computed with NumPy for whole blocks of points,
+with the same latitude dependent earth radius of Coordinates.earth_radius().
+
+blocks() yields the distances of a few rows at a time, so that memory stays bounded for tens of thousands of points,
+class DistanceMatrix keeps the full N×N matrices of a CoordinateArray. Requires NumPy, Database.distances() imports
+this module only when called.
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "DistanceMatrix", "blocks", "arcs"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+from typing import Iterator, NoReturn, Optional, Union
+
+import numpy
+
+from assets.constants import EARTH_EQUATORIAL_RADIUS, LAND_SPEED
+from assets.models import CoordinateArray, Coordinates
+
+_Block = tuple[int, numpy.ndarray, numpy.ndarray, numpy.ndarray]  # NOTE ------------ first row, arc, km and minutes
+
+
+def _vectors(points: CoordinateArray) -> numpy.ndarray:
+    """
+    Protected function that returns the unit vectors of the points on the sphere, a 3×N matrix.
+    """
+    _lat, _long = (numpy.radians(_values) for _values in points.numpy)
+    _cos: numpy.ndarray = numpy.cos(_lat)
+    return numpy.stack((_cos * numpy.cos(_long), _cos * numpy.sin(_long), numpy.sin(_lat)))
+
+
+def arcs(vectors: numpy.ndarray, other_vectors: numpy.ndarray) -> numpy.ndarray:
+    """
+    Returns the matrix of arcs in radians between the columns of two matrices of unit vectors. The haversine of an
+    arc is the square of half the chord between its ends, so the arc is computed from the chord without
+    trigonometry per pair, and without the cancellation of dot products for near points.
+    """
+    _chord: numpy.ndarray = numpy.subtract(vectors[0, :, None], other_vectors[0])
+    numpy.square(_chord, out=_chord)
+    _scratch: numpy.ndarray = numpy.empty_like(_chord)
+    for _axis in (1, 2):
+        numpy.subtract(vectors[_axis, :, None], other_vectors[_axis], out=_scratch)
+        numpy.square(_scratch, out=_scratch)
+        _chord += _scratch
+    numpy.sqrt(_chord, out=_chord)
+    _chord *= 0.5
+    numpy.minimum(_chord, 1.0, out=_chord)  # NOTE --------------------------------------- rounding may step over one
+    numpy.arcsin(_chord, out=_chord)
+    _chord *= 2
+    return _chord
+
+
+def blocks(points: CoordinateArray, others: Optional[CoordinateArray] = None, rows: int = 256) -> Iterator[_Block]:
+    """
+    Generator of the distances from ``rows`` points at a time to all the ``others``, all the points if not given:
+    the first row of the block and matrices of arcs in degrees, kilometers and whole flight minutes, as
+    Coordinates.haversine_arc(), haversine_distance() and duration() compute them. Memory holds one block.
+
+    ``for first, arc, km, minutes in blocks(database.airport_locations()): ...``
+    :return: Iterator
+    :raises AttributeError: for invalid number of rows
+    """
+    if rows < 1:
+        raise AttributeError(f"Rows must be a positive number, {rows} is not valid.")
+    others = points if others is None else others
+    _vectors_of: numpy.ndarray = _vectors(points)
+    _other_vectors: numpy.ndarray = _vectors_of if others is points else _vectors(others)
+    _degrees: numpy.ndarray = points.numpy[0]
+    _other_degrees: numpy.ndarray = others.numpy[0]
+    for _first in range(0, len(points), rows):
+        _rows: slice = slice(_first, _first + rows)
+        _theta: numpy.ndarray = arcs(_vectors_of[:, _rows], _other_vectors)
+        _radius: numpy.ndarray = numpy.add(_degrees[_rows, None], _other_degrees)
+        _radius *= -21.3 / 180  # NOTE ------------------------------------ earth_radius() of the average latitude
+        _radius += EARTH_EQUATORIAL_RADIUS
+        _radius *= _theta
+        _arc: numpy.ndarray = numpy.degrees(_theta, out=_theta)
+        _minutes: numpy.ndarray = (_arc * (3600 / LAND_SPEED)).astype(numpy.int32)
+        yield _first, _arc, _radius, _minutes
+    return
+
+
+class DistanceMatrix:
+
+    __slots__: tuple[str] = "labels", "arc", "kilometers", "minutes", "_index"
+
+    def __init__(self, points: CoordinateArray, rows: int = 256, dtype: type = numpy.float64) -> NoReturn:
+        """
+        Full N×N matrices of arcs in degrees, kilometers and flight minutes between the points, filled block by
+        block, see blocks(). Pass dtype=numpy.float32 to halve the memory of the arc and kilometer matrices.
+
+        ``database.distances()["ATH", "SKG"]``
+
+        *Created on 18 Oct 2026.*
+        """
+        _size: int = len(points)
+        self.labels: list[str] = list(points.labels)
+        self.arc: numpy.ndarray = numpy.empty((_size, _size), dtype)
+        self.kilometers: numpy.ndarray = numpy.empty((_size, _size), dtype)
+        self.minutes: numpy.ndarray = numpy.empty((_size, _size), numpy.int32)
+        for _first, _arc, _kilometers, _minutes in blocks(points, rows=rows):
+            _rows: slice = slice(_first, _first + len(_arc))
+            self.arc[_rows], self.kilometers[_rows], self.minutes[_rows] = _arc, _kilometers, _minutes
+        self._index: dict[str, int] = {}
+        for _position, _label in enumerate(self.labels):
+            self._index.setdefault(_label, _position)
+        return
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __getitem__(self, pair: tuple[Union[str, int], Union[str, int]]) -> tuple[float, float, int]:
+        """
+        Returns arc, kilometers and minutes between two points, by label or index.
+        """
+        _a, _b = (self.index(_point) if isinstance(_point, str) else _point for _point in pair)
+        return float(self.arc[_a, _b]), float(self.kilometers[_a, _b]), int(self.minutes[_a, _b])
+
+    def index(self, label: str) -> int:
+        """
+        :raises KeyError: if no point has the label
+        """
+        if label not in self._index:
+            raise KeyError(f"No point is labeled {label}.")
+        return self._index[label]
+
+    def duration(self, a: Union[str, int], b: Union[str, int]) -> str:
+        """
+        Returns flight duration between two points, as Coordinates.duration() writes it.
+        """
+        return Coordinates.duration(self[a, b][0])
+
+    def measurements(self, a: Union[str, int], b: Union[str, int]) -> str:
+        """
+        Returns the same text as Airport.measurements() for the airports of two points.
+        """
+        _arc, _kilometers, _ = self[a, b]
+        _out: str = " " * 8 + f"{round(_arc, 6)}"
+        _out += " " * (24 - len(_out)) + f"{round(_kilometers, 4)}"
+        return _out + " " * (40 - len(_out)) + self.duration(a, b)
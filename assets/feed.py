@@ -0,0 +1,193 @@
+"""
+Change feed of the flight boards: triggers on Flight append one row to table FlightChange for every board a flight
+enters, leaves or changes in, and class ChangeFeed polls that table from a background thread, reads the current board
+rows of the changed flights once and passes them as BoardChange objects to its subscribers, so that any number of
+screens can patch their tables without querying the database themselves.
+
+Needs the materialized boards, see Database.install_boards() and Database.install_change_feed().
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "FEED_TABLES", "FEED_TRIGGERS", "BoardChange", "ChangeFeed"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+import sqlite3 as _sql
+from threading import Event, Lock, Thread
+from typing import Any, Callable, ClassVar, NoReturn, Optional
+
+from assets.boards import BOARD_COLUMNS, _CATEGORY, _TERMINAL
+
+_LIMIT: int = 10000  # NOTE ----------------------------------------------- changes kept, older ones are deleted
+_SAME_BOARD: str = f"{_CATEGORY.format('old')} = {_CATEGORY.format('new')} and " \
+                   f"{_TERMINAL.format('old')} = {_TERMINAL.format('new')}"
+
+
+def _log(reference: str, operation: str) -> str:
+    return (f"insert into FlightChange (flight, operation, category, terminal) values ({reference}.id, "
+            f"'{operation}', {_CATEGORY.format(reference)}, {_TERMINAL.format(reference)});")
+
+
+FEED_TABLES: dict[str, str] = {
+    "FlightChange": "create table if not exists FlightChange (id integer primary key autoincrement, "
+                    "flight integer not null, operation text not null, category text not null, "
+                    "terminal text not null, changed datetime default (strftime('%Y-%m-%d %H:%M:%f', 'now')))"}
+
+FEED_TRIGGERS: dict[str, str] = {
+    "_feed_flight_insert": f"create trigger if not exists _feed_flight_insert after insert on Flight begin "
+                           f"{_log('new', 'insert')} end",
+    "_feed_flight_delete": f"create trigger if not exists _feed_flight_delete after delete on Flight begin "
+                           f"{_log('old', 'delete')} end",
+    "_feed_flight_update": f"create trigger if not exists _feed_flight_update after update of code, from_airport, "
+                           f"to_airport, departure, arrival, state, check_in, gate_n, gate_t on Flight "
+                           f"when {_SAME_BOARD} begin {_log('new', 'update')} end",
+    "_feed_flight_move": f"create trigger if not exists _feed_flight_move after update of departure, arrival, gate_t "
+                         f"on Flight when not ({_SAME_BOARD}) begin {_log('old', 'delete')} {_log('new', 'insert')} "
+                         f"end",
+    "_feed_limit": f"create trigger if not exists _feed_limit after insert on FlightChange "
+                   f"when new.id % 1000 = 0 begin delete from FlightChange where id <= new.id - {_LIMIT}; end"}
+
+
+class BoardChange:
+
+    __slots__: tuple[str] = "id", "flight", "operation", "category", "terminal", "row"
+
+    def __init__(self, change_id: int, flight: int, operation: str, category: str, terminal: str,
+                 row: Optional[tuple]) -> NoReturn:
+        """
+        A flight that was inserted into, updated in or deleted from the board of (category, terminal), with its
+        current board row of BOARD_COLUMNS, None for deletions and flights the boards do not show.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.id: int = change_id
+        self.flight: int = flight
+        self.operation: str = operation
+        self.category: str = category
+        self.terminal: str = terminal
+        self.row: Optional[tuple] = row
+        return
+
+    def __str__(self) -> str:
+        return f"{self.operation.upper()} {self.category} {self.terminal} FLIGHT {self.flight}: {self.row}"
+
+    @property
+    def key(self) -> str:
+        """
+        Returns the board key used by scripts/flet_flights.py, category followed by terminal.
+        """
+        return self.category + self.terminal
+
+
+class ChangeFeed:
+
+    _BATCH: ClassVar[int] = 500
+
+    __slots__: tuple[str] = "_path", "_interval", "_subscribers", "_lock", "_stop", "_thread", "last_id", "polls"
+
+    def __init__(self, path: str, interval: float = 1.0) -> NoReturn:
+        """
+        Feed of the database at ``path``, polled every ``interval`` seconds through its own read-only connection
+        once start() is called. Changes made before start() are not passed on.
+
+        *Created on 18 Oct 2026.*
+        """
+        self._path: str = path if path.startswith("file:") else f"file:{path}?mode=ro"
+        self._interval: float = interval
+        self._subscribers: list[Callable[[list[BoardChange]], Any]] = []
+        self._lock: Lock = Lock()
+        self._stop: Event = Event()
+        self._thread: Optional[Thread] = None
+        self.last_id: Optional[int] = None
+        self.polls: int = 0
+        return
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, callback: Callable[[list[BoardChange]], Any]) -> Callable[[list[BoardChange]], Any]:
+        """
+        Adds a callable that receives each batch of changes, from the polling thread. Returns the callback, so
+        that it can be used as a decorator.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[list[BoardChange]], Any]) -> NoReturn:
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+        return
+
+    def poll(self, connection: _sql.Connection) -> list[BoardChange]:
+        """
+        Reads the changes after last_id and the current board rows of their flights, with two queries, and passes
+        them to the subscribers. The last change of each flight wins within a batch. A subscriber that raises is
+        reported and skipped, the other subscribers and the next batches are not affected.
+        """
+        self.polls += 1
+        if self.last_id is None:
+            self.last_id = connection.execute("select coalesce(max(id), 0) from FlightChange").fetchone()[0]
+            return []
+        _changes: list[tuple] = connection.execute("select id, flight, operation, category, terminal from "
+                                                   "FlightChange where id > ? order by id limit ?",
+                                                   (self.last_id, self._BATCH)).fetchall()
+        if not _changes:
+            return []
+        self.last_id = _changes[-1][0]
+        _flights: list[int] = list({_change[1] for _change in _changes})
+        _rows: dict[int, tuple] = {_row[0]: _row[1:] for _row in connection.execute(
+            f"select flight, {', '.join(BOARD_COLUMNS)} from Board where flight in ({', '.join('?' * len(_flights))})",
+            _flights)}
+        _latest: dict[tuple, BoardChange] = {}
+        for _id, _flight, _operation, _category, _terminal in _changes:
+            _row: Optional[tuple] = _rows.get(_flight) if _operation != "delete" else None
+            _latest[(_flight, _category, _terminal)] = BoardChange(
+                _id, _flight, _operation if _row is not None else "delete", _category, _terminal, _row)
+        _batch: list[BoardChange] = sorted(_latest.values(), key=lambda change: change.id)
+        with self._lock:
+            _subscribers: list[Callable] = list(self._subscribers)
+        for _subscriber in _subscribers:
+            try:
+                _subscriber(_batch)
+            except Exception as error:  # NOTE ----------------------- last_id has moved on, the batch is not read again
+                print(f"Change feed subscriber {getattr(_subscriber, '__qualname__', _subscriber)} failed:",
+                      repr(error))
+        return _batch
+
+    def _run(self) -> NoReturn:
+        _connection: _sql.Connection = _sql.connect(self._path, uri=True)
+        try:
+            while not self._stop.is_set():
+                try:
+                    while len(self.poll(_connection)) and not self._stop.is_set():
+                        pass  # NOTE ------------------------------------------- drains the backlog batch by batch
+                except _sql.DatabaseError as error:
+                    print("Change feed failed to poll. SQLite said:", error)
+                self._stop.wait(self._interval)
+        finally:
+            _connection.close()
+        return
+
+    def start(self) -> "ChangeFeed":
+        """
+        Starts the polling thread, a daemon thread that stops with the program or with stop().
+        """
+        if not self.running:
+            self._stop.clear()
+            self._thread = Thread(target=self._run, name="ChangeFeed", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> NoReturn:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return
@@ -0,0 +1,172 @@
+"""
+Gate allocation: class GateAllocator keeps, for every gate, the intervals it is held by flights, sorted and without
+overlaps, and gives each flight a free gate of the halls it may use, see Gate.halls(). A departure holds its
+gate from GATE_BEFORE_DEPARTURE minutes before it leaves, an arrival for GATE_AFTER_ARRIVAL minutes after it lands,
+and two flights at one gate are at least TURNAROUND_BUFFER minutes apart. Flights allocated together are taken in
+order of the time they take their gate, which needs as few gates as possible. The gate of each hall freed the
+longest ago comes first from a heap, gaps between the intervals of a gate are searched only when no hall allowed
+has a gate free after all its flights.
+
+Used by Database._expand() for new flights and by Database.allocate_gates().
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "GateAllocator",
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+from bisect import bisect_left
+from heapq import heapify, heappop, heappush
+from datetime import datetime as _dt
+from typing import Hashable, Iterable, NoReturn, Optional, Union
+
+from assets.constants import GATE_AFTER_ARRIVAL, GATE_BEFORE_DEPARTURE, TURNAROUND_BUFFER
+from assets.models import Gate
+from assets.network import minutes
+
+_Request = tuple[Hashable, Union[_dt, str], bool, bool]  # NOTE ------------------ key, time, departure, Schengen
+
+
+class GateAllocator:
+
+    __slots__: tuple[str] = ("gates", "before", "after", "buffer", "unassigned", "_index", "_halls", "_starts",
+                             "_ends", "_last", "_heaps", "_busy", "_first_start", "_last_end")
+
+    def __init__(self, gates: Optional[Iterable[Gate]] = None, before: int = GATE_BEFORE_DEPARTURE,
+                 after: int = GATE_AFTER_ARRIVAL, buffer: int = TURNAROUND_BUFFER) -> NoReturn:
+        """
+        Allocates ``gates``, all the gates of Gate.all() by default. Flights hold a gate ``before`` minutes before
+        their departure or ``after`` minutes after their arrival, ``buffer`` minutes apart from each other.
+
+        ``allocator.assign("2024-02-01 10:10", departure=True, schengen=True)``
+
+        *Created on 18 Oct 2026.*
+        """
+        self.gates: list[Gate] = list(gates) if gates is not None else Gate.all()
+        self.before, self.after, self.buffer = before, after, buffer
+        self.unassigned: int = 0
+        self._index: dict[tuple[str, int], int] = {(_gate.terminal, _gate.number): _position
+                                                   for _position, _gate in enumerate(self.gates)}
+        self._halls: dict[str, list[int]] = {}
+        for _position, _gate in enumerate(self.gates):
+            self._halls.setdefault(_gate.terminal, []).append(_position)
+        self._starts: list[list[int]] = [[] for _ in self.gates]  # NOTE -------------- held intervals of each gate
+        self._ends: list[list[int]] = [[] for _ in self.gates]
+        self._last: list[int] = [-self.buffer - 1 for _ in self.gates]  # NOTE ------------------ latest end of each
+        self._heaps: dict[str, list[tuple[int, int]]] = {}  # NOTE ------ (latest end, gate) of each hall, stale kept
+        for _hall, _gates in self._halls.items():
+            self._heaps[_hall] = [(self._last[_gate], _gate) for _gate in _gates]
+            heapify(self._heaps[_hall])
+        self._busy: list[int] = [0 for _ in self.gates]
+        self._first_start: Optional[int] = None
+        self._last_end: Optional[int] = None
+        return
+
+    def __len__(self) -> int:
+        return sum(len(_starts) for _starts in self._starts)
+
+    def interval(self, moment: Union[_dt, str], departure: bool) -> tuple[int, int]:
+        """
+        Returns the minutes a flight holds its gate, see assets.network.minutes().
+        """
+        _minutes: int = minutes(moment)
+        return (_minutes - self.before, _minutes) if departure else (_minutes, _minutes + self.after)
+
+    def free(self, gate: int, start: int, end: int) -> bool:
+        """
+        Tells if gate number ``gate`` of ``gates`` can be held from start to end with the buffer on both sides:
+        one comparison when the interval comes after all the others, a binary search otherwise.
+        """
+        if start >= self._last[gate] + self.buffer:
+            return True
+        _starts: list[int] = self._starts[gate]
+        _position: int = bisect_left(_starts, start)
+        if _position > 0 and self._ends[gate][_position - 1] + self.buffer > start:
+            return False
+        return _position == len(_starts) or _starts[_position] >= end + self.buffer
+
+    def _hold(self, gate: int, start: int, end: int) -> Gate:
+        _position: int = bisect_left(self._starts[gate], start)
+        self._starts[gate].insert(_position, start)
+        self._ends[gate].insert(_position, end)
+        if end > self._last[gate]:
+            self._last[gate] = end
+            heappush(self._heaps[self.gates[gate].terminal], (end, gate))
+        self._busy[gate] += end - start
+        self._first_start = start if self._first_start is None else min(self._first_start, start)
+        self._last_end = end if self._last_end is None else max(self._last_end, end)
+        return self.gates[gate]
+
+    def reserve(self, gate: Gate, moment: Union[_dt, str], departure: bool) -> bool:
+        """
+        Holds a given gate for a flight already allocated, the stored flights for instance, if it is free and
+        allocated by this object.
+        :return: bool, False if the gate is unknown or taken
+        """
+        _gate: Optional[int] = self._index.get((gate.terminal, gate.number))
+        _start, _end = self.interval(moment, departure)
+        if _gate is None or not self.free(_gate, _start, _end):
+            return False
+        self._hold(_gate, _start, _end)
+        return True
+
+    def assign(self, moment: Union[_dt, str], departure: bool, schengen: bool) -> Optional[Gate]:
+        """
+        Holds and returns a free gate of the halls a flight may use, None if all of them are taken.
+        """
+        return self._assign(*self.interval(moment, departure), schengen)
+
+    def _assign(self, start: int, end: int, schengen: bool) -> Optional[Gate]:
+        _halls: tuple[str, ...] = Gate.halls(schengen)
+        for _hall in _halls:
+            _heap: list[tuple[int, int]] = self._heaps.get(_hall, [])
+            while _heap and _heap[0][0] != self._last[_heap[0][1]]:
+                heappop(_heap)
+            if _heap and start >= _heap[0][0] + self.buffer:
+                return self._hold(_heap[0][1], start, end)
+        for _hall in _halls:  # NOTE ---------------------------- every gate is held later, look for a gap between
+            for _gate in self._halls.get(_hall, ()):
+                if self.free(_gate, start, end):
+                    return self._hold(_gate, start, end)
+        self.unassigned += 1
+        return None
+
+    def allocate(self, requests: Iterable[_Request]) -> dict[Hashable, Optional[Gate]]:
+        """
+        Assigns gates to (key, time, departure, Schengen) requests in order of the time they take their gate and
+        returns the gate of each key, None for flights no gate was free for.
+        :return: dict
+        """
+        _requests: list[tuple[tuple[int, int], Hashable, bool]] = [
+            (self.interval(_moment, _departure), _key, _schengen) for _key, _moment, _departure, _schengen in requests]
+        _requests.sort(key=lambda request: request[0])
+        return {_key: self._assign(_start, _end, _schengen) for (_start, _end), _key, _schengen in _requests}
+
+    def utilization(self) -> dict[str, float]:
+        """
+        Returns the fraction of the allocated period each gate is held, by gate name.
+        :return: dict
+        """
+        _period: int = (self._last_end - self._first_start) if self._first_start is not None else 0
+        return {str(_gate): self._busy[_position] / _period if _period else 0.0
+                for _position, _gate in enumerate(self.gates)}
+
+    def report(self) -> str:
+        """
+        Returns flights, held hours and utilization of each hall, and the flights no gate was free for.
+        """
+        _utilization: dict[str, float] = self.utilization()
+        _out: list[str] = ["=" * 8 + " HALL " + "=" * 4 + " GATES " + "=" * 4 + " FLIGHTS " + "=" * 4 + " HOURS "
+                           + "=" * 4 + " UTILIZATION " + "=" * 4 + " BUSIEST"]
+        for _hall, _gates in self._halls.items():
+            _flights: int = sum(len(self._starts[_gate]) for _gate in _gates)
+            _hours: float = sum(self._busy[_gate] for _gate in _gates) / 60
+            _share: float = sum(_utilization[str(self.gates[_gate])] for _gate in _gates) / len(_gates)
+            _busiest: Gate = self.gates[max(_gates, key=lambda gate: self._busy[gate])]
+            _out.append(" " * 8 + f"{_hall:<10}{len(_gates):>7}{_flights:>13}{_hours:>11.1f}{_share:>17.1%}"
+                        f"{' ' * 8}{_busiest} {_utilization[str(_busiest)]:.1%}")
+        return "\n".join(_out) + f"\n{len(self)} FLIGHTS AT GATES, {self.unassigned} WITHOUT GATE"
+
+    def __str__(self) -> str:
+        return self.report()
@@ -0,0 +1,156 @@
+"""
+Compiled row hydration: class Hydrator turns the rows of a query straight into record objects of assets.models with
+a function generated once per model and column list, from the table columns of ``pragma table_info``, the column
+names of the query and the model ``__slots__``. Database installs the function as the ``row_factory`` of the query's
+cursor, see Database.hydrator() and Database.stream_records().
+
+Trusted hydrators assign the slots directly, skipping the constructor checks, ``strptime`` and Employee file loading,
+for rows the application has written itself. The other ones call the model constructor, like ``Model.db(row)``.
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "HYDRATION", "Hydrator"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+from datetime import datetime as _dt, timezone as _t_zone, timedelta as _timed
+from functools import lru_cache
+from inspect import signature
+from re import compile as _compile
+from threading import Lock
+from typing import Any, Callable, ClassVar, NoReturn, Optional, Sequence
+
+from assets import models
+
+_COLUMN = _compile(r"{(\w+)}")
+
+HYDRATION: dict[str, dict[str, str]] = {  # NOTE ------ model qualified name: slot: expression of {column} names
+    "Airport": {"iata": "{IATA}", "timezone": "_zone({timezone})", "description": "''", "runways": "[]",
+                "location": "_location({lat}, {long}, {IATA})"},
+    "Airport.Runway": {"airport_id": "{airport}"},
+    "Schedule": {"departure": "_datetime({departure})", "arrival": "_datetime({arrival})", "_days": "{days}",
+                 "modified": "_datetime({modified})", "active": "bool({active})"},
+    "Flight": {"flight_id": "{id}", "gate_number": "{gate_n}", "gate_terminal": "{gate_t}"},
+    "Employee": {"ssn": "{SSN}", "name": "_name({first_name} or '', {middle_name} or '', {last_name} or '')",
+                 "contact": "_contact({telephone}, {email})",  # NOTE ---------------- normalizes the telephone
+                 "address": "_address({street}, {number}, {town}, {postal_code})",
+                 "birth_date": "_datetime({birth_date}) if {birth_date} else None"}}
+
+
+def _datetime(value: Optional[str]) -> Optional[_dt]:
+    return None if value is None else _dt.fromisoformat(value)
+
+
+@lru_cache(maxsize=32)
+def _zone(hours: int) -> _t_zone:
+    return _t_zone(_timed(hours=hours))
+
+
+def _filler(model: type) -> Callable[..., Any]:
+    """
+    Returns a function that builds a ``model`` object from its slot values, without calling its constructor or
+    its ``__setattr__``.
+    """
+    _namespace: dict[str, Any] = {"_model": model, "_new": object.__new__}
+    _lines: list[str] = [f"def _fill({', '.join(model.__slots__)}):", "    _object = _new(_model)"]
+    for _number, _slot in enumerate(model.__slots__):
+        if model.__setattr__ is object.__setattr__:
+            _lines.append(f"    _object.{_slot} = {_slot}")
+        else:
+            _namespace[f"_set_{_number}"] = getattr(model, _slot).__set__
+            _lines.append(f"    _set_{_number}(_object, {_slot})")
+    exec("\n".join(_lines + ["    return _object"]), _namespace)
+    return _namespace["_fill"]
+
+
+_coordinate: Callable[..., models.Coordinate] = _filler(models.Coordinate)
+_coordinates: Callable[..., models.Coordinates] = _filler(models.Coordinates)
+_LATITUDINAL: models.CoordinateType = models.CoordinateType.LATITUDINAL
+_LONGITUDINAL: models.CoordinateType = models.CoordinateType.LONGITUDINAL
+
+
+def _location(lat: float, long: float, label: Optional[str]) -> models.Coordinates:
+    """
+    Returns the Coordinates that ``Coordinates(lat, long, label)`` builds from numbers, without the range checks.
+    """
+    return _coordinates(_coordinate(float(lat), _LATITUDINAL, ""), _coordinate(float(long), _LONGITUDINAL, ""),
+                        label or "")
+
+
+_NAMESPACE: dict[str, Any] = {"_datetime": _datetime, "_zone": _zone, "_location": _location,
+                              "_name": _filler(models.Employee.Name), "_contact": models.Employee.Contact,
+                              "_address": _filler(models.Employee.Address)}
+
+
+class Hydrator:
+
+    _COMPILED: ClassVar[dict[tuple, "Hydrator"]] = {}
+    _LOCK: ClassVar[Lock] = Lock()
+
+    __slots__: tuple[str] = "model", "columns", "trusted", "source", "function"
+
+    def __init__(self, model: type, table: Sequence[str], columns: Sequence[str], trusted: bool = True) -> NoReturn:
+        """
+        Compiles the hydrator of ``model`` for rows of ``columns``, the column names of a query on its ``table``
+        columns, at any order. Columns the query lacks become None, columns the model does not know are ignored.
+        ``function(cursor, row)`` is the compiled row factory, call the object itself for plain tuples.
+
+        *Created on 18 Oct 2026.*
+        """
+        if not (isinstance(model, type) and issubclass(model, models._DatabaseRecord)):
+            raise AttributeError(f"{model} is not a database record class.")
+        self.model: type = model
+        self.columns: tuple[str] = tuple(columns)
+        self.trusted: bool = trusted
+        _index: dict[str, int] = {}
+        for _position, _column in enumerate(self.columns):
+            _index.setdefault(_column.lower(), _position)
+
+        def _value(column: str) -> str:
+            return f"row[{_index[column.lower()]}]" if column.lower() in _index else "None"
+
+        _namespace: dict[str, Any] = dict(_NAMESPACE, _model=model, _new=object.__new__)
+        if trusted:
+            _rules: dict[str, str] = HYDRATION.get(model.__qualname__, {})
+            _plain: bool = model.__setattr__ is object.__setattr__  # NOTE --------- else slots are set by descriptor
+            _lines: list[str] = ["def _hydrate(cursor, row):", "    _object = _new(_model)"]
+            for _number, _slot in enumerate(model.__slots__):
+                _expression: str = _COLUMN.sub(lambda match: _value(match.group(1)),
+                                               _rules.get(_slot, "{" + _slot + "}"))
+                if _plain:
+                    _lines.append(f"    _object.{_slot} = {_expression}")
+                else:
+                    _namespace[f"_set_{_number}"] = getattr(model, _slot).__set__
+                    _lines.append(f"    _set_{_number}(_object, {_expression})")
+            _lines.append("    return _object")
+        else:  # NOTE ------------------------------------------ constructor arguments are the table columns in order
+            _arity: int = len(signature(model.__init__).parameters) - 1
+            _arguments: str = ", ".join(_value(_column) for _column in list(table)[:_arity])
+            _lines: list[str] = ["def _hydrate(cursor, row):", f"    return _model({_arguments})"]
+        self.source: str = "\n".join(_lines)
+        exec(compile(self.source, f"<hydrator {model.__qualname__}>", "exec"), _namespace)
+        self.function: Callable[[Any, tuple], models._DatabaseRecord] = _namespace["_hydrate"]
+        return
+
+    def __call__(self, row: Sequence) -> models._DatabaseRecord:
+        return self.function(None, row)
+
+    def __str__(self) -> str:
+        return self.source
+
+    @classmethod
+    def get(cls, model: type, columns: Optional[Sequence[str]], trusted: bool,
+            table: Callable[[], Sequence[str]]) -> "Hydrator":
+        """
+        Returns the hydrator of ``model`` for ``columns``, compiled on first use. ``table`` is called on first use
+        to get the table columns, which are also the columns when ``columns`` is None.
+        """
+        _key: tuple = model, None if columns is None else tuple(columns), trusted
+        _hydrator: Optional[Hydrator] = cls._COMPILED.get(_key)
+        if _hydrator is None:
+            _table: list[str] = list(table())
+            _hydrator = Hydrator(model, _table, _table if columns is None else columns, trusted)
+            with cls._LOCK:
+                _hydrator = cls._COMPILED.setdefault(_key, _hydrator)
+        return _hydrator
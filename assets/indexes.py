@@ -0,0 +1,267 @@
+"""
+Managed index set of the airport database and class IndexAdvisor, which captures the statements Database executes,
+plans them with ``explain query plan`` against an in-memory copy of the schema, with and without the candidate indexes
+of INDEXES, and proposes the candidates the planner actually uses or, when asked to measure, the candidates that
+make the workload faster on an in-memory copy of the data.
+
+The real database is only read by the advisor, indexes are created by Database.install_indexes().
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "INDEXES", "IndexAdvisor", "IndexAdvice"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+import sqlite3 as _sql
+from contextlib import closing
+from statistics import median
+from threading import Lock
+from time import perf_counter
+from typing import Any, ClassVar, Iterable, NoReturn, Optional
+
+from assets.instrumentation import QueryEvent, fingerprint
+
+INDEXES: dict[str, str] = {  # NOTE ------------------------------------------------------ name: create index statement
+    "_index_flight_code": "create index if not exists _index_flight_code on Flight (code)",
+    "_index_flight_departure": "create index if not exists _index_flight_departure on Flight "  # NOTE -- Departure view
+                               "(departure, code, to_airport, state, check_in, gate_n, gate_t) "
+                               "where departure is not null",
+    "_index_flight_arrival": "create index if not exists _index_flight_arrival on Flight "  # NOTE ------- Arrival view
+                             "(arrival, code, from_airport, state, check_in, gate_n, gate_t) where arrival is not null",
+    "_index_flight_terminal": "create index if not exists _index_flight_terminal on Flight (gate_t)",
+    "_index_flight_airline": "create index if not exists _index_flight_airline on Flight (substr(code, 1, 2))",
+    "_index_flight_from_airport": "create index if not exists _index_flight_from_airport on Flight "
+                                  "(from_airport, departure)",
+    "_index_airline_designator": "create index if not exists _index_airline_designator on Airline (designator)",
+    "_index_airplane_airline": "create index if not exists _index_airplane_airline on Airplane (airline)"}
+
+
+class IndexAdvice:
+
+    __slots__: tuple[str] = "before", "after", "proposed", "workload", "timings"
+
+    def __init__(self, before: dict[str, list[str]], after: dict[str, list[str]], proposed: list[str],
+                 workload: dict[str, list], timings: Optional[dict[str, tuple[float, float]]] = None) -> NoReturn:
+        """
+        Returned by IndexAdvisor.advise(): query plans by fingerprint without and with the candidate indexes,
+        the candidates proposed, the captured workload (statement, parameters, calls, seconds) and, if advise() has
+        measured them, the median seconds of each statement without and with the candidates.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.before: dict[str, list[str]] = before
+        self.after: dict[str, list[str]] = after
+        self.proposed: list[str] = proposed
+        self.workload: dict[str, list] = workload
+        self.timings: dict[str, tuple[float, float]] = timings or {}
+        return
+
+    def __str__(self) -> str:
+        _out: list[str] = [f"INDEX ADVICE FOR {len(self.workload)} STATEMENTS, PROPOSED: "
+                           f"{', '.join(self.proposed) if self.proposed else 'NONE'}"]
+        for _fingerprint, (_, _, calls, seconds) in sorted(self.workload.items(), key=lambda item: -item[1][3]):
+            if self.before[_fingerprint] == self.after[_fingerprint]:
+                continue
+            _out.append(f"{calls:6} CALLS {seconds * 1000:10.3f} ms  {_fingerprint[:90]}")
+            if _fingerprint in self.timings:
+                _out.append(" " * 8 + "MEASURED {:.3f} ms BEFORE, {:.3f} ms AFTER".format(
+                    *(_seconds * 1000 for _seconds in self.timings[_fingerprint])))
+            _out.extend(" " * 8 + "BEFORE  " + _detail for _detail in self.before[_fingerprint])
+            _out.extend(" " * 8 + "AFTER   " + _detail for _detail in self.after[_fingerprint])
+        return "\n".join(_out)
+
+    @property
+    def changed(self) -> list[str]:
+        """
+        Returns the fingerprints whose plan changes with the proposed indexes.
+        """
+        return [_fingerprint for _fingerprint in self.workload if self.before[_fingerprint] != self.after[_fingerprint]]
+
+    @property
+    def scans(self) -> dict[str, int]:
+        """
+        Returns the number of full table scans and temporary b-trees in the workload, without and with the indexes.
+        """
+        def _count(plans: dict[str, list[str]]) -> int:
+            return sum(IndexAdvisor.is_scan(_detail) for _plan in plans.values() for _detail in _plan)
+        return {"before": _count(self.before), "after": _count(self.after)}
+
+
+class IndexAdvisor:
+
+    _VERBS: ClassVar[tuple[str]] = "select", "with", "update", "delete"
+
+    __slots__: tuple[str] = "_path", "_catalog", "_workload", "_lock"
+
+    def __init__(self, path: str, catalog: Optional[dict[str, str]] = None) -> NoReturn:
+        """
+        Advisor for the database at ``path``, choosing among the create index statements of ``catalog``, INDEXES
+        if it is not given. Pass capture() as a hook of Database instrumentation, or add() statements by hand.
+
+        *Created on 18 Oct 2026.*
+        """
+        self._path: str = path if path.startswith("file:") else f"file:{path}?mode=ro"
+        self._catalog: dict[str, str] = INDEXES if catalog is None else catalog
+        self._workload: dict[str, list] = {}  # NOTE -------------------- fingerprint: [sql, parameters, calls, seconds]
+        self._lock: Lock = Lock()
+        return
+
+    def __len__(self) -> int:
+        return len(self._workload)
+
+    @staticmethod
+    def is_scan(detail: str) -> bool:
+        """
+        Returns True for plan steps reading a whole table or sorting into a temporary b-tree.
+        """
+        return (detail.startswith("SCAN ") and " INDEX " not in detail) or detail.startswith("USE TEMP B-TREE")
+
+    def add(self, sql: str, parameters: Any = (), seconds: float = 0.0) -> NoReturn:
+        """
+        Adds a statement to the workload, statements with the same fingerprint are counted together.
+        """
+        if sql.lstrip().split(None, 1)[0].lower() not in self._VERBS:
+            return
+        with self._lock:
+            _entry: Optional[list] = self._workload.get(_fingerprint := fingerprint(sql))
+            if _entry is None:
+                self._workload[_fingerprint] = [sql, parameters, 1, seconds]
+            else:
+                _entry[2] += 1
+                _entry[3] += seconds
+        return
+
+    def capture(self, event: QueryEvent) -> NoReturn:
+        """
+        Instrumentation hook, adds each successful statement to the workload.
+        """
+        if event.error is None:
+            self.add(event.sql, event.parameters, event.seconds)
+        return
+
+    def _copy(self, indexes: Iterable[str] = (), data: bool = False) -> _sql.Connection:
+        """
+        Protected method that copies the database to memory and creates ``indexes`` there, so that plans can be
+        compared without writing to the database. Without data only the schema and the statistics are copied,
+        which is enough for the planner and builds no index on real rows.
+        """
+        _memory: _sql.Connection = _sql.connect(":memory:")
+        _statistics: list[tuple] = []
+        with closing(_sql.connect(self._path, uri=True)) as _source:
+            if data:
+                _source.backup(_memory)
+            else:
+                for (_statement,) in _source.execute("select sql from sqlite_master where sql is not null and "
+                                                     "name not like 'sqlite\\_%' escape '\\' "
+                                                     "order by type != 'table', rowid"):
+                    _memory.execute(_statement)
+                if _source.execute("select 1 from sqlite_master where name = 'sqlite_stat1'").fetchone():
+                    _statistics = _source.execute("select tbl, idx, stat from sqlite_stat1").fetchall()
+        for _statement in indexes:
+            _memory.execute(_statement)
+        if data:
+            _memory.execute("analyze")
+        elif _statistics:
+            _memory.execute("analyze")
+            _memory.execute("delete from sqlite_stat1")
+            _memory.executemany("insert into sqlite_stat1 values (?, ?, ?)", _statistics)
+            _memory.execute("analyze sqlite_schema")  # NOTE ------------------------------------ reloads statistics
+        return _memory
+
+    @property
+    def workload(self) -> dict[str, list]:
+        """
+        Returns a copy of the captured workload: statement, parameters, calls and seconds by fingerprint.
+        """
+        with self._lock:
+            return {_key: list(_value) for _key, _value in self._workload.items()}
+
+    @staticmethod
+    def _plans(connection: _sql.Connection, workload: dict[str, list]) -> dict[str, list[str]]:
+        _plans: dict[str, list[str]] = {}
+        for _fingerprint, (sql, parameters, _, _) in workload.items():
+            try:
+                _plans[_fingerprint] = [_row[3] for _row in connection.execute("explain query plan " + sql,
+                                                                                parameters)]
+            except _sql.DatabaseError as error:
+                _plans[_fingerprint] = [f"NOT PLANNED: {error}"]
+        return _plans
+
+    @staticmethod
+    def _timings(connection: _sql.Connection, workload: dict[str, list], repeat: int) -> dict[str, float]:
+        _timings: dict[str, float] = {}
+        for _fingerprint, (sql, parameters, _, _) in workload.items():
+            _runs: list[float] = []
+            for _ in range(repeat):
+                _start: float = perf_counter()
+                try:
+                    connection.execute(sql, parameters).fetchall()
+                except _sql.DatabaseError:
+                    pass
+                _runs.append(perf_counter() - _start)
+                connection.rollback()  # NOTE --------------------------------- updates and deletes change the copy
+            _timings[_fingerprint] = median(_runs)
+        return _timings
+
+    def plans(self, indexes: Iterable[str] = (), workload: Optional[dict[str, list]] = None) -> dict[str, list[str]]:
+        """
+        Returns the query plan steps of every statement of the workload, by fingerprint, with ``indexes`` created.
+        """
+        with closing(self._copy(indexes)) as _memory:
+            return self._plans(_memory, self.workload if workload is None else workload)
+
+    @staticmethod
+    def _chosen(names: Iterable[str], before: dict[str, list[str]], after: dict[str, list[str]]) -> list[str]:
+        """
+        Protected method that returns the candidates among ``names`` that the planner uses in ``after`` for at least
+        one statement and that no plan of ``before`` uses already.
+        """
+        return [_name for _name in names if any(_name in _d.split() for _plan in after.values() for _d in _plan) and
+                not any(_name in _d.split() for _plan in before.values() for _d in _plan)]
+
+    def advise(self, names: Optional[Iterable[str]] = None, measure: bool = False, repeat: int = 5) -> IndexAdvice:
+        """
+        Plans the workload without and with the candidate indexes, all of the catalog or the given ``names``,
+        and proposes the candidates that the planner chooses for at least one statement.
+        Pass measure=True to run the workload ``repeat`` times on an in-memory copy of the data as well, without and
+        with the candidates: candidates used by a statement that got slower, speedup below 1.0, are dropped and the
+        rest measured again until none is, so that plans and timings of the advice are those of the proposed set.
+        The copy holds the whole database in memory, for large files use the plans only.
+        :return: IndexAdvice
+        """
+        _names: list[str] = list(self._catalog) if names is None else list(names)
+        for _name in _names:
+            if _name not in self._catalog:
+                raise AttributeError(f"Index {_name} is not in the catalog, check your spelling.")
+        _workload: dict[str, list] = self.workload
+        if not measure:
+            _before: dict[str, list[str]] = self.plans(workload=_workload)
+            _after: dict[str, list[str]] = self.plans((self._catalog[_name] for _name in _names), _workload)
+            return IndexAdvice(_before, _after, self._chosen(_names, _before, _after), _workload)
+        with closing(self._copy(data=True)) as _memory:
+            _before: dict[str, list[str]] = self._plans(_memory, _workload)
+            _seconds: dict[str, float] = self._timings(_memory, _workload, repeat)
+            _installed: set[str] = {_row[0] for _row in _memory.execute(
+                "select name from sqlite_master where type = 'index'")}
+            _proposed: list[str] = [_name for _name in _names if _name not in _installed]
+            for _name in _proposed:
+                _memory.execute(self._catalog[_name])
+            while True:  # NOTE --------------------------------------------- ends at the latest with no candidate left
+                _memory.execute("analyze")
+                _after: dict[str, list[str]] = self._plans(_memory, _workload)
+                _dropped: list[str] = [_name for _name in _proposed
+                                       if _name not in self._chosen(_proposed, _before, _after)]
+                if not _dropped:
+                    _timings: dict[str, tuple[float, float]] = {
+                        _key: (_seconds[_key], _value) for _key, _value in
+                        self._timings(_memory, _workload, repeat).items()}
+                    _dropped = [_name for _name in _proposed if any(
+                        _timings[_key][1] > _timings[_key][0] for _key, _plan in _after.items()
+                        if any(_name in _d.split() for _d in _plan))]
+                    if not _dropped:
+                        break
+                for _name in _dropped:
+                    _memory.execute(f"drop index if exists {_name}")
+                _proposed = [_name for _name in _proposed if _name not in _dropped]
+        return IndexAdvice(_before, _after, _proposed, _workload, _timings)
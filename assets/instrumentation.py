@@ -0,0 +1,327 @@
+"""
+Class Instrumentation records every statement Database executes: wall time of execution and fetching, rows returned
+or changed and a normalized SQL fingerprint. It keeps a latency histogram per fingerprint, logs statements slower
+than a threshold and passes each QueryEvent to the hooks added with add_hook().
+
+Statements are measured by InstrumentedCursor, the cursor class Database uses after instrument() is called.
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "Instrumentation", "InstrumentedCursor", "QueryEvent", "Histogram", "fingerprint"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+import sqlite3 as _sql
+from collections import deque
+from datetime import datetime as _dt
+from functools import lru_cache, partial
+from math import frexp
+from re import compile as _compile, IGNORECASE
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, ClassVar, Iterator, NoReturn, Optional
+from weakref import WeakSet
+
+_LITERALS = (
+    (_compile(r"'(?:[^']|'')*'"), "?"),  # NOTE --------------------------------------------------------- strings
+    (_compile(r"\bx'[0-9a-f]*'", IGNORECASE), "?"),  # NOTE ------------------------------------------------- blobs
+    (_compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", IGNORECASE), "?"),  # NOTE --------------------- numbers
+    (_compile(r"\?\s*(?:,\s*\?\s*)+"), "?, ..."),  # NOTE ------------------------------------ lists of any length
+    (_compile(r"\s+"), " "))
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(sql: str) -> str:
+    """
+    Returns the statement with literals replaced by placeholders, lists collapsed and whitespace normalized, so that
+    statements differing only in their values share one fingerprint.
+    """
+    for _pattern, _replacement in _LITERALS:
+        sql = _pattern.sub(_replacement, sql)
+    return sql.strip().rstrip(";").lower()
+
+
+class Histogram:
+
+    _BUCKETS: ClassVar[int] = 28  # NOTE ------------------------------------- 1 microsecond to 2 ** 27 µs, about 134 s
+
+    __slots__: tuple[str] = "counts", "count", "total", "minimum", "maximum"
+
+    def __init__(self) -> NoReturn:
+        """
+        Latency histogram with logarithmic buckets, bucket k counts durations up to 2 ** k microseconds.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.counts: list[int] = [0] * self._BUCKETS
+        self.count: int = 0
+        self.total: float = 0.0
+        self.minimum: float = float("inf")
+        self.maximum: float = 0.0
+        return
+
+    def __str__(self) -> str:
+        return (f"{self.count} CALLS, MEAN {self.mean * 1000:.3f} ms, P50 {self.percentile(50) * 1000:.3f} ms, "
+                f"P95 {self.percentile(95) * 1000:.3f} ms, MAX {self.maximum * 1000:.3f} ms")
+
+    def add(self, seconds: float) -> NoReturn:
+        self.counts[min(max(frexp(seconds * 1e6)[1], 0), self._BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+        return
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns an upper estimate of the duration below which ``percent`` per cent of the calls fall, in seconds.
+        """
+        if not self.count:
+            return 0.0
+        _rank: float = self.count * percent / 100
+        _cumulative: int = 0
+        for _bucket, _count in enumerate(self.counts):
+            _cumulative += _count
+            if _cumulative >= _rank:
+                return min(2 ** _bucket / 1e6, self.maximum)
+        return self.maximum
+
+
+class QueryEvent:
+
+    __slots__: tuple[str] = "sql", "parameters", "fingerprint", "seconds", "rows", "error", "started"
+
+    def __init__(self, sql: str, parameters: Any, seconds: float = 0.0, rows: int = 0,
+                 error: Optional[Exception] = None) -> NoReturn:
+        """
+        One executed statement: its SQL, parameters and fingerprint, seconds spent executing and fetching, rows
+        returned by a query or changed by a write, and the error it raised if any. Passed to the hooks.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.sql: str = sql
+        self.parameters: Any = parameters
+        self.fingerprint: str = fingerprint(sql)
+        self.seconds: float = seconds
+        self.rows: int = rows
+        self.error: Optional[Exception] = error
+        self.started: _dt = _dt.now()
+        return
+
+    def __str__(self) -> str:
+        _out: str = f"{self.started:%Y-%m-%d %H:%M:%S}  {self.seconds * 1000:10.3f} ms  {self.rows:8} ROWS  "
+        return _out + " ".join(self.sql.split()) + (f"  FAILED: {self.error}" if self.error else str())
+
+
+class _Statistics:
+    """
+    Protected class with the counters Instrumentation keeps for each fingerprint.
+    """
+
+    __slots__: tuple[str] = "histogram", "rows", "errors"
+
+    def __init__(self) -> NoReturn:
+        self.histogram: Histogram = Histogram()
+        self.rows: int = 0
+        self.errors: int = 0
+        return
+
+
+class Instrumentation:
+
+    __slots__: tuple[str] = ("_statistics", "_hooks", "_lock", "_cursors", "slow_seconds", "slow_log",
+                             "log_path", "report_on_close")
+
+    def __init__(self, slow_seconds: float = 0.1, log_path: Optional[str] = None, report_on_close: bool = True,
+                 slow_entries: int = 100) -> NoReturn:
+        """
+        Statements that take longer than ``slow_seconds`` are kept at ``slow_log``, the last ``slow_entries`` of them,
+        and appended to the file at ``log_path`` if given. Pass report_on_close=False to stop Database from printing
+        report() when it is closed.
+
+        *Created on 18 Oct 2026.*
+        """
+        self._statistics: dict[str, _Statistics] = {}
+        self._hooks: list[Callable[[QueryEvent], Any]] = []
+        self._lock: Lock = Lock()
+        self._cursors: WeakSet[InstrumentedCursor] = WeakSet()
+        self.slow_seconds: float = slow_seconds
+        self.slow_log: deque[QueryEvent] = deque(maxlen=slow_entries)
+        self.log_path: Optional[str] = log_path
+        self.report_on_close: bool = report_on_close
+        return
+
+    def __str__(self) -> str:
+        return self.report()
+
+    def __getitem__(self, sql: str) -> Histogram:
+        """
+        Returns the latency histogram of the fingerprint of a statement.
+        """
+        return self._statistics[fingerprint(sql)].histogram
+
+    @property
+    def cursor(self) -> Callable[[_sql.Connection], "InstrumentedCursor"]:
+        """
+        Returns the factory to pass to ``sqlite3.Connection.cursor()`` for cursors reporting to this object.
+        """
+        return partial(InstrumentedCursor, instrumentation=self)
+
+    def add_hook(self, hook: Callable[[QueryEvent], Any]) -> Callable[[QueryEvent], Any]:
+        """
+        Adds a callable that receives the QueryEvent of every statement once it is executed and fetched.
+        Returns the hook, so that it can be used as a decorator.
+        """
+        self._hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: Callable[[QueryEvent], Any]) -> NoReturn:
+        self._hooks.remove(hook)
+        return
+
+    def record(self, event: QueryEvent) -> NoReturn:
+        with self._lock:
+            _statistics: Optional[_Statistics] = self._statistics.get(event.fingerprint)
+            if _statistics is None:
+                _statistics = self._statistics[event.fingerprint] = _Statistics()
+            _statistics.histogram.add(event.seconds)
+            _statistics.rows += event.rows
+            _statistics.errors += event.error is not None
+            if event.seconds >= self.slow_seconds:
+                self.slow_log.append(event)
+                if self.log_path is not None:
+                    with open(self.log_path, "a", encoding="utf-8") as _file:
+                        _file.write(str(event) + "\n")
+        for _hook in self._hooks:
+            _hook(event)
+        return
+
+    def settle(self) -> NoReturn:
+        """
+        Records the statements whose results have not been fetched to the end yet.
+        """
+        for _cursor in list(self._cursors):
+            _cursor.settle()
+        return
+
+    def reset(self) -> NoReturn:
+        with self._lock:
+            self._statistics.clear()
+            self.slow_log.clear()
+        return
+
+    def report(self, top: int = 20) -> str:
+        """
+        Returns a table of the ``top`` fingerprints by total time, with calls, rows, errors and latency percentiles,
+        followed by the slow query log.
+        """
+        self.settle()
+        with self._lock:
+            _items: list[tuple[str, _Statistics]] = sorted(self._statistics.items(),
+                                                           key=lambda item: item[1].histogram.total, reverse=True)
+            _slow: list[QueryEvent] = list(self.slow_log)
+        _total: float = sum(_statistics.histogram.total for _, _statistics in _items)
+        _out: list[str] = [f"QUERY REPORT {sum(_s.histogram.count for _, _s in _items)} STATEMENTS, "
+                           f"{len(_items)} FINGERPRINTS, {_total * 1000:.3f} ms",
+                           f"{'CALLS':>8} {'TOTAL ms':>10} {'MEAN ms':>9} {'P50 ms':>9} {'P95 ms':>9} {'P99 ms':>9} "
+                           f"{'MAX ms':>9} {'ROWS':>9} {'ERRORS':>6}  STATEMENT"]
+        for _fingerprint, _statistics in _items[:top]:
+            _h: Histogram = _statistics.histogram
+            _out.append(f"{_h.count:8} {_h.total * 1000:10.3f} {_h.mean * 1000:9.3f} {_h.percentile(50) * 1000:9.3f} "
+                        f"{_h.percentile(95) * 1000:9.3f} {_h.percentile(99) * 1000:9.3f} {_h.maximum * 1000:9.3f} "
+                        f"{_statistics.rows:9} {_statistics.errors:6}  {_fingerprint[:80]}")
+        if _slow:
+            _out.append(f"SLOW QUERIES (OVER {self.slow_seconds * 1000:.0f} ms)")
+            _out.extend(" " * 4 + str(event) for event in _slow)
+        return "\n".join(_out)
+
+
+class InstrumentedCursor(_sql.Cursor):
+    """
+    ``sqlite3.Cursor`` that times execution and fetching of its statements. A query is recorded when its rows are
+    fetched to the end or when the cursor executes the next statement, other statements right after execution.
+    """
+
+    __slots__: tuple[str] = "_instrumentation", "_event"
+
+    def __init__(self, connection: _sql.Connection, instrumentation: Instrumentation) -> NoReturn:
+        super().__init__(connection)
+        self._instrumentation: Instrumentation = instrumentation
+        self._event: Optional[QueryEvent] = None
+        instrumentation._cursors.add(self)
+        return
+
+    def settle(self) -> NoReturn:
+        if self._event is not None:
+            _event, self._event = self._event, None
+            self._instrumentation.record(_event)
+        return
+
+    def _measure(self, sql: str, parameters: Any, method: Callable, *args) -> Optional["InstrumentedCursor"]:
+        self.settle()
+        _event: QueryEvent = QueryEvent(sql, parameters)
+        _start: float = perf_counter()
+        try:
+            method(*args)
+        except _sql.Error as error:
+            _event.seconds, _event.error = perf_counter() - _start, error
+            self._instrumentation.record(_event)
+            raise
+        _event.seconds = perf_counter() - _start
+        if self.description is None:  # NOTE ------------------------------------------- no result set, done already
+            _event.rows = max(self.rowcount, 0)
+            self._instrumentation.record(_event)
+        else:
+            self._event = _event
+        return self
+
+    def execute(self, sql: str, parameters: Any = (), /) -> "InstrumentedCursor":
+        return self._measure(sql, parameters, super().execute, sql, parameters)
+
+    def executemany(self, sql: str, parameters: Any, /) -> "InstrumentedCursor":
+        return self._measure(sql, None, super().executemany, sql, parameters)
+
+    def _fetched(self, start: float, rows: int, done: bool) -> NoReturn:
+        if self._event is not None:
+            self._event.seconds += perf_counter() - start
+            self._event.rows += rows
+            if done:
+                self.settle()
+        return
+
+    def fetchone(self) -> Any:
+        _start: float = perf_counter()
+        _row = super().fetchone()
+        self._fetched(_start, _row is not None, _row is None)
+        return _row
+
+    def fetchmany(self, size: Optional[int] = None) -> list:
+        _start: float = perf_counter()
+        _size: int = self.arraysize if size is None else size
+        _rows: list = super().fetchmany(_size)
+        self._fetched(_start, len(_rows), len(_rows) < _size)
+        return _rows
+
+    def fetchall(self) -> list:
+        _start: float = perf_counter()
+        _rows: list = super().fetchall()
+        self._fetched(_start, len(_rows), True)
+        return _rows
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self) -> Any:
+        _start: float = perf_counter()
+        try:
+            _row = super().__next__()
+        except StopIteration:
+            self._fetched(_start, 0, True)
+            raise
+        self._fetched(_start, 1, False)
+        return _row
@@ -1,7 +1,7 @@
 """
 enumerations: CycleEnum, DatetimeFormat, CoordinateType, Quarter, Day
 
-classes: Coordinates, Rectangle, Airline, Employee, Airport, Schedule, Flight, Gate
+classes: Coordinates, CoordinateArray, Rectangle, Airline, Employee, Airport, Schedule, Flight, Gate
 
 **NOTE: Python 3.11 required for typing.Self (PEP 673), the pipe operator '|' (PEP 604)
 and the match-case statement (PEP 634 ~ PEP 636)**
@@ -10,27 +10,31 @@ and the match-case statement (PEP 634 ~ PEP 636)**
 """
 
 __all__: tuple[str] = ("CycleEnum", "DatetimeFormat", "CoordinateType", "Quarter",
-                       "Day", "Coordinate", "Coordinates", "Rectangle", "Airline",
+                       "Day", "Coordinate", "Coordinates", "CoordinateArray", "Rectangle", "Airline",
                        "Employee", "Airport", "Schedule", "Flight", "Gate")
 __author__ = "A. Tsakiridis"
 __version__ = "1.4"
 
 from abc import abstractmethod, ABC
+from array import array
 from datetime import datetime as _dt, date as _date, timezone as _t_zone, timedelta as _timed
-from collections.abc import Iterable, Sized
+from collections.abc import Iterable, Sequence, Sized
 from enum import Enum, unique
 from functools import total_ordering as __total_order
 from math import sin, cos, sqrt, asin, radians, degrees, atan
 from pathlib import Path
 from random import choice as _ch, randint as _rand
 from sys import version_info, stderr as standard_error
-from typing import (NoReturn, Self, overload, Union, Iterator, Optional,
-                    Type, ClassVar, Final, SupportsFloat, SupportsInt)
+from typing import (Any, Callable, NoReturn, Self, overload, Union, Iterator, Optional,
+                    Type, ClassVar, Final, SupportsFloat, SupportsInt, TYPE_CHECKING)
 
 if not version_info >= (3, 11):
     print(f"INCOMPATIBLE VERSION {version_info}, PLEASE USE PYTHON 3.11 OR HIGHER.")
 
-import simplekml
+if TYPE_CHECKING:  # NOTE ---------------------------------- simplekml is imported by the KML methods, only when needed
+    import simplekml
+    import numpy
+    from assets.spatial import SpatialIndex
 
 from assets.constants import *
 
@@ -136,6 +140,13 @@ class Day(CycleEnum):
                 return day
         return None
 
+    @property
+    def mask(self) -> int:
+        """
+        Returns the bit of the day in the seven-digit binary code of days_to_code(), Sunday is the most significant.
+        """
+        return 1 << (6 - self.value[0])
+
     @classmethod
     def today(cls):  # note------------------------------------------------ from official documentation
         print("today is %s" % cls(_date.today().weekday()).name)  # fixme weekday() returns 0 for Monday
@@ -174,28 +185,98 @@ class Day(CycleEnum):
 
 # =====================================================================================================================
 
+def _serializer(instance: "_HasTuple", nested: Optional[dict[str, tuple[type, tuple[str, ...]]]] = None
+                ) -> tuple[Callable[["_HasTuple"], tuple], tuple[str, ...], dict[str, tuple[type, tuple[str, ...]]]]:
+    """
+    Protected function that compiles the ``tuple`` function and the ``columns`` of an instance's class, following its
+    ``__slots__``: slots holding objects with a ``tuple`` property in this instance, or in an instance compiled before
+    as given by ``nested``, are flattened into their values, the other ones are formatted as dates when they hold
+    dates, with ``isoformat()`` while the formats of DatetimeFormat are the ISO ones. Slots holding other types in
+    later instances fall back to the reflective checks, and a slot found holding an object with a ``tuple`` property
+    for the first time compiles the class again, so that a slot None in the first instance is flattened later.
+
+    *Created on 18 Oct 2026.*
+    """
+    _class: type = type(instance)
+    _nested: dict[str, tuple[type, tuple[str, ...]]] = dict(nested or {})
+    _namespace: dict[str, Any] = {"_dt": _dt, "_date": _date, "_flat": _flat, "_found": _found,
+                                  "_SCALARS": _SCALARS,
+                                  "_DATETIME": DatetimeFormat.DATETIME.value, "_DATE": DatetimeFormat.DATE.value}
+    _formatted: str = "(_v{0}.strftime(_DATETIME) if isinstance(_v{0}, _dt) else _v{0}.strftime(_DATE))"
+    if _namespace["_DATETIME"] == "%Y-%m-%d %H:%M:%S" and _namespace["_DATE"] == "%Y-%m-%d":
+        _formatted = "(_v{0}.isoformat(' ', 'seconds') if _v{0}.__class__ is _dt and _v{0}.tzinfo is None else " \
+                     "_v{0}.isoformat() if _v{0}.__class__ is _date else " + _formatted[1:]  # NOTE -- same text, faster
+    _lines: list[str] = ["def _tuple(self):"]
+    _values: list[str] = []
+    _columns: list[str] = []
+    for _number, _slot in enumerate(_class.__slots__):
+        _attr = object.__getattribute__(instance, _slot)
+        _lines.append(f"    _v{_number} = self.{_slot}")
+        if hasattr(_attr, "tuple"):
+            _nested[_slot] = type(_attr), tuple(_attr.columns) if hasattr(_attr, "columns") else (_slot,)
+        if _slot in _nested:
+            _namespace[f"_k{_number}"] = _nested[_slot][0]
+            _values.append(f"*(_v{_number}.tuple if _v{_number}.__class__ is _k{_number} else _flat(_v{_number}))")
+            _columns.extend(_nested[_slot][1])
+        else:
+            _values.append(f"*((_v{_number},) if _v{_number}.__class__ in _SCALARS else "
+                           f"({_formatted.format(_number)},) if isinstance(_v{_number}, _date) else "
+                           f"_found(self, _v{_number}))")
+            _columns.append(_slot)
+    _lines.append(f"    return ({', '.join(_values)},)")
+    exec(compile("\n".join(_lines), f"<serializer {_class.__qualname__}>", "exec"), _namespace)
+    return _namespace["_tuple"], tuple(_columns), _nested
+
+
+_SCALARS: frozenset[type] = frozenset((int, float, str, bool, bytes, type(None)))
+
+
+def _flat(value: Any) -> tuple:
+    """
+    Protected function that returns the values of one attribute as the reflective walk did, for compiled serializers.
+    """
+    if hasattr(value, "tuple"):
+        return value.tuple
+    if isinstance(value, _dt):
+        return value.strftime(DatetimeFormat.DATETIME.value),
+    if isinstance(value, _date):
+        return value.strftime(DatetimeFormat.DATE.value),
+    return value,
+
+
+def _found(instance: "_HasTuple", value: Any) -> tuple:
+    """
+    Protected function called by compiled serializers for values of a slot that is not flattened and holds neither
+    a scalar nor a date: an object with a ``tuple`` property compiles the class of ``instance`` again, see
+    _serializer(), other values are returned as they are.
+    """
+    if hasattr(value, "tuple"):
+        _class: type = instance.__class__
+        _HasTuple._SERIALIZERS[_class] = _serializer(instance, _HasTuple._SERIALIZERS[_class][2])
+    return _flat(value)
+
+
 class _HasTuple:
     """
     Protected class to be inherited, with no any instance attributes. Implements ``columns`` property that returns
     a tuple containing instance attribute names and ``tuple`` property that returns a tuple containing instance
     attribute values. Both methods access attributes at the same order they'll be declared at child ``__slots__`` tuple.
+    Both are compiled once per class, on first use, see _serializer().
     """
 
+    _SERIALIZERS: ClassVar[dict[type, tuple[Callable[["_HasTuple"], tuple], tuple[str, ...], dict]]] = {}
+
     __slots__: tuple[str] = ()
 
     @property
     def columns(self) -> tuple[str, ...]:
         """
-        Returns a tuple containing attributes names from the object's ``__slots__``.
+        Returns a tuple containing attributes names from the object's ``__slots__``. Compiled with the ``tuple``
+        function of the class and read from it, a slot None in the instances serialized so far is one column until
+        ``tuple`` flattens an object found in it.
         """
-        _columns: list = []
-        for _slot in self.__slots__:
-            _attr = object.__getattribute__(self, _slot)
-            if hasattr(_attr, "columns"):
-                _columns.extend(_attr.columns)
-            else:
-                _columns.append(_slot)
-        return tuple(_columns)
+        return (_HasTuple._SERIALIZERS.get(self.__class__) or
+                _HasTuple._SERIALIZERS.setdefault(self.__class__, _serializer(self)))[1]
 
     @property
     def tuple(self) -> tuple:
@@ -204,18 +285,9 @@ class _HasTuple:
 
         *Created on Dec 26 2023.*
         """
-        _data: list = []
-        for _slot in self.__slots__:
-            _attr = object.__getattribute__(self, _slot)
-            if hasattr(_attr, "tuple"):
-                _data.extend([*_attr.tuple])  # NOTE recursion
-            elif isinstance(_attr, _dt):
-                _data.append(_attr.strftime(DatetimeFormat.DATETIME.value))
-            elif isinstance(_attr, _date):
-                _data.append(_attr.strftime(DatetimeFormat.DATE.value))
-            else:
-                _data.append(_attr)
-        return tuple(_data)
+        _compiled = _HasTuple._SERIALIZERS.get(self.__class__) or \
+            _HasTuple._SERIALIZERS.setdefault(self.__class__, _serializer(self))
+        return _compiled[0](self)
 
 
 class _CompleteCheck:
@@ -641,12 +713,13 @@ class Coordinates(_CompleteCheck, Sized, Iterable[Coordinate]):
     # =================================================================================================================
 
     @property
-    def kml_style(self) -> simplekml.Style:
+    def kml_style(self) -> "simplekml.Style":
         """
         :return: KML Style
 
         *Created on 15 Jan 2023.*
         """
+        import simplekml
         _style = simplekml.Style()
         _style.labelstyle.color = simplekml.Color.yellow
         _style.labelstyle.scale = 1.5
@@ -661,6 +734,7 @@ class Coordinates(_CompleteCheck, Sized, Iterable[Coordinate]):
 
         *Created on 15 Jan 2023.*
         """
+        import simplekml
         _kml_data = simplekml.Kml()
         _kml_data.document.name = self.__class__.__name__
         _point: simplekml.Point = _kml_data.newpoint(name=self.label, coords=[(float(self.long), float(self.lat))])
@@ -671,6 +745,17 @@ class Coordinates(_CompleteCheck, Sized, Iterable[Coordinate]):
 
     # =================================================================================================================
 
+    def nearest(self, index: "SpatialIndex", k: int = 1) -> list[tuple[Self, float]]:
+        """
+        Returns the ``k`` points of a spatial index nearest to this one and their haversine arcs in degrees, nearest
+        first, see assets.spatial. ``database.spatial_index()`` indexes the airports, labeled with IATA codes.
+
+        ``Coordinates(37.9, 23.7).nearest(database.spatial_index(), 3)``
+
+        *Created on 18 Oct 2026.*
+        """
+        return [(index.points[_position], _arc) for _position, _arc in index.nearest(self, k)]
+
     @staticmethod
     def average(_alpha: Union[Coordinate, float], _beta: Union[Coordinate, float]) -> float:
         return (float(_alpha) + float(_beta)) / 2
@@ -752,6 +837,143 @@ class Coordinates(_CompleteCheck, Sized, Iterable[Coordinate]):
         return f"{minutes} minutes"
 
 
+class CoordinateArray(Sized, Iterable[Coordinates]):
+    """
+    Columnar storage of many points: latitudes and longitudes in contiguous float64 arrays and a label per point,
+    instead of a Coordinates object holding two Coordinate objects per point. Validation is vectorized with NumPy when
+    it is installed, the ``numpy`` property returns zero-copy NumPy views of the arrays.
+
+    ``CoordinateArray([37.9364, 40.5197], [23.9445, 22.9709], ["ATH", "SKG"])``
+
+    *Created on 18 Oct 2026.*
+    """
+
+    __slots__: tuple[str] = "lat", "long", "labels"
+
+    def __init__(self, lat: Iterable[float] = (), long: Iterable[float] = (), labels: Optional[Iterable[str]] = None,
+                 validate: bool = True) -> NoReturn:
+        """
+        Pass validate=False for trusted values, the database rows of Airport for instance.
+        :raises AttributeError: for arrays of different lengths or points out of range
+        """
+        self.lat: array = lat if isinstance(lat, array) and lat.typecode == "d" else array("d", lat)
+        self.long: array = long if isinstance(long, array) and long.typecode == "d" else array("d", long)
+        self.labels: list[str] = [str() for _ in range(len(self.lat))] if labels is None else \
+            [_label if _label else str() for _label in labels]
+        if not len(self.lat) == len(self.long) == len(self.labels):
+            raise AttributeError(f"{len(self.lat)} latitudes, {len(self.long)} longitudes and {len(self.labels)} "
+                                 f"labels were given, they must be as many.")
+        if validate:
+            self.validate()
+        return
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[Coordinates]) -> Self:
+        """
+        Alternative factory method, copies the values and labels of Coordinates objects.
+        """
+        _out: Self = cls()
+        for _point in coordinates:
+            _out.append(_point)
+        return _out
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence], validate: bool = True) -> Self:
+        """
+        Alternative factory method for (latitude, longitude, label) rows, as returned by
+        ``select lat, long, IATA from Airport``.
+        """
+        _out: Self = cls(validate=False)
+        _lat_append, _long_append, _label_append = _out.lat.append, _out.long.append, _out.labels.append
+        for _lat, _long, _label in rows:
+            _lat_append(_lat)
+            _long_append(_long)
+            _label_append(_label if _label else str())
+        if validate:
+            _out.validate()
+        return _out
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def __iter__(self) -> Iterator[Coordinates]:
+        return (self[_index] for _index in range(len(self)))
+
+    def __getitem__(self, item: Union[int, slice, str]) -> Union[Coordinates, Self]:
+        """
+        Returns a Coordinates object for an index or a label, a new CoordinateArray for a slice.
+        """
+        if isinstance(item, slice):
+            return self.__class__(self.lat[item], self.long[item], self.labels[item], validate=False)
+        if isinstance(item, str):
+            item = self.index(item)
+        return Coordinates(self.lat[item], self.long[item], self.labels[item])
+
+    def __str__(self) -> str:
+        return "\n".join(f"{_label}{' ' * (8 - len(_label))}{_lat:11.6f} {_long:11.6f}"
+                         for _lat, _long, _label in zip(self.lat, self.long, self.labels))
+
+    def index(self, label: str) -> int:
+        """
+        Returns the index of the first point with the label.
+        :raises KeyError: if no point has the label
+        """
+        try:
+            return self.labels.index(label)
+        except ValueError:
+            raise KeyError(f"No point is labeled {label}.") from None
+
+    def append(self, point: Union[Coordinates, tuple[float, float, str]]) -> NoReturn:
+        if isinstance(point, Coordinates):
+            point = float(point.lat), float(point.long), point.label
+        _lat, _long, _label = point
+        if abs(_lat) > MAX_DEGREE_LAT or abs(_long) > MAX_DEGREE_LONG:
+            raise AttributeError(f"Point {_label} ({_lat}, {_long}) is out of range.")
+        self.lat.append(_lat)
+        self.long.append(_long)
+        self.labels.append(_label if _label else str())
+        return
+
+    def invalid(self) -> list[int]:
+        """
+        Returns the indices of points out of range or not finite, in one vectorized pass if NumPy is installed.
+        """
+        try:
+            import numpy
+        except ImportError:
+            return [_index for _index, (_lat, _long) in enumerate(zip(self.lat, self.long))
+                    if not (abs(_lat) <= MAX_DEGREE_LAT and abs(_long) <= MAX_DEGREE_LONG)]  # NOTE ----- nan fails
+        _lat, _long = self.numpy
+        _valid = (numpy.abs(_lat) <= MAX_DEGREE_LAT) & (numpy.abs(_long) <= MAX_DEGREE_LONG)
+        return numpy.flatnonzero(~_valid).tolist()
+
+    def validate(self) -> NoReturn:
+        """
+        :raises AttributeError: naming the first points out of range
+        """
+        _invalid: list[int] = self.invalid()
+        if _invalid:
+            raise AttributeError(f"{len(_invalid)} points are out of range: " + ", ".join(
+                f"{self.labels[_index]} ({self.lat[_index]}, {self.long[_index]})" for _index in _invalid[:5]))
+        return
+
+    @property
+    def numpy(self) -> tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Returns NumPy views of latitudes and longitudes, sharing memory with the arrays: appending to the arrays
+        while views exist raises BufferError.
+        """
+        import numpy
+        return numpy.frombuffer(self.lat, dtype=numpy.float64), numpy.frombuffer(self.long, dtype=numpy.float64)
+
+    @property
+    def coordinates(self) -> list[Coordinates]:
+        """
+        Returns a Coordinates object per point.
+        """
+        return list(self)
+
+
 class Rectangle:
 
     _C_FLOAT: Type = Union[Coordinate, float]
@@ -832,6 +1054,22 @@ class Rectangle:
             return True
         return False
 
+    def search(self, points: Union[CoordinateArray, "SpatialIndex"]) -> CoordinateArray:
+        """
+        Returns the points inside the rectangle, borders included. A spatial index answers with a binary search of
+        its latitude order, see assets.spatial, a CoordinateArray is scanned.
+
+        ``Rectangle(35, 42, 19, 30).search(database.spatial_index())``
+
+        *Created on 18 Oct 2026.*
+        """
+        if isinstance(points, CoordinateArray):
+            return CoordinateArray.from_rows(((_lat, _long, _label) for _lat, _long, _label in
+                                              zip(points.lat, points.long, points.labels)
+                                              if self.lat[0] <= _lat <= self.lat[1]
+                                              and self.long[0] <= _long <= self.long[1]), False)
+        return points.select(points.within(self))
+
 
 class Airline(_DatabaseRecord):
 
@@ -1068,10 +1306,10 @@ class Airport(_DatabaseRecord):
 
     __slots__: tuple[str] = "id", "iata", "country", "timezone", "name", "description", "location", "runways"
 
-    def __init__(self, airport_id: int, iata: str, country: str, timezone: int,
+    def __init__(self, airport_id: int, iata: Optional[str], country: str, timezone: int,
                  name: str, lat: float = None, long: float = None) -> NoReturn:
         self.id: int = airport_id
-        self.iata: str = iata
+        self.iata: Optional[str] = iata  # NOTE ------------------------------------------------ column IATA is nullable
         self.country: str = country
         self.timezone: _t_zone = _t_zone(_timed(hours=timezone))
         self.name: str = name
@@ -1080,7 +1318,7 @@ class Airport(_DatabaseRecord):
         self.runways: list[Airport.Runway] = list()
         if self.__class__._CHECK_COORDINATES and (lat > MAX_DEGREE_LAT or long > MAX_DEGREE_LONG):
             raise AttributeError("Values (0, 0) are invalid for Airport latitude and longitude.")
-        if self.__class__._CHECK_IATA and len(self.iata) != 3:
+        if self.__class__._CHECK_IATA and self.iata is not None and len(self.iata) != 3:
             raise AttributeError(f"Invalid IATA code ({iata}), there must be exactly three (3) characters.")
         if self.__class__._CHECK_TIMEZONE and abs(timezone) > 12:
             raise AttributeError(f"Timezone value {timezone} is invalid, should be between -12 and +12.")
@@ -1092,7 +1330,7 @@ class Airport(_DatabaseRecord):
 
     def __str__(self) -> str:
         _out: str = self.name + " " * (55 - len(self.name)) + str(self.location.lat) + "   " + str(self.location.long)
-        _out += " " * (85 - len(_out)) + self.iata + " " * 7 + self.country
+        _out += " " * (85 - len(_out)) + (self.iata or " " * 3) + " " * 7 + self.country
         return _out + " " * (110 - len(_out)) + str(self.timezone) + " " * 6 + self.description
 
     @staticmethod
@@ -1123,6 +1361,7 @@ class Airport(_DatabaseRecord):
 
         *Created on 15 Jan 2023.*
         """
+        import simplekml
         _kml_data = simplekml.Kml()
         _kml_data.document.name = self.__class__.__name__
         _point: simplekml.Point = _kml_data.newpoint(name=self.name)
@@ -1146,6 +1385,7 @@ class Airport(_DatabaseRecord):
 
         *Created on 15 Jan 2023.*
         """
+        import simplekml
         _doc_name: str = (self.iata + "_" + other.iata).lower()
         _kml_data = simplekml.Kml()
         _kml_data.document.name = "route_" + _doc_name
@@ -1328,6 +1568,7 @@ class Flight(_DatabaseRecord):
 class Gate:
 
     _DATA = (("A", 1, 23), ("B", 1, 31), ("C", 15, 40))  # NOTE ----------- according to El. Venizelos website, see doc
+    _HALLS: ClassVar[dict[bool, tuple[str, ...]]] = {True: ("B", "C"), False: ("A", "C")}  # NOTE -- by Schengen flag
 
     def __init__(self, number: int, terminal: str) -> NoReturn:
         """
@@ -1354,6 +1595,21 @@ class Gate:
         _choice = _rand(0, len(cls._DATA) - 1)
         return cls(_rand(*cls._DATA[_choice][1:]), cls._DATA[_choice][0])
 
+    @classmethod
+    def all(cls) -> list[Self]:
+        """
+        Returns every gate of every hall, in hall and number order.
+        """
+        return [cls(_number, _hall) for _hall, _first, _last in cls._DATA for _number in range(_first, _last + 1)]
+
+    @classmethod
+    def halls(cls, schengen: bool) -> tuple[str, ...]:
+        """
+        Returns the halls that may serve a flight, in order of preference: hall B for Schengen and domestic flights,
+        hall A for the rest, the Satellite Terminal (hall C) takes the overflow of both.
+        """
+        return cls._HALLS[schengen]
+
 
 if __name__ == "__main__":
     gamma = Coordinate(0, CoordinateType.LATITUDINAL)
@@ -0,0 +1,352 @@
+"""
+Route network of the flights: every Flight row is a connection between two airports at a departure and an arrival
+time. Flights store only their time at Athens, the other side is derived from the nominal flight minutes of the route,
+see Coordinates.duration(). Class Network keeps the connections sorted by departure time in compact arrays of minutes,
+with the outbound and inbound connections of every airport as offsets into index arrays, and answers earliest arrival
+queries with the Connection Scan Algorithm: one pass over the connections departing after the start, honoring a
+minimum connecting time at every change of flight. Class HubTable pairs every flight into a hub with the flights out of
+it that it connects to, built once per hub and connecting times, and answers the itineraries through the hub.
+
+Used by Database.network().
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "Network", "HubTable", "Itinerary", "Leg", "minutes", "moment"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime as _dt, timedelta as _timed
+from threading import Lock
+from typing import Callable, Iterable, NoReturn, Optional, Union
+
+from assets.constants import MAXIMUM_CONNECTING_TIME, MINIMUM_CONNECTING_TIME
+
+_EPOCH: _dt = _dt(2000, 1, 1)
+_NEVER: int = 2 ** 62
+_Airport = Union[int, str]  # NOTE ------------------------------------------------------------ airport id or IATA code
+
+
+def minutes(moment: Union[_dt, str]) -> int:
+    """
+    Returns the whole minutes of a moment since the start of 2000, as the network stores times.
+    """
+    if isinstance(moment, str):
+        moment = _dt.fromisoformat(moment)
+    return (moment - _EPOCH) // _timed(minutes=1)
+
+
+def moment(value: int) -> _dt:
+    return _EPOCH + _timed(minutes=value)
+
+
+class Leg:
+
+    __slots__: tuple[str] = "flight", "code", "origin", "destination", "departure", "arrival"
+
+    def __init__(self, flight: int, code: str, origin: str, destination: str, departure: _dt,
+                 arrival: _dt) -> NoReturn:
+        """
+        One flight of an itinerary, airports by IATA code.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.flight: int = flight
+        self.code: str = code
+        self.origin: str = origin
+        self.destination: str = destination
+        self.departure: _dt = departure
+        self.arrival: _dt = arrival
+        return
+
+    def __str__(self) -> str:
+        return f"{self.code}  {self.origin} {self.departure:%Y-%m-%d %H:%M}  {self.destination} {self.arrival:%H:%M}"
+
+
+class Itinerary:
+
+    __slots__: tuple[str] = "legs",
+
+    def __init__(self, legs: list[Leg]) -> NoReturn:
+        """
+        Flights from an origin to a destination, in order of departure.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.legs: list[Leg] = legs
+        return
+
+    def __len__(self) -> int:
+        return len(self.legs)
+
+    def __str__(self) -> str:
+        _hours, _minutes = divmod(int(self.duration.total_seconds()) // 60, 60)
+        return "\n".join(str(_leg) for _leg in self.legs) + \
+            f"\n{self.transfers} TRANSFERS, {_hours} HOURS AND {_minutes} MINUTES"
+
+    @property
+    def departure(self) -> _dt:
+        return self.legs[0].departure
+
+    @property
+    def arrival(self) -> _dt:
+        return self.legs[-1].arrival
+
+    @property
+    def duration(self) -> _timed:
+        return self.arrival - self.departure
+
+    @property
+    def transfers(self) -> int:
+        return len(self.legs) - 1
+
+
+class Network:
+
+    __slots__: tuple[str] = ("airports", "labels", "origin", "destination", "departure", "arrival", "flight", "code",
+                             "_stop", "_outbound", "_out_offsets", "_inbound", "_in_offsets", "_hubs", "_lock")
+
+    def __init__(self, connections: Iterable[tuple[int, str, int, int, int, int]],
+                 labels: Optional[dict[int, str]] = None) -> NoReturn:
+        """
+        Builds the network of connections (flight id, code, origin airport id, destination airport id, departure
+        and arrival minutes, see minutes()). ``labels`` maps airport ids to the IATA codes of the itineraries.
+
+        *Created on 18 Oct 2026.*
+        """
+        _rows: list[tuple[int, str, int, int, int, int]] = sorted(connections, key=lambda row: (row[4], row[5]))
+        self.labels: dict[int, str] = labels or {}
+        self.airports: list[int] = sorted({_row[2] for _row in _rows} | {_row[3] for _row in _rows})
+        self._stop: dict[_Airport, int] = {_airport: _stop for _stop, _airport in enumerate(self.airports)}
+        self._stop.update((self.labels[_airport], _stop) for _airport, _stop in list(self._stop.items())
+                          if _airport in self.labels)
+        self.origin: array = array("i", (self._stop[_row[2]] for _row in _rows))
+        self.destination: array = array("i", (self._stop[_row[3]] for _row in _rows))
+        self.departure: array = array("q", (_row[4] for _row in _rows))
+        self.arrival: array = array("q", (_row[5] for _row in _rows))
+        self.flight: array = array("q", (_row[0] for _row in _rows))
+        self.code: list[str] = [_row[1] for _row in _rows]
+        self._outbound, self._out_offsets = self._adjacency(self.origin)
+        self._inbound, self._in_offsets = self._adjacency(self.destination)
+        self._hubs: dict[tuple[int, int, int], HubTable] = {}
+        self._lock: Lock = Lock()
+        return
+
+    @classmethod
+    def from_flights(cls, rows: Iterable[tuple], duration: Callable[[int, int], int],
+                     labels: Optional[dict[int, str]] = None) -> "Network":
+        """
+        Alternative factory method for Flight rows (id, code, from_airport, to_airport, departure, arrival), one of
+        the times None, which is derived from the other with the minutes ``duration(origin, destination)`` returns.
+        Rows without any time are skipped.
+        """
+        _connections: list[tuple[int, str, int, int, int, int]] = []
+        _durations: dict[tuple[int, int], int] = {}
+        for _id, _code, _origin, _destination, _departure, _arrival in rows:
+            if _departure is None and _arrival is None:
+                continue
+            if (_origin, _destination) not in _durations:
+                _durations[(_origin, _destination)] = duration(_origin, _destination)
+            _minutes: int = _durations[(_origin, _destination)]
+            _start: int = minutes(_departure) if _departure is not None else minutes(_arrival) - _minutes
+            _end: int = minutes(_arrival) if _arrival is not None else _start + _minutes
+            _connections.append((_id, _code, _origin, _destination, _start, _end))
+        return cls(_connections, labels)
+
+    def _adjacency(self, stops: array) -> tuple[array, array]:
+        """
+        Protected method that groups the connections by airport, in departure order: the connections of airport
+        number ``s`` are ``index[offsets[s]:offsets[s + 1]]``.
+        """
+        _offsets: array = array("i", bytes(4 * (len(self.airports) + 1)))
+        for _stop in stops:
+            _offsets[_stop + 1] += 1
+        for _stop in range(len(self.airports)):
+            _offsets[_stop + 1] += _offsets[_stop]
+        _index: array = array("i", bytes(4 * len(stops)))
+        _next: array = array("i", _offsets)
+        for _connection, _stop in enumerate(stops):
+            _index[_next[_stop]] = _connection
+            _next[_stop] += 1
+        return _index, _offsets
+
+    def __len__(self) -> int:
+        return len(self.departure)
+
+    def __str__(self) -> str:
+        return f"Network of {len(self)} flights between {len(self.airports)} airports"
+
+    def stop(self, airport: _Airport) -> int:
+        """
+        Returns the number of an airport in the network, by id or IATA code.
+        :raises KeyError: if no flight serves the airport
+        """
+        if airport not in self._stop:
+            raise KeyError(f"No flight serves airport {airport}.")
+        return self._stop[airport]
+
+    def outbound(self, airport: _Airport) -> list[int]:
+        """
+        Returns the connections departing from an airport, in departure order.
+        """
+        _stop: int = self.stop(airport)
+        return self._outbound[self._out_offsets[_stop]:self._out_offsets[_stop + 1]].tolist()
+
+    def inbound(self, airport: _Airport) -> list[int]:
+        """
+        Returns the connections arriving at an airport, in departure order.
+        """
+        _stop: int = self.stop(airport)
+        return self._inbound[self._in_offsets[_stop]:self._in_offsets[_stop + 1]].tolist()
+
+    def leg(self, connection: int) -> Leg:
+        _origin, _destination = self.airports[self.origin[connection]], self.airports[self.destination[connection]]
+        return Leg(self.flight[connection], self.code[connection], self.labels.get(_origin, str(_origin)),
+                   self.labels.get(_destination, str(_destination)), moment(self.departure[connection]),
+                   moment(self.arrival[connection]))
+
+    def _scan(self, origin: int, destination: int, start: int, connecting: int) -> Optional[list[int]]:
+        """
+        Protected method of the Connection Scan Algorithm: scans the connections departing from ``start`` on, until
+        they depart after the earliest arrival at the destination found, and returns the connections of the earliest
+        arrival, None if the destination cannot be reached.
+        """
+        _earliest: list[int] = [_NEVER] * len(self.airports)
+        _earliest[origin] = start - connecting  # NOTE ------------------ no connecting time for the first flight
+        _through: list[int] = [-1] * len(self.airports)
+        _origin, _destination, _departure, _arrival = self.origin, self.destination, self.departure, self.arrival
+        for _connection in range(bisect_left(_departure, start), len(_departure)):
+            _leaves: int = _departure[_connection]
+            if _leaves >= _earliest[destination]:
+                break
+            if _leaves >= _earliest[_origin[_connection]] + connecting and \
+                    _arrival[_connection] < _earliest[_destination[_connection]]:
+                _earliest[_destination[_connection]] = _arrival[_connection]
+                _through[_destination[_connection]] = _connection
+        if _through[destination] < 0:
+            return None
+        _connections: list[int] = [_through[destination]]
+        while _origin[_connections[-1]] != origin:
+            _connections.append(_through[_origin[_connections[-1]]])
+        return _connections[::-1]
+
+    def earliest_arrival(self, origin: _Airport, destination: _Airport, start: Union[_dt, str],
+                         via: Optional[_Airport] = None,
+                         connecting: int = MINIMUM_CONNECTING_TIME) -> Optional[Itinerary]:
+        """
+        Returns the itinerary departing at ``start`` or later that arrives first at the destination, through ``via``
+        if given, with at least ``connecting`` minutes at every change of flight. None if there is no such itinerary.
+
+        ``database.network().earliest_arrival("SKG", "HER", "2024-02-01", via="ATH")``
+        :return: Itinerary
+        :raises KeyError: if no flight serves an airport
+        """
+        _start: int = minutes(start)
+        _origin, _destination = self.stop(origin), self.stop(destination)
+        if via is None:
+            _connections: Optional[list[int]] = self._scan(_origin, _destination, _start, connecting)
+        else:
+            _via: int = self.stop(via)
+            _connections = self._scan(_origin, _via, _start, connecting)
+            if _connections is not None:
+                _onward: Optional[list[int]] = self._scan(_via, _destination,
+                                                          self.arrival[_connections[-1]] + connecting, connecting)
+                _connections = None if _onward is None else _connections + _onward
+        return None if _connections is None else Itinerary([self.leg(_connection) for _connection in _connections])
+
+    def hub(self, airport: _Airport, connecting: int = MINIMUM_CONNECTING_TIME,
+            waiting: int = MAXIMUM_CONNECTING_TIME) -> "HubTable":
+        """
+        Returns the connection table of a hub for connecting times from ``connecting`` to ``waiting`` minutes, built
+        on first use and kept with the network.
+        """
+        _key: tuple[int, int, int] = self.stop(airport), connecting, waiting
+        _table: Optional[HubTable] = self._hubs.get(_key)
+        if _table is None:
+            _table = HubTable(self, airport, connecting, waiting)
+            with self._lock:
+                _table = self._hubs.setdefault(_key, _table)
+        return _table
+
+    def itineraries(self, origin: _Airport, destination: _Airport, start: Union[_dt, str], end: Union[_dt, str],
+                    via: Optional[_Airport] = None, connecting: int = MINIMUM_CONNECTING_TIME,
+                    waiting: int = MAXIMUM_CONNECTING_TIME) -> list[Itinerary]:
+        """
+        Returns the direct flights and the itineraries through the hub ``via`` departing between ``start`` and
+        ``end``, ordered by departure, changes of flight taking ``connecting`` to ``waiting`` minutes.
+        :return: list
+        :raises KeyError: if no flight serves an airport
+        """
+        _start, _end = minutes(start), minutes(end)
+        _destination: int = self.stop(destination)
+        _itineraries: list[tuple[int, list[int]]] = [
+            (self.departure[_connection], [_connection]) for _connection in self.outbound(origin)
+            if self.destination[_connection] == _destination and _start <= self.departure[_connection] <= _end]
+        if via is not None:
+            _itineraries.extend((self.departure[_pair[0]], list(_pair)) for _pair in
+                                self.hub(via, connecting, waiting).pairs(origin, destination, _start, _end))
+        return [Itinerary([self.leg(_connection) for _connection in _connections])
+                for _, _connections in sorted(_itineraries)]
+
+    def fastest(self, origin: _Airport, destination: _Airport, start: Union[_dt, str], end: Union[_dt, str],
+                via: Optional[_Airport] = None, connecting: int = MINIMUM_CONNECTING_TIME,
+                waiting: int = MAXIMUM_CONNECTING_TIME) -> Optional[Itinerary]:
+        """
+        Returns the shortest in duration of itineraries(), None if there is none.
+
+        ``database.network().fastest("SKG", "HER", "2024-02-01", "2024-02-08", via="ATH")``
+        :return: Itinerary
+        """
+        return min(self.itineraries(origin, destination, start, end, via, connecting, waiting),
+                   key=lambda itinerary: itinerary.duration, default=None)
+
+
+class HubTable:
+
+    __slots__: tuple[str] = "network", "hub", "connecting", "waiting", "_pairs", "_departures"
+
+    def __init__(self, network: Network, hub: _Airport, connecting: int = MINIMUM_CONNECTING_TIME,
+                 waiting: int = MAXIMUM_CONNECTING_TIME) -> NoReturn:
+        """
+        Pairs every flight into the hub with the flights out of it departing ``connecting`` to ``waiting`` minutes
+        after its arrival, except those returning to its origin, grouped by (origin, destination) airport numbers
+        in order of departure. Use Network.hub(), which keeps one table per hub and connecting times.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.network: Network = network
+        self.hub: int = network.stop(hub)
+        self.connecting: int = connecting
+        self.waiting: int = waiting
+        self._pairs: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        self._departures: dict[tuple[int, int], list[int]] = {}  # NOTE ------------- of the first flight of each pair
+        _outbound: list[int] = network.outbound(hub)
+        _departures: list[int] = [network.departure[_connection] for _connection in _outbound]
+        for _inbound in network.inbound(hub):
+            _arrival: int = network.arrival[_inbound]
+            _origin: int = network.origin[_inbound]
+            for _position in range(bisect_left(_departures, _arrival + connecting),
+                                   bisect_right(_departures, _arrival + waiting)):
+                _destination: int = network.destination[_outbound[_position]]
+                if _destination != _origin:
+                    self._pairs.setdefault((_origin, _destination), []).append((_inbound, _outbound[_position]))
+                    self._departures.setdefault((_origin, _destination), []).append(network.departure[_inbound])
+        return
+
+    def __len__(self) -> int:
+        return sum(len(_pairs) for _pairs in self._pairs.values())
+
+    def __str__(self) -> str:
+        return f"Hub {self.network.labels.get(self.network.airports[self.hub], self.hub)} of {len(self)} connections"
+
+    def pairs(self, origin: _Airport, destination: _Airport, start: int = 0,
+              end: int = _NEVER) -> list[tuple[int, int]]:
+        """
+        Returns the (inbound, outbound) connections from origin to destination through the hub whose first flight
+        departs between ``start`` and ``end`` minutes, in order of departure.
+        """
+        _key: tuple[int, int] = self.network.stop(origin), self.network.stop(destination)
+        _departures: list[int] = self._departures.get(_key, [])
+        return self._pairs.get(_key, [])[bisect_left(_departures, start):bisect_right(_departures, end)]
@@ -0,0 +1,245 @@
+"""
+Class ConnectionPool keeps a bounded set of read-only SQLite connections for Database. Each thread leases one
+connection with its own cursor and keeps it until the thread exits, so threads never share result sets, while write
+statements are serialized on the single writer connection owned by Database.
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "ConnectionPool", "PoolMetrics"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+import sqlite3 as _sql
+from contextlib import contextmanager
+from queue import LifoQueue, Empty
+from re import compile as _compile, IGNORECASE
+from threading import local, Lock, RLock
+from time import perf_counter
+from typing import Callable, ClassVar, Iterator, NoReturn, Optional
+
+
+class PoolMetrics:
+
+    __slots__: tuple[str] = ("capacity", "size", "in_use", "checkouts", "waits", "timeouts",
+                             "checkout_time", "max_checkout")
+
+    def __init__(self, capacity: int) -> NoReturn:
+        """
+        Counters kept by ConnectionPool: connections created (size) out of capacity, connections currently leased,
+        checkouts served, checkouts that had to wait for a free connection, checkouts that timed out and
+        total/maximum checkout latency in seconds.
+
+        *Created on 18 Oct 2026.*
+        """
+        self.capacity: int = capacity
+        self.size: int = 0
+        self.in_use: int = 0
+        self.checkouts: int = 0
+        self.waits: int = 0
+        self.timeouts: int = 0
+        self.checkout_time: float = 0.0
+        self.max_checkout: float = 0.0
+        return
+
+    def __str__(self) -> str:
+        _out: str = f"POOL {self.in_use}/{self.size} IN USE (CAPACITY {self.capacity}), {self.checkouts} CHECKOUTS, "
+        return _out + (f"{self.waits} WAITS, {self.timeouts} TIMEOUTS, AVERAGE CHECKOUT "
+                       f"{self.average_checkout * 1000:.3f} ms, MAX {self.max_checkout * 1000:.3f} ms")
+
+    @property
+    def average_checkout(self) -> float:
+        return self.checkout_time / self.checkouts if self.checkouts else 0.0
+
+    @property
+    def idle(self) -> int:
+        return self.size - self.in_use
+
+
+class _Lease:
+    """
+    Protected class stored at the thread-local storage of ConnectionPool. Holds a read connection and its cursor,
+    gives the connection back to the pool when the owning thread exits and its thread-local storage is cleared.
+    """
+
+    __slots__: tuple[str] = "pool", "connection", "cursor"
+
+    def __init__(self, pool: "ConnectionPool", connection: _sql.Connection) -> NoReturn:
+        self.pool: ConnectionPool = pool
+        self.connection: _sql.Connection = connection
+        self.cursor: _sql.Cursor = connection.cursor(pool.cursor_factory)
+        return
+
+    def __del__(self) -> NoReturn:
+        if self.connection is not None:
+            self.pool._give_back(self.connection)
+            self.connection = None
+
+
+class ConnectionPool:
+
+    _READ_VERBS: ClassVar[tuple[str]] = "select", "with", "explain", "values"
+    _WRITE_WORDS: ClassVar = _compile(r"\b(insert|update|delete|replace)\b", IGNORECASE)
+
+    __slots__: tuple[str] = ("_path", "_writer", "_idle", "_lock", "_write_lock", "_local",
+                             "_timeout", "_closed", "metrics", "cursor_factory")
+
+    def __init__(self, path: str, writer: _sql.Connection, size: int = 4, timeout: float = 30.0,
+                 write_lock: Optional[RLock] = None) -> NoReturn:
+        """
+        Creates up to ``size`` read-only connections to the database at ``path``, lazily and only when a thread asks
+        for one. Write statements go through ``writer``, the connection of Database, guarded by ``write_lock``, the
+        reentrant lock of that connection, a new one if not given.
+        A thread that finds the pool exhausted waits up to ``timeout`` seconds for another thread to exit.
+
+        *Created on 18 Oct 2026.*
+        """
+        if size < 1:
+            raise AttributeError(f"Pool size must be a positive number, {size} is not valid.")
+        self._path: str = path
+        self._writer: _sql.Connection = writer
+        self._idle: LifoQueue[_sql.Connection] = LifoQueue(maxsize=size)
+        self._lock: Lock = Lock()
+        self._write_lock: RLock = write_lock if write_lock is not None else RLock()
+        self._local: local = local()
+        self._timeout: float = timeout
+        self._closed: bool = False
+        self.metrics: PoolMetrics = PoolMetrics(size)
+        self.cursor_factory: Callable[[_sql.Connection], _sql.Cursor] = _sql.Cursor  # NOTE ---- for cursors leased next
+        return
+
+    def __str__(self) -> str:
+        return str(self.metrics)
+
+    @classmethod
+    def is_read(cls, sql: str) -> bool:
+        """
+        Returns True for statements that can run on a read-only connection: queries, explain and pragma reads.
+        """
+        _words: list[str] = sql.lstrip().split(None, 1)
+        if not _words:
+            return False
+        _verb: str = _words[0].lower()
+        if _verb == "pragma":
+            return "=" not in sql
+        if _verb == "with":
+            return cls._WRITE_WORDS.search(sql) is None
+        return _verb in cls._READ_VERBS
+
+    def _connect(self) -> _sql.Connection:
+        _connection = _sql.connect(self._path, check_same_thread=False, uri=self._path.startswith("file:"))
+        _connection.execute("pragma query_only = 1")
+        return _connection
+
+    def _checkout(self) -> _sql.Connection:
+        _start: float = perf_counter()
+        _connection: Optional[_sql.Connection] = None
+        try:
+            _connection = self._idle.get_nowait()
+        except Empty:
+            with self._lock:
+                if self.metrics.size < self.metrics.capacity:
+                    self.metrics.size += 1
+                    try:
+                        _connection = self._connect()
+                    except _sql.Error:
+                        self.metrics.size -= 1  # NOTE ------------------------ gives the capacity back for a retry
+                        raise
+            if _connection is None:
+                with self._lock:
+                    self.metrics.waits += 1
+                try:
+                    _connection = self._idle.get(timeout=self._timeout)
+                except Empty:
+                    with self._lock:
+                        self.metrics.timeouts += 1
+                    raise _sql.OperationalError(f"No pooled connection became free in {self._timeout} seconds, "
+                                                f"all {self.metrics.capacity} are leased.") from None
+        _elapsed: float = perf_counter() - _start
+        with self._lock:
+            self.metrics.in_use += 1
+            self.metrics.checkouts += 1
+            self.metrics.checkout_time += _elapsed
+            self.metrics.max_checkout = max(self.metrics.max_checkout, _elapsed)
+        return _connection
+
+    def _give_back(self, connection: _sql.Connection) -> NoReturn:
+        with self._lock:
+            self.metrics.in_use -= 1
+        if self._closed:
+            connection.close()
+            return
+        self._idle.put_nowait(connection)
+        return
+
+    def reader(self) -> _sql.Cursor:
+        """
+        Returns a new read cursor of the calling thread, leasing a connection on the thread's first read. The cursor
+        of the thread's previous read is closed, so that a query whose rows were not all read ends here and does
+        not hold its shared lock for the life of the thread.
+        """
+        _lease: Optional[_Lease] = getattr(self._local, "lease", None)
+        if _lease is None:
+            _lease = self._local.lease = _Lease(self, self._checkout())
+        else:
+            _lease.cursor.close()
+            _lease.cursor = _lease.connection.cursor(self.cursor_factory)
+        self._local.last = _lease.cursor
+        return _lease.cursor
+
+    def connection(self) -> _sql.Connection:
+        """
+        Returns the read connection of the calling thread, for cursors of its own, leasing one on the thread's
+        first read. The cursor of reader() is left as it is.
+        """
+        _lease: Optional[_Lease] = getattr(self._local, "lease", None)
+        if _lease is None:
+            _lease = self._local.lease = _Lease(self, self._checkout())
+        return _lease.connection
+
+    @contextmanager
+    def writer(self) -> Iterator[_sql.Cursor]:
+        """
+        Context manager that holds the write lock and yields the calling thread's cursor on the writer connection.
+        """
+        with self._write_lock:
+            _cursor: Optional[_sql.Cursor] = getattr(self._local, "write_cursor", None)
+            if _cursor is None:
+                _cursor = self._local.write_cursor = self._writer.cursor(self.cursor_factory)
+            self._local.last = _cursor
+            yield _cursor
+
+    @property
+    def write_lock(self) -> RLock:
+        return self._write_lock
+
+    @property
+    def last_cursor(self) -> Optional[_sql.Cursor]:
+        """
+        Returns the cursor that executed the calling thread's last statement.
+        """
+        return getattr(self._local, "last", None)
+
+    def release(self) -> NoReturn:
+        """
+        Gives the calling thread's read connection back to the pool before the thread exits.
+        """
+        _lease: Optional[_Lease] = getattr(self._local, "lease", None)
+        if _lease is not None:
+            del self._local.lease
+            self._local.last = None
+            _lease.__del__()
+        return
+
+    def close(self) -> NoReturn:
+        """
+        Closes all idle connections, connections still leased are closed when their threads give them back.
+        """
+        self._closed = True
+        self.release()
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                break
+        return
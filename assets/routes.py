@@ -0,0 +1,69 @@
+"""
+Statements of the persisted route table: table Route holds the haversine arc in degrees, the kilometers and the whole
+flight minutes of every ordered pair of airports, as Coordinates.haversine_arc(), haversine_distance() and duration()
+compute them, so that reports and joins read distances without any Python math. Triggers on Airport refresh the
+routes of an airport row by row when it is inserted, moved or deleted. Views RouteView and ScheduleRoute join the
+routes with IATA codes and schedules.
+
+The statements use the SQL math functions of SQLite 3.35 or newer, Database registers MATH_FUNCTIONS on its
+connection when the library is built without them. Used by Database.install_routes() and the other route methods.
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "ROUTE_TABLES", "ROUTE_TRIGGERS", "ROUTE_VIEWS", "ROUTE_SELECT", "MATH_FUNCTIONS"
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+from math import asin, cos, degrees, radians, sin, sqrt
+from typing import Callable
+
+from assets.constants import EARTH_EQUATORIAL_RADIUS, LAND_SPEED
+
+MATH_FUNCTIONS: dict[str, tuple[int, Callable]] = {  # NOTE ------------------------ name: number of arguments, function
+    "sin": (1, sin), "cos": (1, cos), "asin": (1, asin), "sqrt": (1, sqrt), "radians": (1, radians),
+    "degrees": (1, degrees), "power": (2, pow)}
+
+_THETA: str = ("2 * asin(min(1, sqrt(power(sin(radians(B.lat - A.lat) / 2), 2) + cos(radians(A.lat)) * "
+               "cos(radians(B.lat)) * power(sin(radians(B.long - A.long) / 2), 2))))")
+
+ROUTE_TABLES: dict[str, str] = {
+    "Route": "create table if not exists Route (origin integer not null, destination integer not null, "
+             "arc real not null, km real not null, minutes integer not null, primary key (origin, destination)) "
+             "without rowid",
+    "_route_destination": "create index if not exists _route_destination on Route (destination)"}
+
+ROUTE_SELECT: str = (  # NOTE ------------ earth_radius() of the average latitude, minutes truncated as in duration()
+    f"select origin, destination, degrees(theta), theta * radius, "
+    f"cast(degrees(theta) * 3600 / {LAND_SPEED} as integer) from (select A.id as origin, B.id as destination, "
+    f"{_THETA} as theta, {EARTH_EQUATORIAL_RADIUS} - 21.3 * (A.lat + B.lat) / 180 as radius "
+    f"from Airport as A join Airport as B on A.id != B.id")
+
+
+def _routes_of(reference: str) -> str:
+    return (f"insert into Route {ROUTE_SELECT} where A.id = {reference}.id); "
+            f"insert into Route {ROUTE_SELECT} where B.id = {reference}.id);")
+
+
+_DELETE: str = "delete from Route where origin = old.id; delete from Route where destination = old.id;"
+
+ROUTE_TRIGGERS: dict[str, str] = {
+    "_route_airport_insert": f"create trigger if not exists _route_airport_insert after insert on Airport begin "
+                             f"{_routes_of('new')} end",
+    "_route_airport_update": f"create trigger if not exists _route_airport_update after update of id, lat, long "
+                             f"on Airport begin {_DELETE} {_routes_of('new')} end",
+    "_route_airport_delete": f"create trigger if not exists _route_airport_delete after delete on Airport begin "
+                             f"{_DELETE} end"}
+
+_DURATION: str = ("case when minutes >= 60 then (minutes / 60) || ' hours, ' || (minutes % 60) || ' minutes' "
+                  "else minutes || ' minutes' end")  # NOTE ------------------------ same text as Coordinates.duration()
+
+ROUTE_VIEWS: dict[str, str] = {
+    "RouteView": f"create view if not exists RouteView as select A.IATA as origin, B.IATA as destination, arc, km, "
+                 f"minutes, {_DURATION} as duration from Route join Airport as A on A.id = Route.origin "
+                 f"join Airport as B on B.id = Route.destination",
+    "ScheduleRoute": f"create view if not exists ScheduleRoute as select Schedule.code, A.IATA as from_airport, "
+                     f"B.IATA as to_airport, arc, km, minutes, {_DURATION} as duration from Schedule "
+                     f"join Route on Route.origin = Schedule.from_airport and Route.destination = Schedule.to_airport "
+                     f"join Airport as A on A.id = Schedule.from_airport "
+                     f"join Airport as B on B.id = Schedule.to_airport"}
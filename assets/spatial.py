@@ -0,0 +1,152 @@
+"""
+Spatial index over the points of a CoordinateArray, for nearest neighbour and bounding box queries without a scan of
+every point: a k-d tree over the unit vectors of the points on the sphere answers the k nearest points, since the
+chord between two unit vectors grows with their arc, and the points sorted by latitude answer Rectangle range queries
+with a binary search of the latitude band. Pure Python, built in O(n log² n) time.
+
+Backs Coordinates.nearest(), Rectangle.search() and Database.spatial_index(), which keeps one index of the airports.
+
+*Created on 18 Oct 2026.*
+"""
+
+__all__: tuple[str] = "SpatialIndex",
+__author__ = "A. Tsakiridis"
+__version__ = "1.0"
+
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import heappush, heappushpop
+from math import asin, cos, degrees, radians, sin, sqrt
+from typing import NoReturn, Union
+
+from assets.models import CoordinateArray, Coordinates, Rectangle
+
+_Point = Union[Coordinates, tuple[float, float]]
+
+
+def _vector(lat: float, long: float) -> tuple[float, float, float]:
+    _lat, _long = radians(lat), radians(long)
+    return cos(_lat) * cos(_long), cos(_lat) * sin(_long), sin(_lat)
+
+
+class SpatialIndex:
+
+    __slots__: tuple[str] = ("points", "leaf", "_vectors", "_order", "_axis", "_split", "_children",
+                             "_by_lat", "_lats")
+
+    def __init__(self, points: CoordinateArray, leaf: int = 16) -> NoReturn:
+        """
+        Builds the k-d tree and the latitude order of the points, which must not change afterward. Leaves hold up
+        to ``leaf`` points, scanned one by one.
+
+        ``SpatialIndex(database.airport_locations()).nearest(Coordinates(37.9, 23.7), 3)``
+        :raises AttributeError: for invalid leaf size
+
+        *Created on 18 Oct 2026.*
+        """
+        if leaf < 1:
+            raise AttributeError(f"Leaf size must be a positive number, {leaf} is not valid.")
+        self.points: CoordinateArray = points
+        self.leaf: int = leaf
+        self._vectors: list[tuple[float, float, float]] = [_vector(_lat, _long)
+                                                           for _lat, _long in zip(points.lat, points.long)]
+        self._order: list[int] = list(range(len(points)))  # NOTE ------------ point positions, grouped by tree node
+        self._axis: list[int] = []  # NOTE ------------------------------------------------- -1 marks a leaf node
+        self._split: list[float] = []
+        self._children: list[tuple[int, int]] = []  # NOTE ------------ child nodes, or the _order range of a leaf
+        if len(points):
+            self._build(0, len(points))
+        self._by_lat: list[int] = sorted(range(len(points)), key=points.lat.__getitem__)
+        self._lats: list[float] = [points.lat[_position] for _position in self._by_lat]
+        return
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __str__(self) -> str:
+        return f"Spatial index of {len(self)} points, {self._axis.count(-1)} leaves of up to {self.leaf} points"
+
+    def _build(self, start: int, end: int) -> int:
+        """
+        Protected method that builds the node of the points in _order[start:end] and returns its number: the points
+        are split at the median of the axis where they spread the most.
+        """
+        _node: int = len(self._axis)
+        self._axis.append(-1)
+        self._split.append(0.0)
+        self._children.append((start, end))
+        if end - start <= self.leaf:
+            return _node
+        _segment: list[int] = self._order[start:end]
+        _spreads: list[float] = []
+        for _axis in range(3):
+            _values: list[float] = [self._vectors[_position][_axis] for _position in _segment]
+            _spreads.append(max(_values) - min(_values))
+        _axis: int = _spreads.index(max(_spreads))
+        if _spreads[_axis] == 0:  # NOTE -------------------------------------------- all points equal, keep a leaf
+            return _node
+        _segment.sort(key=lambda position: self._vectors[position][_axis])
+        self._order[start:end] = _segment
+        _middle: int = start + len(_segment) // 2
+        self._axis[_node] = _axis
+        self._split[_node] = self._vectors[self._order[_middle]][_axis]
+        self._children[_node] = self._build(start, _middle), self._build(_middle, end)
+        return _node
+
+    @staticmethod
+    def _lat_long(point: _Point) -> tuple[float, float]:
+        return (float(point.lat), float(point.long)) if isinstance(point, Coordinates) else \
+            (float(point[0]), float(point[1]))
+
+    def nearest(self, point: _Point, k: int = 1) -> list[tuple[int, float]]:
+        """
+        Returns the positions of the ``k`` points nearest to a point and their haversine arcs in degrees, nearest
+        first. Only the tree nodes closer than the k-th point found so far are visited.
+        :return: list
+        :raises AttributeError: for invalid k
+        """
+        if k < 1:
+            raise AttributeError(f"Number of points must be a positive number, {k} is not valid.")
+        _x, _y, _z = _target = _vector(*self._lat_long(point))
+        _heap: list[tuple[float, int]] = []  # NOTE ----------------- negative squared chords, the k-th one on top
+        _stack: list[tuple[int, float]] = [(0, 0.0)] if len(self) else []  # NOTE ------- nodes and squared gaps
+        while _stack:
+            _node, _bound = _stack.pop()
+            if len(_heap) == k and _bound >= -_heap[0][0]:
+                continue
+            _axis: int = self._axis[_node]
+            if _axis < 0:
+                _start, _end = self._children[_node]
+                for _position in self._order[_start:_end]:
+                    _a, _b, _c = self._vectors[_position]
+                    _chord: float = (_a - _x) ** 2 + (_b - _y) ** 2 + (_c - _z) ** 2
+                    if len(_heap) < k:
+                        heappush(_heap, (-_chord, _position))
+                    elif _chord < -_heap[0][0]:
+                        heappushpop(_heap, (-_chord, _position))
+                continue
+            _gap: float = _target[_axis] - self._split[_node]
+            _near, _far = self._children[_node] if _gap < 0 else reversed(self._children[_node])
+            _stack.append((_far, _gap * _gap))  # NOTE --------- checked when popped, after the near side shrank it
+            _stack.append((_near, _bound))
+        return [(_position, degrees(2 * asin(min(1.0, sqrt(-_chord) / 2))))
+                for _chord, _position in sorted(_heap, reverse=True)]
+
+    def within(self, rectangle: Rectangle) -> list[int]:
+        """
+        Returns the positions of the points inside a Rectangle, borders included, in latitude order: a binary
+        search of the latitude band, then a longitude check of the points in it.
+        :return: list
+        """
+        (_min_lat, _max_lat), (_min_long, _max_long) = rectangle.lat, rectangle.long
+        _long: array = self.points.long
+        return [_position for _position in self._by_lat[bisect_left(self._lats, _min_lat):
+                                                        bisect_right(self._lats, _max_lat)]
+                if _min_long <= _long[_position] <= _max_long]
+
+    def select(self, positions: list[int]) -> CoordinateArray:
+        """
+        Returns the points at the positions, as returned by nearest() and within(), as a new CoordinateArray.
+        """
+        return CoordinateArray.from_rows(((self.points.lat[_position], self.points.long[_position],
+                                           self.points.labels[_position]) for _position in positions), False)
@@ -3,6 +3,7 @@ import csv
 from assets import database
 
 file = csv.reader(open("airplanes.csv"), delimiter=';')
+next(file)  # NOTE ------------------------------------------------------------------------------------- skip headers
 
 airline_dict: dict[str, int] = {}
 for airline in database(f"select * from Airline").fetchall():
@@ -10,9 +11,6 @@ for airline in database(f"select * from Airline").fetchall():
 
 print(airline_dict)
 
-for index, data in enumerate(file):
-    if index == 0: continue
-    print(index, data)
-    airline_id: int = airline_dict[data[2]]
-    print(airline_id)
-    database(f"insert into Airplane (type, airline) values ('{data[1]}', {airline_id})")
+count = database.insert_many("Airplane", ((data[1], airline_dict[data[2]]) for data in file),
+                             columns=("type", "airline"))
+print(count, "AIRPLANES INSERTED")
@@ -0,0 +1,47 @@
+"""
+Times the gate allocator on days of tens of thousands of random flights, on an airport scaled up to GATES gates per
+hall, and checks that no gate is held by two flights less than the turnaround buffer apart. Then allocates the gates
+of the stored flights again, on a temporary copy of the database, and prints the utilization report.
+
+*Created on 18 Oct 2026.*
+"""
+
+from datetime import datetime, timedelta
+from random import random, randint, seed
+from shutil import copyfile, rmtree
+from tempfile import mkdtemp
+from time import perf_counter
+
+from assets.constants import DATABASE
+from assets.database import Database
+from assets.gates import GateAllocator
+from assets.models import Gate
+
+SIZES: tuple[int, ...] = 10_000, 20_000, 40_000
+GATES: int = 600
+DAY: datetime = datetime(2024, 2, 1)
+
+seed(18)
+for size in SIZES:
+    requests: list[tuple[int, datetime, bool, bool]] = [
+        (_n, DAY + timedelta(minutes=randint(0, 24 * 60 - 1)), random() < 0.5, random() < 0.7) for _n in range(size)]
+    allocator = GateAllocator(Gate(_number, _hall) for _hall in "ABC" for _number in range(1, GATES + 1))
+    start: float = perf_counter()
+    gates: dict = allocator.allocate(requests)
+    seconds: float = perf_counter() - start
+    held: dict[str, list[tuple[int, int]]] = {}
+    for _key, _moment, _departure, _schengen in requests:
+        if gates[_key] is not None:
+            held.setdefault(str(gates[_key]), []).append(allocator.interval(_moment, _departure))
+    conflicts: int = sum(_b[0] < _a[1] + allocator.buffer for _intervals in held.values()
+                         for _a, _b in zip(sorted(_intervals), sorted(_intervals)[1:]))
+    print(f"{size} FLIGHTS IN {seconds * 1000:.1f} ms ({size / seconds:.0f} FLIGHTS/S), {allocator.unassigned} "
+          f"WITHOUT GATE, {conflicts} CONFLICTS")
+print(allocator.report())
+
+directory: str = mkdtemp()
+copyfile(DATABASE, directory + "/airport.sqlite")
+database: Database = Database(directory + "/airport.sqlite", "BENCHMARK")
+print(database.allocate_gates().report())
+del database
+rmtree(directory, ignore_errors=True)
@@ -0,0 +1,57 @@
+"""
+Compares the ways of turning database rows into model objects: ``Model.db(row)`` on each fetched row, the compiled
+hydrator calling the model constructor and the trusted compiled hydrator assigning slots directly. Rows of each table
+are repeated in memory up to ROWS, then a whole Flight scan is hydrated through the cursor row factory.
+Objects of every path are compared through the text of their ``tuple`` property.
+
+*Created on 18 Oct 2026.*
+"""
+
+from statistics import median
+from time import perf_counter
+from typing import Callable
+
+from assets import database
+from assets.models import Airport, Employee, Flight, Schedule
+
+ROWS: int = 100_000
+REPEAT: int = 5
+
+
+def timed(function: Callable[[], list]) -> tuple[float, list]:
+    _timings: list[float] = []
+    _objects: list = []
+    for _ in range(REPEAT):
+        _start: float = perf_counter()
+        _objects = function()
+        _timings.append(perf_counter() - _start)
+    return median(_timings), _objects
+
+
+def state(record) -> tuple[str]:
+    return tuple(str(_value) for _value in record.tuple)  # NOTE ------------------ Coordinates compare by identity
+
+
+models: list[type] = [Airport, Schedule, Flight] + ([Employee] if Employee.load_files() >= 0 else [])
+print("=" * 8 + " MODEL " + "=" * 8 + " DB() " + "=" * 6 + " CONSTRUCTOR " + "=" * 3 + " TRUSTED " + "=" * 3
+      + " SPEEDUP " + "=" * 2 + " SAME")
+for model in models:
+    columns: int = len(model.__slots__) if model is Flight else len(database.table_info(model.__name__))
+    table: list[tuple] = database(f"select * from {model.__name__}").fetchall()
+    rows: list[tuple] = (table * (ROWS // len(table) + 1))[:ROWS]
+    constructor = database.hydrator(model, trusted=False)
+    trusted = database.hydrator(model)
+    db_seconds, db_objects = timed(lambda: [model.db(row[:columns]) for row in rows])  # NOTE -- Flight has 14 columns
+    constructor_seconds, constructor_objects = timed(lambda: [constructor.function(None, row) for row in rows])
+    trusted_seconds, trusted_objects = timed(lambda: [trusted.function(None, row) for row in rows])
+    same: bool = [state(_o) for _o in db_objects] == [state(_o) for _o in constructor_objects] == \
+                 [state(_o) for _o in trusted_objects]
+    print(" " * 8 + model.__name__ + " " * (14 - len(model.__name__)) + f"{db_seconds * 1000:8.1f} ms"
+          f"{constructor_seconds * 1000:12.1f} ms{trusted_seconds * 1000:9.1f} ms"
+          f"{db_seconds / trusted_seconds:10.1f}x     {same}")
+
+scan: str = "select * from Flight"
+db_seconds, _ = timed(lambda: [Flight.db(row[:11]) for row in database(scan).fetchall()])
+trusted_seconds, _ = timed(lambda: list(database.stream_records(Flight, scan, trusted=True)))
+print(f"FLIGHT SCAN: {db_seconds * 1000:.1f} ms WITH DB(), {trusted_seconds * 1000:.1f} ms THROUGH THE ROW FACTORY")
+print(database.hydrator(Schedule))
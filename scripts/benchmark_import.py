@@ -0,0 +1,31 @@
+"""
+Measures the start-up cost of the assets package in fresh interpreters: a bare interpreter, ``import assets``, which
+must not touch the database, and first use of the database singleton.
+
+*Created on 18 Oct 2026.*
+"""
+
+from statistics import median
+from subprocess import run
+from sys import executable
+from time import perf_counter
+
+from assets.constants import PROJECT
+
+RUNS: int = 15
+CASES: dict[str, str] = {"bare interpreter": "pass",
+                         "import assets": "import assets",
+                         "import assets.database": "import assets.database",
+                         "first database query": "from assets import database; database.tables"}
+
+print("=" * 8 + " CASE " + "=" * 20 + " MEDIAN " + "=" * 4 + " MIN " + "=" * 7 + " ABOVE BARE")
+bare: float = 0.0
+for case, code in CASES.items():
+    timings: list[float] = []
+    for _ in range(RUNS):
+        start: float = perf_counter()
+        run([executable, "-c", code], cwd=PROJECT, check=True, capture_output=True)
+        timings.append(perf_counter() - start)
+    bare = bare or median(timings)
+    print(" " * 8 + case + " " * (34 - len(case)) + f"{median(timings) * 1000:8.2f} ms {min(timings) * 1000:8.2f} ms"
+          f"{(median(timings) - bare) * 1000:10.2f} ms")
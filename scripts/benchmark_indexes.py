@@ -0,0 +1,70 @@
+"""
+Measures the managed index set on a temporary copy of the database, grown with a year of generated flights: captures
+the workload through the index advisor, prints the plan changes it proposes, installs the proposed indexes and times
+every statement again. Indexes are proposed only if no statement using them gets slower on an in-memory copy of the
+data. Results are compared to make sure the indexes change nothing but speed.
+
+*Created on 18 Oct 2026.*
+"""
+
+from datetime import date, timedelta
+from shutil import copyfile, rmtree
+from statistics import median
+from tempfile import mkdtemp
+from time import perf_counter
+
+from assets.constants import DATABASE, PROJECT
+from assets.database import Database
+
+REPEAT: int = 7
+START: date = date.today()
+with open(PROJECT + "/scripts/lab_prep.sql") as file:
+    LAB_PREP: list[str] = [statement.strip() for statement in file.read().split(";") if statement.strip()]
+WORKLOAD: dict[str, tuple[str, tuple]] = {
+    "Departure view": ("select * from Departure", ()),
+    "Arrival view": ("select * from Arrival", ()),
+    "departures of a day": ("select * from Departure where departure between ? and ?",
+                            (str(START + timedelta(days=1)), str(START + timedelta(days=2)))),
+    "terminals": ("select gate_t as terminal from Flight group by gate_t", ()),
+    "flights of a code": ("select * from Flight where code = ?", ("A3600",)),
+    "departures": ("select * from Flight where departure is not null", ()),
+    "lab_prep month": (LAB_PREP[0], ()),
+    "lab_prep from airport": (LAB_PREP[1], ()),
+    "lab_prep per destination": (LAB_PREP[2], ())}  # NOTE -------- bare column Flight.code, rows may differ in code
+
+
+def run(db: Database) -> dict[str, tuple[float, list]]:
+    _out: dict[str, tuple[float, list]] = {}
+    for _name, (_sql, _parameters) in WORKLOAD.items():
+        _timings: list[float] = []
+        for _ in range(REPEAT):
+            _start: float = perf_counter()
+            _rows: list = db(_sql, _parameters).fetchall()
+            _timings.append(perf_counter() - _start)
+        _out[_name] = median(_timings), sorted(_rows, key=repr)
+    return _out
+
+
+directory: str = mkdtemp()
+copyfile(DATABASE, directory + "/airport.sqlite")
+database: Database = Database(directory + "/airport.sqlite", "BENCHMARK")
+print(database.generate_flights(START, START + timedelta(days=365)))
+database.states_init()
+database("analyze")  # NOTE ------------------------------ statistics for both runs, as install_indexes() refreshes them
+print(database("select count() from Flight").fetchone()[0], "FLIGHTS IN THE COPY")
+
+advisor = database.advise_indexes()
+before: dict[str, tuple[float, list]] = run(database)
+advice = advisor.advise(measure=True, repeat=REPEAT)
+print(advice)
+print("CREATED:", ", ".join(database.install_indexes(advice.proposed)))
+after: dict[str, tuple[float, list]] = run(database)
+
+print("=" * 8 + " STATEMENT " + "=" * 17 + " BEFORE " + "=" * 6 + " AFTER " + "=" * 4 + " SPEEDUP " + "=" * 2 + " SAME")
+for name in WORKLOAD:
+    print(" " * 8 + name + " " * (30 - len(name)) + f"{before[name][0] * 1000:9.3f} ms {after[name][0] * 1000:9.3f} ms"
+          f"{before[name][0] / after[name][0]:9.1f}x   {before[name][1] == after[name][1]}")
+print("FULL SCANS AND TEMP B-TREES:", advice.scans)
+
+del database, advisor
+rmtree(directory, ignore_errors=True)
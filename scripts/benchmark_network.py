@@ -0,0 +1,56 @@
+"""
+Times the route network over a year of flights: the flights of the database repeated every 13 weeks, so that
+weekdays are kept, for four quarters. Earliest arrival queries through Athens are checked against the pairs of a hub
+table of waits up to 8 days, and the fastest connection over a week is timed, the first query building its hub table.
+
+*Created on 18 Oct 2026.*
+"""
+
+from random import choice, randint, seed
+from statistics import median
+from time import perf_counter
+
+from assets import database
+from assets.network import Network, minutes, moment
+
+QUARTERS: int = 4
+QUERIES: int = 1000
+WEEK: int = 7 * 24 * 60
+
+flights: list[tuple] = []
+network: Network = database.network()
+for quarter in range(QUARTERS):
+    _shift: int = quarter * 13 * WEEK
+    flights.extend((network.flight[_c] + quarter * len(network), network.code[_c],
+                    network.airports[network.origin[_c]], network.airports[network.destination[_c]],
+                    network.departure[_c] + _shift, network.arrival[_c] + _shift) for _c in range(len(network)))
+start: float = perf_counter()
+year = Network(flights, network.labels)
+build: float = perf_counter() - start
+start = perf_counter()
+hub = year.hub("ATH", waiting=8 * 24 * 60)  # NOTE ------------ schedules are weekly, to check earliest arrivals against
+hub_seconds: float = perf_counter() - start
+print(year, f"BUILT IN {build * 1000:.1f} ms,", hub, f"BUILT IN {hub_seconds * 1000:.1f} ms")
+
+seed(18)
+inbound: list[str] = sorted({year.labels[year.airports[year.origin[_c]]] for _c in year.inbound("ATH")})
+outbound: list[str] = sorted({year.labels[year.airports[year.destination[_c]]] for _c in year.outbound("ATH")})
+first: int = year.departure[0]
+earliest: list[float] = []
+fastest: list[float] = []
+same: bool = True
+for _ in range(QUERIES):
+    origin: str = choice(inbound)
+    destination: str = choice([_airport for _airport in outbound if _airport != origin])
+    when: int = first + randint(0, year.departure[-1] - first)
+    start = perf_counter()
+    itinerary = year.earliest_arrival(origin, destination, moment(when), via="ATH")
+    earliest.append(perf_counter() - start)
+    best = min((year.arrival[_pair[1]] for _pair in hub.pairs(origin, destination, when)), default=None)
+    same = same and best == (None if itinerary is None else minutes(itinerary.arrival))
+    start = perf_counter()
+    year.fastest(origin, destination, moment(when), moment(when + WEEK), via="ATH")
+    fastest.append(perf_counter() - start)
+print(f"EARLIEST ARRIVAL: {median(earliest) * 1000:.3f} ms MEDIAN, {max(earliest) * 1000:.3f} ms MAX, SAME {same}")
+print(f"FASTEST IN A WEEK: {median(fastest[1:]) * 1000:.3f} ms MEDIAN, {fastest[0] * 1000:.1f} ms FIRST, "
+      f"BUILDING THE HUB TABLE")
@@ -0,0 +1,72 @@
+"""
+Compares the spatial index with brute force at 10k and 100k random points spread evenly on the globe: the k nearest
+points by a haversine scan of every point, with the formula of Coordinates.haversine_arc() on floats since
+Coordinate differences must stay in range, and Rectangle queries by Rectangle.__contains__() on every Coordinates
+object. Brute force runs a few of the queries only, times are per query. Results of both ways are compared.
+
+*Created on 18 Oct 2026.*
+"""
+
+from heapq import nsmallest
+from math import asin, cos, degrees, radians, sin, sqrt
+from random import seed, uniform
+from time import perf_counter
+
+from assets.models import CoordinateArray, Coordinates, Rectangle
+from assets.spatial import SpatialIndex
+
+SIZES: tuple[int, ...] = 10_000, 100_000
+K: int = 5
+QUERIES: int = 500
+BRUTE_QUERIES: int = 10
+
+
+def haversine(lat: float, long: float, other_lat: float, other_long: float) -> float:
+    _temp = sin(radians(other_lat - lat) / 2) ** 2 + \
+        cos(radians(lat)) * cos(radians(other_lat)) * sin(radians(other_long - long) / 2) ** 2
+    return degrees(2 * asin(sqrt(_temp)))
+
+
+seed(18)
+print("=" * 8 + " POINTS " + "=" * 4 + " BUILD " + "=" * 4 + " NEAREST " + "=" * 3 + " BRUTE " + "=" * 3
+      + " SPEEDUP " + "=" * 3 + " RECTANGLE " + "=" * 3 + " BRUTE " + "=" * 3 + " SPEEDUP " + "=" * 2 + " SAME")
+for size in SIZES:
+    points = CoordinateArray([degrees(asin(uniform(-1, 1))) for _ in range(size)],
+                             [uniform(-180, 180) for _ in range(size)], [str(_n) for _n in range(size)])
+    objects: list[Coordinates] = points.coordinates
+    targets: list[Coordinates] = [Coordinates(degrees(asin(uniform(-1, 1))), uniform(-180, 180))
+                                  for _ in range(QUERIES)]
+    rectangles: list[Rectangle] = []
+    for _ in range(QUERIES):
+        lat, long = uniform(-80, 75), uniform(-180, 170)
+        rectangles.append(Rectangle(lat, lat + uniform(1, 5), long, long + uniform(1, 10)))
+
+    start: float = perf_counter()
+    index = SpatialIndex(points)
+    build: float = perf_counter() - start
+
+    start = perf_counter()
+    nearest: list = [index.nearest(target, K) for target in targets]
+    nearest_seconds: float = (perf_counter() - start) / QUERIES
+    start = perf_counter()
+    brute: list = [nsmallest(K, ((haversine(float(target.lat), float(target.long), lat, long), position)
+                                 for position, (lat, long) in enumerate(zip(points.lat, points.long))))
+                   for target in targets[:BRUTE_QUERIES]]
+    brute_seconds: float = (perf_counter() - start) / BRUTE_QUERIES
+    same: bool = all([_p for _p, _ in found] == [_p for _, _p in expected] and
+                     all(abs(_a - _b) < 1e-9 for (_, _a), (_b, _) in zip(found, expected))
+                     for found, expected in zip(nearest, brute))
+
+    start = perf_counter()
+    inside: list = [sorted(index.within(rectangle)) for rectangle in rectangles]
+    rectangle_seconds: float = (perf_counter() - start) / QUERIES
+    start = perf_counter()
+    scanned: list = [[position for position, point in enumerate(objects) if point in rectangle]
+                     for rectangle in rectangles[:BRUTE_QUERIES]]
+    scan_seconds: float = (perf_counter() - start) / BRUTE_QUERIES
+    same = same and inside[:BRUTE_QUERIES] == scanned
+
+    print(" " * 8 + f"{size:<12}{build:6.2f} s{nearest_seconds * 1e6:10.1f} us{brute_seconds * 1000:8.1f} ms"
+          f"{brute_seconds / nearest_seconds:10.0f}x{rectangle_seconds * 1e6:12.1f} us{scan_seconds * 1000:8.1f} ms"
+          f"{scan_seconds / rectangle_seconds:10.0f}x     {same}")
+print(index)
@@ -1,7 +1,5 @@
 from assets import *
 
 
-departures = database("select * from Flight where departure is not null").fetchall()
-
-for result in departures:
+for result in database.stream("select * from Flight where departure is not null"):  # NOTE -------- flat memory
     print(result)
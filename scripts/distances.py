@@ -1,9 +1,9 @@
 from assets import *
 
-print(database.athens, database.athens.local_time, "\n\n",
-      database.athens.headers(), database.athens.measurements_headers(), sep="")
+athens: Airport = database.athens  # NOTE --------------------------------------------------------- fetched only once
+matrix = database.distances()  # NOTE ------------------------------------------ all airport pairs in one NumPy pass
 
-for result in database("select * from Airport where country != 'GREECE' order by long desc").fetchall():
-    airport = Airport.db(result)
-    print(airport, airport.local_time, database.athens.measurements(airport))
+print(athens, athens.local_time, "\n\n", athens.headers(), athens.measurements_headers(), sep="")
 
+for airport in database.stream_records(Airport, "select * from Airport where country != 'GREECE' order by long desc"):
+    print(airport, airport.local_time, matrix.measurements(athens.iata, airport.iata))
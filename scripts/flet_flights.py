@@ -4,17 +4,27 @@ Makes a web page showing operated flights, departures or arrivals, separated by
 *Created on 12 Jan 2024.*
 """
 
+from bisect import bisect_left
 from enum import Enum
 from random import choice
-from typing import NoReturn
+from threading import RLock
+from typing import NoReturn, Optional
 
 import flet
 from flet_core import TextAlign
 
 from assets import *
+from assets.boards import BOARD_TRIGGERS
+from assets.feed import BoardChange
 from assets.models import CycleEnum
 
 
+database.enable_pool(8)  # NOTE ------------------------ each browser session reads through its own pooled connection
+if len(database.board_triggers) < len(BOARD_TRIGGERS):  # NOTE -------------- filled once, then kept current by triggers
+    database.install_boards()
+feed = database.change_feed()  # NOTE ------------------ one poller for all sessions, each session subscribes while open
+
+
 class Category(Enum):
     DEPARTURE, ARRIVAL = "Departure", "Arrival"
 
@@ -32,16 +42,36 @@ class FlightCategories(dict):
             _key = category + terminal
             _airport_column = "destination" if category == Category.DEPARTURE.value else "starting_point"
             _date_column = "departure" if category == Category.DEPARTURE.value else "arrival"
-            self[_key] = database(f"select code, airline, {_airport_column}, {_date_column}, state, check_in, gate "
-                                  f"from {category} where terminal = '{terminal}' order by {category.lower()} limit 100"
-                                  ).fetchall()  # NOTE ------ could not avoid f-string here
+            _page = (database.departures if category == Category.DEPARTURE.value else database.arrivals)(
+                terminal, limit=100)
+            self[_key] = dict(zip(_page.flights, _page.rows))  # NOTE ------------------------- flight id: board row
             if not hasattr(self, category):
                 self.__setattr__(category, ["code", "airline", _airport_column, _date_column,
                                             "state", "check_in", "gate"])
         return
 
+    def apply(self, changes: list[BoardChange]) -> NoReturn:
+        """
+        Patches the cached boards with the rows of a change feed batch, keeping them ordered by (time, flight id).
+        Runs on the feed thread while sessions read the boards, so a board is never mutated: the patch is made on a
+        copy, which then replaces it in one assignment.
+        """
+        _copies: dict[str, dict] = {}
+        for change in changes:
+            if change.key not in self:
+                continue
+            _board: dict = _copies.setdefault(change.key, dict(self[change.key]))
+            if change.row is None:
+                _board.pop(change.flight, None)
+            else:
+                _board[change.flight] = change.row
+        for _key, _board in _copies.items():
+            self[_key] = dict(sorted(_board.items(), key=lambda item: (item[1][3], item[0]))[:100])
+        return
+
 
 data = FlightCategories()
+feed.subscribe(data.apply)
 
 
 class State:
@@ -49,38 +79,133 @@ class State:
     COLUMNS, DATA = list(), list()
 
 
+class BoardView:
+    """
+    Controls of one board of one session, built once and reused whenever the board is shown again. Rows are built
+    in chunks as the page is scrolled, the first ones from the shared ``data`` and the rest from the database with
+    keyset pages after the last row built. Feed changes patch cells or insert and remove single rows. Changes come on
+    the feed thread and scrolling on the session thread, so both go through the lock of the view.
+    """
+
+    CHUNK: int = 30
+    COLORS: tuple[str] = "blue", "yellow", "orange", "blue", "white", "yellow", "yellow"
+
+    __slots__ = "category", "terminal", "table", "keys", "rows", "cursor", "complete", "lock"
+
+    def __init__(self, category: Category, terminal: str) -> NoReturn:
+        self.category: Category = category
+        self.terminal: str = terminal
+        self.table = flet.DataTable(columns=[flet.DataColumn(flet.Text(value=column.upper(), size=20))
+                                             for column in getattr(data, category.value)],
+                                    rows=[], width=1900, horizontal_lines=flet.border.BorderSide(1.5, "yellow"))
+        self.keys: list[tuple[str, int]] = list()  # NOTE ------------------- (time, flight id) of rows built, in order
+        self.rows: dict[int, flet.DataRow] = dict()
+        self.cursor: Optional[tuple[str, int]] = None
+        self.complete: bool = False
+        self.lock: RLock = RLock()
+        self.more()
+        return
+
+    def build(self, row: tuple) -> flet.DataRow:
+        return flet.DataRow(cells=[flet.DataCell(flet.Text(value=str(column), color=color))
+                                   for column, color in zip(row, self.COLORS)])
+
+    def more(self) -> bool:
+        """
+        Builds the next chunk of rows, returns False when the board has no more.
+        """
+        with self.lock:
+            if self.complete:
+                return False
+            _cached = [(flight, row) for flight, row in data[self.category.value + self.terminal].items()
+                       if self.cursor is None or (row[3], flight) > self.cursor][:self.CHUNK]
+            if len(_cached) < self.CHUNK:  # NOTE ------------------------- past the shared rows, read a keyset page
+                _page = (database.departures if self.category == Category.DEPARTURE else database.arrivals)(
+                    self.terminal, limit=self.CHUNK, after=self.cursor)
+                _cached = list(zip(_page.flights, _page.rows))
+                self.complete = _page.next is None
+            for flight, row in _cached:
+                self.rows[flight] = self.build(row)
+                self.keys.append((row[3], flight))
+                self.table.rows.append(self.rows[flight])
+            if _cached:
+                self.cursor = self.keys[-1]
+            return bool(_cached)
+
+    def remove(self, flight: int) -> NoReturn:
+        with self.lock:
+            _index = next(index for index, key in enumerate(self.keys) if key[1] == flight)
+            del self.keys[_index], self.table.rows[_index], self.rows[flight]
+            return
+
+    def patch(self, change: BoardChange) -> NoReturn:
+        """
+        Applies one feed change: cells of a row that kept its time are edited, other rows are removed and
+        inserted at their place if it is among the rows built, later ones come with the next chunks. Once the board
+        is complete there are no more chunks, so later rows are appended and move the cursor.
+        """
+        with self.lock:
+            if change.flight in self.rows:
+                if change.row is not None and self.rows[change.flight].cells[3].content.value == str(change.row[3]):
+                    for cell, column in zip(self.rows[change.flight].cells, change.row):
+                        cell.content.value = str(column)
+                    return
+                self.remove(change.flight)
+            if change.row is None or (not self.complete and (self.cursor is None or
+                                                             (change.row[3], change.flight) > self.cursor)):
+                return
+            _index = bisect_left(self.keys, (change.row[3], change.flight))
+            self.rows[change.flight] = self.build(change.row)
+            self.keys.insert(_index, (change.row[3], change.flight))
+            self.table.rows.insert(_index, self.rows[change.flight])
+            self.cursor = self.keys[-1]
+            return
+
+
 def departures(page: flet.Page):
-    # top: Optional[flet.Row] = flet.Row()
-    # table: Optional[flet.DataTable] = flet.DataTable()
+    views: dict[str, BoardView] = dict()  # NOTE ------------------------ boards of this session, built on first show
+
+    def view() -> BoardView:
+        _key = State.CATEGORY.value + State.TERMINAL.value
+        if _key not in views:
+            views[_key] = BoardView(State.CATEGORY, State.TERMINAL.value)
+        return views[_key]
+
+    title = flet.Text(color="yellow", size=40, width=1550, text_align=TextAlign.CENTER)
+
+    def on_changes(changes: list[BoardChange]):
+        """
+        Feed subscriber of this session, patches the boards it built with the rows of the change feed, nothing is
+        queried. Only the board on screen is sent to the browser.
+        """
+        for change in changes:
+            if change.key in views:
+                views[change.key].patch(change)
+        if any(change.key == State.CATEGORY.value + State.TERMINAL.value for change in changes) and \
+                view().table in page.controls:  # NOTE ------------------------------------------ not shown after Escape
+            with view().lock:
+                view().table.update()
+
+    def on_scroll(e: flet.OnScrollEvent):
+        with view().lock:
+            if e.pixels >= e.max_scroll_extent - 200 and view().more():
+                view().table.update()
 
     def set_state():
-        title = flet.Text(value=f"TERMINAL {State.TERMINAL.value} {(State.CATEGORY.value + 's').upper()}",
-                          color="yellow", size=40, width=1550, text_align=TextAlign.CENTER)
-        category = flet.ElevatedButton(text=State.CATEGORY.value, on_click=change_category, width=150, color="yellow")
-        terminal = flet.ElevatedButton(text=State.TERMINAL.value, on_click=change_terminal, width=150, color="yellow")
-
-        top = flet.Row(controls=[title, category, terminal])
+        title.value = f"TERMINAL {State.TERMINAL.value} {(State.CATEGORY.value + 's').upper()}"
+        category.text, terminal.text = State.CATEGORY.value, State.TERMINAL.value
 
         State.COLUMNS = getattr(data, State.CATEGORY.value)
-        State.DATA = data[State.CATEGORY.value + State.TERMINAL.value]
-
-        table_columns = [flet.DataColumn(flet.Text(value=column.upper(), size=20)) for column in State.COLUMNS]
-        table_rows = list()
-        for row in State.DATA:
-            table_rows.append(flet.DataRow(cells=[flet.DataCell(flet.Text(value=str(column))) for column in row]))
-            for index, color in enumerate(["blue", "yellow", "orange", "blue", "white", "yellow", "yellow"]):
-                table_rows[-1].cells[index].content.color = color
-
-        table = flet.DataTable(columns=table_columns, rows=table_rows, width=1900,
-                               horizontal_lines=flet.border.BorderSide(1.5, "yellow"))
-        page.clean()
-        page.add(top, table)
+        State.DATA = list(data[State.CATEGORY.value + State.TERMINAL.value].values())
+
+        page.controls[:] = [header, view().table]  # NOTE ----- also after Escape, cached board rows are not built again
         page.update()
 
     def keyboard(e: flet.KeyboardEvent):
         if e.key == "Escape":
             page.clean()
         elif e.key == "R":
+            views.pop(State.CATEGORY.value + State.TERMINAL.value, None)
             set_state()
         elif e.key == "C":
             change_category(e)
@@ -95,9 +220,16 @@ def departures(page: flet.Page):
         State.TERMINAL = State.TERMINAL.next()
         set_state()
 
+    category = flet.ElevatedButton(on_click=change_category, width=150, color="yellow")
+    terminal = flet.ElevatedButton(on_click=change_terminal, width=150, color="yellow")
+
+    feed.subscribe(on_changes)
+    page.on_close = lambda e: feed.unsubscribe(on_changes)  # NOTE ------------------ closed sessions receive no changes
+    header = flet.Row(controls=[title, category, terminal])
     set_state()
     page.on_keyboard_event = keyboard
     page.scroll = flet.ScrollMode.ALWAYS
+    page.on_scroll = on_scroll
     page.update()
     return
 
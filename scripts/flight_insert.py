@@ -5,6 +5,5 @@ flight_codes = [element[0] for element in database("select code from Schedule wh
                                                    (0,)).fetchall()]
 # print(len(flight_codes))
 
-for flight_code in flight_codes:
-    print(flight_code)
-    # database.generate_scheduled_flights(flight_code)
+print(flight_codes)
+# print(database.generate_flights(codes=flight_codes))  # NOTE -------------- all schedules in one pass, safe to rerun